@@ -0,0 +1 @@
+"""성능 벤치마크 모듈"""
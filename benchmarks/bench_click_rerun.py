@@ -0,0 +1,173 @@
+"""
+그래프 클릭 한 번의 재실행 시간 측정.
+
+대시보드를 실제 Streamlit 서버로 띄우고 브라우저와 같은 웹소켓 프로토콜로 세션 하나를 연 뒤,
+스킬 그래프 막대를 클릭할 때 브라우저가 보내는 선택 상태를 그대로 보내 다음을 비교합니다.
+
+    - click: 클릭 후 요약 정보, 관련 정보, 스킬 분석 fragment만 다시 실행되어 끝날 때까지의 시간.
+    - full app: 같은 세션에서 클릭 직후 앱 전체를 다시 실행하는 데 걸린 시간.
+      fragment 도입 전에는 클릭마다 앱 전체가 다시 실행되었으므로 클릭 한 번의 이전 비용에 해당합니다.
+
+각각 재실행 요청을 보낸 뒤 서버가 실행 종료(script_finished)를 알릴 때까지의 시간(wall)과,
+서버의 DASHBOARD_PROFILE 기록에서 읽은 스크립트 실행 시간(script, 클릭은 fragment 실행 시간의 합)을 출력합니다.
+wall은 Streamlit의 재실행 처리와 화면 요소 전송 시간을 포함하고 브라우저 렌더링 시간은 포함하지 않습니다.
+관련 정보 fragment의 자동 재실행(run_every) 요청은 보내지 않으며, 외부 API 호출 결과는
+응답 캐시에 남은 값을 사용합니다. 저장소 루트에서 실행합니다:
+
+    python -m benchmarks.bench_click_rerun
+    python -m benchmarks.bench_click_rerun --clicks 50
+"""
+import argparse
+import contextlib
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from websockets.sync.client import connect
+
+from src.dashboard.profiling import PROFILE_ENV, PROFILE_LOG_ENV, read_profile_log
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(REPO_ROOT, "src", "dashboard", "app.py")
+CLICKED_SKILLS = ["PYTHON", "JAVA", "REACT", "AWS", "DOCKER", "SPRING", "JAVASCRIPT", "MYSQL"]
+SKILL_CHART_KEY_PREFIX = "skill_chart_"
+
+
+def free_port():
+    """비어 있는 로컬 포트 번호."""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@contextlib.contextmanager
+def dashboard_session(log_path, timeout):
+    """
+    재실행 기록을 log_path에 남기는 대시보드 서버를 띄우고 세션 하나의 웹소켓 연결을 반환합니다.
+    끝나면 서버를 종료합니다.
+    """
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", APP_PATH, "--server.headless", "true",
+         "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+        cwd=REPO_ROOT, env={**os.environ, PROFILE_ENV: "1", PROFILE_LOG_ENV: log_path},
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                websocket = connect(f"ws://127.0.0.1:{port}/_stcore/stream", subprotocols=["streamlit"], max_size=None)
+                break
+            except OSError:
+                if server.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError("대시보드 서버를 시작하지 못했습니다.")
+                time.sleep(0.2)
+        with websocket:
+            yield websocket
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def rerun(websocket, widgets=(), timeout=120):
+    """
+    재실행을 요청하고 서버가 실행 종료를 알릴 때까지 기다립니다.
+
+    위젯 콜백의 st.rerun(scope)으로 중간에 끝난 실행은 건너뛰고, 이어지는 fragment 실행이 끝날 때까지 기다립니다.
+
+    Returns:
+        (걸린 시간 ms, 이번 실행에서 그린 스킬 그래프의 위젯 ID 또는 None)
+    """
+    message = BackMsg()
+    message.rerun_script.widget_states.widgets.extend(widgets)
+    start = time.perf_counter()
+    websocket.send(message.SerializeToString())
+
+    chart_id = None
+    while True:
+        forward = ForwardMsg()
+        forward.ParseFromString(websocket.recv(timeout=timeout))
+        kind = forward.WhichOneof("type")
+        if kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+            element = forward.delta.new_element
+            if element.WhichOneof("type") == "exception":
+                raise RuntimeError(element.exception.message)
+            if element.WhichOneof("type") == "plotly_chart" and SKILL_CHART_KEY_PREFIX in element.plotly_chart.id:
+                chart_id = element.plotly_chart.id
+        elif kind == "script_finished" and forward.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+            return (time.perf_counter() - start) * 1000, chart_id
+
+
+def click_state(chart_id, skill):
+    """스킬 그래프에서 skill 막대를 클릭했을 때 브라우저가 보내는 선택 상태."""
+    # 그래프 방향(가로/세로)에 관계없이 클릭한 스킬을 읽을 수 있도록 x, y 모두 스킬 이름으로 채움
+    selection = {"points": [{"x": skill, "y": skill}], "point_indices": [0], "box": [], "lasso": []}
+    return WidgetState(id=chart_id, string_value=json.dumps({"selection": selection}))
+
+
+def script_times(records):
+    """
+    재실행 기록을 클릭마다 (fragment 실행 시간의 합 ms, 이어진 앱 전체 실행 시간 ms)로 묶습니다.
+    기록은 클릭의 fragment 실행들 다음에 앱 전체 실행 하나가 오는 순서입니다.
+    """
+    click_ms, full_app_ms = [], []
+    fragments_ms = 0.0
+    for record in records:
+        if record.get("scope", "app") == "app":
+            click_ms.append(fragments_ms)
+            full_app_ms.append(record["total_ms"])
+            fragments_ms = 0.0
+        else:
+            fragments_ms += record["total_ms"]
+    return np.array(click_ms), np.array(full_app_ms)
+
+
+def run_clicks(clicks, timeout):
+    """
+    클릭을 clicks번 재현합니다.
+
+    Returns:
+        {"wall": (클릭 ms, 앱 전체 ms), "script": (클릭 ms, 앱 전체 ms)} 형태의 클릭별 배열
+    """
+    click_ms, full_app_ms = [], []
+    with tempfile.TemporaryDirectory() as directory:
+        log_path = os.path.join(directory, "profile.jsonl")
+        with dashboard_session(log_path, timeout) as websocket:
+            _, chart_id = rerun(websocket, timeout=timeout)
+            for i in range(clicks):
+                if chart_id is None:
+                    raise RuntimeError("스킬 그래프를 찾을 수 없습니다.")
+                skill = CLICKED_SKILLS[i % len(CLICKED_SKILLS)]
+                ms, chart_id = rerun(websocket, [click_state(chart_id, skill)], timeout)
+                click_ms.append(ms)
+                ms, chart_id = rerun(websocket, timeout=timeout)
+                full_app_ms.append(ms)
+        records = read_profile_log(log_path)[1:]  # 첫 실행(데이터 로드)은 제외
+
+    return {"wall": (np.array(click_ms), np.array(full_app_ms)), "script": script_times(records)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="그래프 클릭 재실행 시간 측정")
+    parser.add_argument("--clicks", type=int, default=20, help="재현할 클릭 수")
+    parser.add_argument("--timeout", type=float, default=120, help="서버 시작과 재실행 한 번의 제한 시간(초)")
+    args = parser.parse_args()
+
+    results = run_clicks(args.clicks, args.timeout)
+    print(f"{'timing':>7} {'scope':>10} {'p50 (ms)':>9} {'p95 (ms)':>9}")
+    for timing, (click, full_app) in results.items():
+        for name, timings in (("click", click), ("full app", full_app)):
+            print(f"{timing:>7} {name:>10} {np.percentile(timings, 50):>9.1f} {np.percentile(timings, 95):>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+count_skills 벤치마크.
+
+기존 iterrows 기반 구현과 벡터화된 count_skills를 4k(실제 데이터), 100k, 1M 행에서 비교합니다.
+저장소 루트에서 실행합니다:
+
+    python -m benchmarks.bench_count_skills
+    python -m benchmarks.bench_count_skills --sizes 4000 100000 --repeat 5
+"""
+import argparse
+import time
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from src.processing.skill_stats import count_skills
+
+DEFAULT_SIZES = [4_000, 100_000, 1_000_000]
+
+
+def count_skills_iterrows(df):
+    """비교 기준: 벡터화 이전의 iterrows 기반 구현."""
+    skill_counts = Counter()
+    for index, row in df.iterrows():
+        skills_str = row.get("skill")
+        if pd.notna(skills_str) and isinstance(skills_str, str):
+            skills = [skill.strip().upper() for skill in skills_str.split(",")]
+            skill_counts.update(skills)
+
+    excluded_skills = ["AI", "UI", "UIUX", "NATIVE", "BOOT", "API", "WEB", "SW", "PC", "CICD"]
+    skill_counts = {
+        skill: count
+        for skill, count in skill_counts.items()
+        if skill not in excluded_skills
+    }
+    return pd.Series(skill_counts).sort_values(ascending=False)
+
+
+def make_dataset(n_rows, source="data/merged_data_total.csv", seed=0):
+    """
+    실제 병합 데이터의 스킬 목록 길이 분포와 스킬 어휘를 유지하면서 n_rows 행의 데이터를 만듭니다.
+    행을 그대로 복제하지 않고 스킬을 다시 뽑아, 고유 skill 문자열 비율이 실제 데이터와 비슷하게 유지됩니다.
+    """
+    base = pd.read_csv(source)
+    if n_rows <= len(base):
+        return base.head(n_rows).reset_index(drop=True)
+
+    rng = np.random.default_rng(seed)
+    token_lists = base["skill"].dropna().str.split(",").map(lambda tokens: [t.strip() for t in tokens])
+    lengths = token_lists.map(len).to_numpy()
+    vocab = pd.Series([t for tokens in token_lists for t in tokens]).value_counts()
+    probabilities = vocab.to_numpy() / vocab.sum()
+
+    row_lengths = rng.choice(lengths, size=n_rows)
+    flat = rng.choice(vocab.index.to_numpy(), size=row_lengths.sum(), p=probabilities)
+    skills = [", ".join(chunk) for chunk in np.split(flat, np.cumsum(row_lengths)[:-1])]
+
+    sampled = base.sample(n_rows, replace=True, random_state=seed).reset_index(drop=True)
+    sampled["skill"] = skills
+    return sampled
+
+
+def time_call(func, df, repeat):
+    """repeat 회 실행한 뒤 최소 실행 시간(초)과 마지막 결과를 반환합니다."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(df)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="count_skills 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="측정할 행 수 목록")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최소값 사용)")
+    parser.add_argument("--baseline-max-rows", type=int, default=1_000_000,
+                        help="이 행 수를 넘는 경우 iterrows 기준 구현 측정을 건너뜁니다")
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'iterrows (s)':>14} {'vectorized (s)':>16} {'speedup':>9}  match")
+    for n_rows in args.sizes:
+        df = make_dataset(n_rows)
+        vectorized_time, vectorized = time_call(count_skills, df, args.repeat)
+
+        if n_rows <= args.baseline_max_rows:
+            # 기준 구현은 느리므로 한 번만 실행
+            baseline_time, baseline = time_call(count_skills_iterrows, df, 1)
+            match = baseline.sort_index().equals(vectorized.sort_index())
+            print(f"{n_rows:>10,} {baseline_time:>14.3f} {vectorized_time:>16.3f} "
+                  f"{baseline_time / vectorized_time:>8.1f}x  {match}")
+        else:
+            print(f"{n_rows:>10,} {'-':>14} {vectorized_time:>16.3f} {'-':>9}  -")
+
+
+if __name__ == "__main__":
+    main()
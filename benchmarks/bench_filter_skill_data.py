@@ -0,0 +1,118 @@
+"""
+filter_skill_data 벤치마크.
+
+정리 단계마다 정규식을 다시 적용하던 기존 구현과 현재 구현(통합 정규식 + LRU 캐시),
+Series 일괄 처리(filter_skill_series)를 data/*.csv의 skill 컬럼으로 비교하고,
+모든 입력에서 결과가 기존 구현과 정확히 같은지 확인합니다.
+
+저장된 skill 컬럼은 이미 한 번 정리된 값이므로, 스크래핑 원본처럼 한글/숫자/개행 문자 등을
+섞은 변형도 함께 사용합니다. 저장소 루트에서 실행합니다:
+
+    python -m benchmarks.bench_filter_skill_data
+    python -m benchmarks.bench_filter_skill_data --repeat 5
+"""
+import argparse
+import glob
+import random
+import re
+import time
+
+import pandas as pd
+
+from src.scrapers.data_utils import _clean_skill_string, filter_skill_data, filter_skill_series
+
+NOISE = ["\n", "\u2028", " 3년 이상", "경험자 우대", "(필수)", ".js", " 2024 ", "ㅋ", "\t", "·"]
+
+
+def filter_skill_data_legacy(skill):
+    """비교 기준: 호출할 때마다 정규식을 컴파일하고 단계별로 치환하던 기존 구현."""
+    if not skill:
+        return ""
+
+    no_hangul = re.compile('[ㄱ-ㅣ가-힣]+')
+    filtered_skill = no_hangul.sub('', skill)
+    filtered_skill = filtered_skill.replace('\n', '')
+    filtered_skill = filtered_skill.replace('\u2028', '')
+    filtered_skill = re.sub(r"[^a-zA-Z#+\s]", "", filtered_skill)
+
+    def remove_standalone_numbers(text):
+        def replace(match):
+            return ""
+        return re.sub(r"(?<![a-zA-Z])\d+(?![a-zA-Z])", replace, text)
+
+    filtered_skill = remove_standalone_numbers(filtered_skill)
+
+    words = filtered_skill.split()
+    unique_words = []
+    seen = set()
+    for word in words:
+        if word not in seen:
+            unique_words.append(word)
+            seen.add(word)
+
+    return ', '.join(unique_words)
+
+
+def load_skill_inputs(pattern="data/*.csv", seed=0):
+    """data/*.csv의 skill 값과, 같은 값에 잡음 문자를 섞은 변형을 함께 반환합니다."""
+    skills = []
+    for path in sorted(glob.glob(pattern)):
+        df = pd.read_csv(path)
+        if "skill" in df.columns:
+            skills.extend(df["skill"].dropna().astype(str).tolist())
+
+    rng = random.Random(seed)
+    noisy = []
+    for skill in skills:
+        pieces = skill.split(",")
+        pieces.insert(rng.randrange(len(pieces) + 1), rng.choice(NOISE))
+        noisy.append(rng.choice([",", "\n", " "]).join(pieces))
+    return skills + noisy + ["", None]
+
+
+def time_call(func, repeat):
+    """repeat 회 실행한 뒤 최소 실행 시간(초)과 마지막 결과를 반환합니다."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="filter_skill_data 벤치마크")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최소값 사용)")
+    args = parser.parse_args()
+
+    inputs = load_skill_inputs()
+    series = pd.Series(inputs, dtype=object)
+    print(f"inputs: {len(inputs):,} (고유 {series.nunique():,})")
+
+    def run_uncached():
+        _clean_skill_string.cache_clear()
+        return [filter_skill_data(skill) for skill in inputs]
+
+    legacy_time, legacy = time_call(lambda: [filter_skill_data_legacy(skill) for skill in inputs], args.repeat)
+    uncached_time, uncached = time_call(run_uncached, args.repeat)
+    cached_time, cached = time_call(lambda: [filter_skill_data(skill) for skill in inputs], args.repeat)
+
+    def run_series_uncached():
+        _clean_skill_string.cache_clear()
+        return filter_skill_series(series)
+
+    series_time, batch = time_call(run_series_uncached, args.repeat)
+
+    print(f"{'variant':>24} {'time (ms)':>10} {'speedup':>9}  match")
+    for name, elapsed, result in [
+        ("legacy", legacy_time, legacy),
+        ("fused (cold cache)", uncached_time, uncached),
+        ("fused (warm cache)", cached_time, cached),
+        ("series (cold cache)", series_time, batch.tolist()),
+    ]:
+        print(f"{name:>24} {elapsed * 1000:>10.1f} {legacy_time / elapsed:>8.1f}x  {result == legacy}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+오타 허용 검색 / 자동 완성 벤치마크.
+
+합성 데이터(benchmarks.synthetic, 기본 1만~100만 행)에서 SkillIndex를 만들고 다음을 측정합니다.
+
+    - vocab fuzzy: 어휘 트라이그램 색인 조회만 (TrigramIndex.search)
+    - suggest: 사이드바 자동 완성 목록 (SkillIndex.suggest)
+    - fuzzy lookup: 오타 허용 조건의 행 번호 조회 (SkillIndex.lookup, MATCH_FUZZY)
+    - scan: 비교 기준, 행 전체를 str.contains로 검색 (색인 이전의 filter_data 방식, 오타는 찾지 못함)
+
+어휘 조회 비용은 행 수와 무관하게 유지되어야 합니다. 검색어는 실제 어휘에 오타(문자 교환/삭제/삽입/치환)를
+한 번 넣어 만듭니다. 저장소 루트에서 실행합니다:
+
+    python -m benchmarks.bench_fuzzy_search
+    python -m benchmarks.bench_fuzzy_search --sizes 100000 1000000 --queries 200
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+
+from benchmarks.synthetic import PostingDistribution, make_job_postings
+from src.dashboard.skill_index import MATCH_FUZZY, SkillIndex
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+
+def make_typo_queries(terms, n_queries, seed=0):
+    """어휘에서 빈도순으로 단어를 골라 오타를 하나씩 넣은 검색어 목록을 만듭니다."""
+    rng = random.Random(seed)
+    candidates = [term for term in terms if len(term) >= 4]
+    queries = []
+    for _ in range(n_queries):
+        chars = list(rng.choice(candidates).lower())
+        i = rng.randrange(len(chars) - 1)
+        operation = rng.randrange(4)
+        if operation == 0:
+            chars[i], chars[i + 1] = chars[i + 1], chars[i]
+        elif operation == 1:
+            del chars[i]
+        elif operation == 2:
+            chars.insert(i, rng.choice("aeiou"))
+        else:
+            chars[i] = rng.choice("xyz")
+        queries.append("".join(chars))
+    return queries
+
+
+def per_query_ms(func, queries):
+    """검색어별 실행 시간(ms) 배열."""
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        func(query)
+        timings.append((time.perf_counter() - start) * 1000)
+    return np.asarray(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오타 허용 검색 / 자동 완성 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="합성 데이터 행 수 목록")
+    parser.add_argument("--queries", type=int, default=100, help="측정할 검색어 수")
+    parser.add_argument("--scan-queries", type=int, default=10, help="행 전체 검색(비교 기준)에 사용할 검색어 수")
+    args = parser.parse_args()
+
+    distribution = PostingDistribution()
+    print(f"{'rows':>10} {'vocab':>7} {'build (s)':>10} {'case':>14} {'p50 (ms)':>9} {'p95 (ms)':>9}  found")
+    for n_rows in args.sizes:
+        df = make_job_postings(n_rows, distribution=distribution)
+        start = time.perf_counter()
+        index = SkillIndex(df)
+        index.skill_vocab, index.position_vocab  # 트라이그램 색인 생성 시간 포함
+        build_time = time.perf_counter() - start
+
+        queries = make_typo_queries(list(index.skill_postings), args.queries)
+        skills = df["skill"].astype(str).str.lower()
+        cases = [
+            ("vocab fuzzy", lambda q: index.skill_vocab.search(q), queries),
+            ("suggest", lambda q: index.suggest(q[:3]), queries),
+            ("fuzzy lookup", lambda q: index.lookup(q, None, MATCH_FUZZY), queries),
+            ("scan", lambda q: skills.str.contains(q, regex=False), queries[:args.scan_queries]),
+        ]
+        found = sum(bool(index.skill_vocab.search(q)) for q in queries)
+        for name, func, case_queries in cases:
+            timings = per_query_ms(func, case_queries)
+            print(f"{n_rows:>10,} {len(index.skill_vocab):>7,} {build_time:>10.2f} {name:>14} "
+                  f"{np.percentile(timings, 50):>9.2f} {np.percentile(timings, 95):>9.2f}  "
+                  f"{f'{found}/{len(queries)}' if name == 'vocab fuzzy' else ''}")
+
+
+if __name__ == "__main__":
+    main()
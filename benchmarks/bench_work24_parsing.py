@@ -0,0 +1,178 @@
+"""
+고용24 응답 파싱 벤치마크.
+
+기존 ElementTree 3단계 처리(키워드 필터 -> 중복 제거 -> 정렬/변환, 단계마다 item.find와 strptime 반복)와
+iterparse 한 번으로 레코드를 만든 뒤 처리하는 현재 구현을 고정된 XML 응답(fixture)으로 비교합니다.
+네트워크는 사용하지 않습니다. 저장소 루트에서 실행합니다:
+
+    python -m benchmarks.bench_work24_parsing
+    python -m benchmarks.bench_work24_parsing --pages 7 --page-size 100 --repeat 20
+"""
+import argparse
+import random
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta
+from xml.sax.saxutils import escape
+
+from src.dashboard.search.work24 import (
+    format_training_courses,
+    parse_work24_page,
+    select_training_courses,
+)
+
+KEYWORDS = ["Java", "Python", "React", "AWS", "Spring", "Docker"]
+INSTITUTIONS = ["서울IT아카데미", "부산코딩스쿨", "대전소프트웨어교육원", "광주디지털캠퍼스", "인천데이터스쿨"]
+ADDRESSES = ["서울 강남구", "부산 해운대구", "대전 유성구", "광주 북구", "인천 연수구"]
+
+
+def make_fixture_pages(pages, page_size, total_results=None, seed=0):
+    """
+    고용24 API 응답과 같은 구조의 XML 페이지(bytes) 목록을 만듭니다.
+    같은 (과정명, 기관명)이 다른 종료일로 반복되도록 만들어 중복 제거 경로도 측정합니다.
+    """
+    rng = random.Random(seed)
+    total_results = total_results or pages * page_size
+    base_date = datetime(2026, 1, 1)
+
+    fixtures = []
+    for _ in range(pages):
+        items = []
+        for _ in range(page_size):
+            keyword = rng.choice(KEYWORDS)
+            start = base_date + timedelta(days=rng.randrange(365))
+            end = start + timedelta(days=rng.randrange(30, 180))
+            end_text = end.strftime("%Y%m%d") if rng.random() > 0.02 else ""
+            items.append(
+                "<scn_list>"
+                f"<title>{escape(keyword)} 풀스택 개발자 양성과정 {rng.randrange(40)}기</title>"
+                f"<subTitle>{escape(rng.choice(INSTITUTIONS))}</subTitle>"
+                f"<traStartDate>{start:%Y%m%d}</traStartDate>"
+                f"<traEndDate>{end_text}</traEndDate>"
+                f"<address>{escape(rng.choice(ADDRESSES))}</address>"
+                "</scn_list>"
+            )
+        fixtures.append(
+            f"<HRDNet><scn_cnt>{total_results}</scn_cnt><pageNum>1</pageNum>"
+            f"<srchList>{''.join(items)}</srchList></HRDNet>".encode("utf-8")
+        )
+    return fixtures
+
+
+def process_tree_three_pass(pages, keyword):
+    """비교 기준: 페이지 전체를 트리로 파싱하고 3단계로 처리하던 기존 구현."""
+    keyword_lower = keyword.lower()
+    all_fetched_items = []
+    for content in pages:
+        all_fetched_items.extend(ET.fromstring(content).findall('.//srchList/scn_list'))
+
+    keyword_filtered_items = []
+    for item in all_fetched_items:
+        trainning_nm_element = item.find('title')
+        trainning_nm = trainning_nm_element.text if trainning_nm_element is not None else ""
+        if keyword_lower in trainning_nm.lower():
+            keyword_filtered_items.append(item)
+
+    unique_trainings = {}
+    for item in keyword_filtered_items:
+        trainning_nm_element = item.find('title')
+        inst_nm_element = item.find('subTitle')
+        end_dt_element = item.find('traEndDate')
+        trainning_nm = trainning_nm_element.text.strip() if trainning_nm_element is not None and trainning_nm_element.text else "정보 없음"
+        inst_nm = inst_nm_element.text.strip() if inst_nm_element is not None and inst_nm_element.text else "정보 없음"
+        end_dt_str = end_dt_element.text.strip() if end_dt_element is not None and end_dt_element.text else None
+        duplicate_key = (trainning_nm.lower(), inst_nm.lower())
+        current_end_date = None
+        if end_dt_str:
+            try:
+                current_end_date = datetime.strptime(end_dt_str, "%Y%m%d")
+            except (ValueError, TypeError):
+                pass
+        if duplicate_key not in unique_trainings:
+            unique_trainings[duplicate_key] = {'item': item, 'end_date': current_end_date}
+        else:
+            stored_end_date = unique_trainings[duplicate_key]['end_date']
+            if (current_end_date is not None) and \
+                (stored_end_date is None or current_end_date > stored_end_date):
+                unique_trainings[duplicate_key] = {'item': item, 'end_date': current_end_date}
+
+    final_trainings_list = [info['item'] for info in unique_trainings.values()]
+
+    def get_start_date(item_element):
+        start_dt_element = item_element.find('traStartDate')
+        start_dt_str = start_dt_element.text.strip() if start_dt_element is not None and start_dt_element.text else None
+        if start_dt_str:
+            try:
+                return datetime.strptime(start_dt_str, "%Y%m%d")
+            except (ValueError, TypeError):
+                pass
+        return datetime.min
+
+    final_trainings_list.sort(key=get_start_date, reverse=True)
+
+    result_list = []
+    for item in final_trainings_list:
+        values = []
+        for tag in ('title', 'subTitle', 'traStartDate', 'traEndDate', 'address'):
+            element = item.find(tag)
+            values.append(element.text.strip() if element is not None and element.text else "정보 없음")
+        training_nm, inst_nm, bgng_dt, end_dt, lctn_nm = values
+        formatted_bgng_dt, formatted_end_dt = bgng_dt, end_dt
+        if bgng_dt != "정보 없음":
+            try:
+                formatted_bgng_dt = datetime.strptime(bgng_dt, "%Y%m%d").strftime("%Y-%m-%d")
+            except ValueError:
+                pass
+        if end_dt != "정보 없음":
+            try:
+                formatted_end_dt = datetime.strptime(end_dt, "%Y%m%d").strftime("%Y-%m-%d")
+            except ValueError:
+                pass
+        result_list.append({
+            "과정명": training_nm,
+            "기관명": inst_nm,
+            "시작일": formatted_bgng_dt,
+            "종료일": formatted_end_dt,
+            "소재지": lctn_nm
+        })
+    return result_list
+
+
+def process_single_pass(pages, keyword):
+    """현재 구현: 페이지마다 iterparse 한 번으로 레코드를 만든 뒤 레코드 목록을 처리."""
+    courses = []
+    for content in pages:
+        courses.extend(parse_work24_page(content)[1])
+    return format_training_courses(select_training_courses(courses, keyword))
+
+
+def time_call(func, pages, keyword, repeat):
+    """repeat 회 실행한 뒤 최소 실행 시간(초)과 마지막 결과를 반환합니다."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(pages, keyword)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="고용24 응답 파싱 벤치마크")
+    parser.add_argument("--pages", type=int, default=7, help="응답 페이지 수 (fetch_work24_data 기본값 7)")
+    parser.add_argument("--page-size", type=int, default=100, help="페이지당 항목 수")
+    parser.add_argument("--repeat", type=int, default=20, help="반복 횟수 (최소값 사용)")
+    args = parser.parse_args()
+
+    pages = make_fixture_pages(args.pages, args.page_size)
+    print(f"items: {args.pages * args.page_size:,}")
+    print(f"{'keyword':>10} {'3-pass (ms)':>12} {'1-pass (ms)':>12} {'speedup':>9}  results  match")
+    for keyword in ["java", "Python", "개발자", "없는키워드"]:
+        baseline_time, baseline = time_call(process_tree_three_pass, pages, keyword, args.repeat)
+        current_time, current = time_call(process_single_pass, pages, keyword, args.repeat)
+        print(f"{keyword:>10} {baseline_time * 1000:>12.2f} {current_time * 1000:>12.2f} "
+              f"{baseline_time / current_time:>8.1f}x  {len(current):>7}  {baseline == current}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+동시 세션 부하 테스트.
+
+Streamlit AppTest로 대시보드 세션 N개를 한 프로세스에서 동시에 실행하고,
+세션 수별로 재실행(rerun) 지연 시간 p50/p95와 프로세스 메모리(RSS)를 측정합니다.
+데이터셋과 색인은 st.cache_resource의 공유 Dataset 한 벌만 사용하므로
+세션 수가 늘어나도 메모리가 데이터 크기만큼 늘어나지 않아야 합니다.
+
+각 세션은 검색어를 바꿔 가며 재실행합니다 (외부 API는 호출하지 않음).
+저장소 루트에서 실행합니다:
+
+    python -m benchmarks.load_test_sessions
+    python -m benchmarks.load_test_sessions --sessions 1 5 10 25 50 --reruns 5
+"""
+import argparse
+import os
+import resource
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "dashboard", "app.py")
+SEARCH_TERMS = ["", "python", "java", "react", "백엔드", "aws", "docker", "spring"]
+
+
+def rss_mb():
+    """현재 프로세스의 RSS(MB). /proc을 사용할 수 없으면 최대 RSS를 반환합니다."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_session(session_id, reruns, timeout):
+    """세션 하나를 열고 검색어를 바꿔 가며 재실행한 뒤, 재실행별 지연 시간(초) 목록을 반환합니다."""
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    latencies = []
+
+    start = time.perf_counter()
+    at.run()
+    latencies.append(time.perf_counter() - start)
+    if at.exception:
+        raise RuntimeError(f"session {session_id}: {at.exception[0].message}")
+
+    for i in range(reruns):
+        term = SEARCH_TERMS[(session_id + i) % len(SEARCH_TERMS)]
+        start = time.perf_counter()
+        at.text_input(key="sb_search_term").input(term).run()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def run_load(sessions, reruns, timeout):
+    """세션 sessions개를 동시에 실행하고 (지연 시간 배열, 실행 후 RSS)를 반환합니다."""
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        results = list(pool.map(lambda i: run_session(i, reruns, timeout), range(sessions)))
+    return np.array([latency for latencies in results for latency in latencies]), rss_mb()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동시 세션 부하 테스트")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 5, 10, 25, 50], help="동시 세션 수 목록")
+    parser.add_argument("--reruns", type=int, default=3, help="세션당 재실행 횟수 (첫 실행 제외)")
+    parser.add_argument("--timeout", type=float, default=120, help="재실행 제한 시간 (초)")
+    args = parser.parse_args()
+
+    baseline = rss_mb()
+    # 첫 실행에서 데이터셋과 색인을 로드하여 이후 측정에서 로드 시간을 제외
+    warmup, _ = run_load(1, 0, args.timeout)
+    loaded = rss_mb()
+    print(f"rss before load: {baseline:.0f} MB, after first session: {loaded:.0f} MB "
+          f"(cold run {warmup[0] * 1000:.0f} ms)")
+
+    print(f"{'sessions':>8} {'reruns':>7} {'p50 (ms)':>9} {'p95 (ms)':>9} {'rss (MB)':>9} {'+rss (MB)':>10}")
+    for sessions in args.sessions:
+        latencies, rss = run_load(sessions, args.reruns, args.timeout)
+        print(f"{sessions:>8} {len(latencies):>7} {np.percentile(latencies, 50) * 1000:>9.0f} "
+              f"{np.percentile(latencies, 95) * 1000:>9.0f} {rss:>9.0f} {rss - loaded:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""
+데이터/렌더링 파이프라인 벤치마크 모음.
+
+benchmarks.synthetic으로 만든 합성 데이터(기본 1만, 10만 행)에서 다음 단계의 실행 시간을 측정하고
+결과를 JSON으로 저장합니다. 브라우저와 네트워크는 사용하지 않습니다.
+
+    count_skills, SkillIndex 생성, filter_data, merge_and_deduplicate_csv_files,
+    filter_skill_data, 직무명 정규화(PositionNormalizer), create_animated_bar_chart
+
+커밋 간 비교는 이전 결과 파일을 --compare로 넘깁니다. 기준보다 --threshold 배 이상 느려진 항목이 있으면
+종료 코드 1을 반환합니다. 저장소 루트에서 실행합니다:
+
+    python -m benchmarks.run_suite
+    python -m benchmarks.run_suite --sizes 10000 100000 1000000 --repeat 5
+    python -m benchmarks.run_suite --compare benchmarks/results/<이전 결과>.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import PostingDistribution, make_job_postings, make_raw_skill_strings, write_scraper_files
+from src.dashboard.charts import create_animated_bar_chart
+from src.dashboard.data_loader import filter_data
+from src.dashboard.position_normalizer import PositionNormalizer
+from src.dashboard.skill_index import SkillIndex
+from src.processing.csv_merge import merge_and_deduplicate_csv_files
+from src.processing.skill_stats import count_skills
+from src.scrapers.data_utils import _clean_skill_string, filter_skill_data
+
+DEFAULT_SIZES = [10_000, 100_000]
+RESULTS_DIR = os.path.join("benchmarks", "results")
+SEARCH_TERMS = ["python", "java", "react", "백엔드", "aws"]
+TOP_N_SKILLS = 20
+
+
+def time_call(func, repeat, setup=None):
+    """
+    repeat 회 실행하여 실행 시간(초) 목록을 반환합니다.
+    setup이 있으면 매 실행 전에 호출하며, 그 시간은 측정에 포함하지 않습니다.
+    """
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def bench_dataframe_cases(df, repeat):
+    """데이터프레임 하나로 측정하는 단계들의 (이름, 실행 시간 목록)을 반환합니다."""
+    index = SkillIndex(df)
+    raw_skills = make_raw_skill_strings(df["skill"])
+    top_skills = count_skills(df).head(TOP_N_SKILLS).rename_axis("skill").reset_index(name="count")
+
+    def filter_all_terms():
+        for term in SEARCH_TERMS:
+            filter_data(df, term, None, index=index)
+
+    return [
+        ("count_skills", time_call(lambda: count_skills(df), repeat)),
+        ("skill_index_build", time_call(lambda: SkillIndex(df), repeat)),
+        ("filter_data", time_call(filter_all_terms, repeat)),
+        ("filter_skill_data", time_call(
+            lambda: [filter_skill_data(skill) for skill in raw_skills], repeat, setup=_clean_skill_string.cache_clear
+        )),
+        ("position_normalization", time_call(lambda: PositionNormalizer().normalize_series(df["position"]), repeat)),
+        ("create_animated_bar_chart", time_call(
+            lambda: create_animated_bar_chart(top_skills, "skill", "count", "bench", orientation="h"), repeat
+        )),
+    ]
+
+
+def bench_merge(n_rows, repeat, distribution):
+    """
+    합성 스크래퍼 출력 파일로 전체 병합 시간을 측정합니다 (파일 생성 시간 제외).
+    워드 클라우드 이미지는 대시보드가 그리므로 그리지 않습니다.
+    """
+    timings = []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as directory:
+            write_scraper_files(directory, n_rows, distribution=distribution)
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                merge_and_deduplicate_csv_files(directory, deduplication_columns=["company", "skill"], write_images=False)
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def git_commit():
+    """현재 커밋 해시 (git을 사용할 수 없으면 None)."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(sizes, repeat, merge_max_rows):
+    """모든 크기에서 벤치마크를 실행하고 결과 딕셔너리를 반환합니다."""
+    distribution = PostingDistribution()
+    results = []
+    for n_rows in sizes:
+        df = make_job_postings(n_rows, distribution=distribution)
+        cases = bench_dataframe_cases(df, repeat)
+        if n_rows <= merge_max_rows:
+            cases.append(("merge_and_deduplicate_csv_files", bench_merge(n_rows, repeat, distribution)))
+        for name, timings in cases:
+            results.append({
+                "name": name,
+                "rows": n_rows,
+                "best_s": min(timings),
+                "median_s": float(np.median(timings)),
+                "repeat": len(timings),
+            })
+            print(f"{name:>32} {n_rows:>10,} {min(timings) * 1000:>12.1f} {np.median(timings) * 1000:>12.1f}")
+
+    return {
+        "commit": git_commit(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold):
+    """
+    기준 결과와 비교한 표를 출력하고, threshold 배 이상 느려진 (이름, 행 수) 목록을 반환합니다.
+    """
+    baseline_times = {(r["name"], r["rows"]): r["best_s"] for r in baseline["results"]}
+    regressions = []
+    print(f"\nvs {baseline.get('commit') or '?'} ({baseline.get('created_at', '?')})")
+    print(f"{'name':>32} {'rows':>10} {'base (ms)':>12} {'now (ms)':>12} {'ratio':>7}")
+    for r in current["results"]:
+        key = (r["name"], r["rows"])
+        if key not in baseline_times:
+            continue
+        ratio = r["best_s"] / baseline_times[key]
+        flag = "  <-- regression" if ratio >= threshold else ""
+        print(f"{r['name']:>32} {r['rows']:>10,} {baseline_times[key] * 1000:>12.1f} "
+              f"{r['best_s'] * 1000:>12.1f} {ratio:>6.2f}x{flag}")
+        if ratio >= threshold:
+            regressions.append(key)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="데이터/렌더링 파이프라인 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="합성 데이터 행 수 목록")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최소값과 중앙값 기록)")
+    parser.add_argument("--merge-max-rows", type=int, default=1_000_000,
+                        help="이 행 수를 넘는 경우 병합 벤치마크를 건너뜁니다 (임시 CSV 작성 비용)")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본값: benchmarks/results/<커밋>-<시각>.json)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    parser.add_argument("--threshold", type=float, default=1.2, help="이 배율 이상 느려지면 회귀로 판단")
+    args = parser.parse_args()
+
+    print(f"{'name':>32} {'rows':>10} {'best (ms)':>12} {'median (ms)':>12}")
+    report = run_suite(args.sizes, args.repeat, args.merge_max_rows)
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"{report['commit'] or 'local'}-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\nsaved: {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if compare(report, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+벤치마크용 합성 채용 공고 데이터 생성기.
+
+data/merged_data_total.csv에서 스킬 목록 길이 분포, 스킬 빈도, 직무명/회사명 빈도를 읽어
+같은 분포를 따르는 임의 크기(1만~100만 행)의 데이터를 만듭니다. 행을 복제하지 않고 값을 다시 뽑으므로
+고유 skill 문자열 비율이 실제 데이터와 비슷하게 유지됩니다. 네트워크와 브라우저는 사용하지 않습니다.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_SOURCE = "data/merged_data_total.csv"
+SITES = ("jumpit", "rallit", "wanted")
+CATEGORIES = ("backend", "frontend", "total")
+
+# 스크래핑 원본 skill 문자열에 섞여 있는 잡음 (filter_skill_data 입력용)
+NOISE = ["\n", "\u2028", " 3년 이상", "경험자 우대", "(필수)", ".js", " 2024 ", "ㅋ", "\t", "·"]
+
+
+class PostingDistribution:
+    """실제 병합 데이터에서 읽은 컬럼별 경험적 분포."""
+
+    def __init__(self, source=DEFAULT_SOURCE):
+        base = pd.read_csv(source)
+        skills = base["skill"].dropna().astype(str)
+        token_lists = skills.str.split(",").map(lambda tokens: [t.strip() for t in tokens if t.strip()])
+
+        self.missing_skill_rate = 1 - len(skills) / max(len(base), 1)
+        self.lengths = token_lists.map(len).to_numpy()
+        vocab = pd.Series([t for tokens in token_lists for t in tokens]).value_counts()
+        self.skills = vocab.index.to_numpy()
+        self.skill_p = vocab.to_numpy() / vocab.sum()
+        positions = base["position"].astype(str).value_counts()
+        self.positions = positions.index.to_numpy()
+        self.position_p = positions.to_numpy() / positions.sum()
+        self.companies = base["company"].astype(str).unique()
+
+
+def make_job_postings(n_rows, seed=0, distribution=None):
+    """
+    company, position, skill 컬럼을 가진 n_rows 행의 합성 데이터프레임을 만듭니다.
+
+    skill은 스킬 목록 길이를 실제 분포에서 뽑은 뒤 스킬을 빈도에 비례하여 뽑아 ", "로 잇고,
+    실제 데이터와 같은 비율로 결측값을 넣습니다. 회사명은 데이터 크기에 맞게 번호를 붙여 늘립니다.
+    """
+    distribution = distribution or PostingDistribution()
+    rng = np.random.default_rng(seed)
+
+    row_lengths = rng.choice(distribution.lengths, size=n_rows)
+    flat = rng.choice(distribution.skills, size=int(row_lengths.sum()), p=distribution.skill_p)
+    skills = np.array(
+        [", ".join(chunk) for chunk in np.split(flat, np.cumsum(row_lengths)[:-1])],
+        dtype=object,
+    )
+    skills[rng.random(n_rows) < distribution.missing_skill_rate] = np.nan
+
+    # 실제 데이터의 공고/회사 비율을 유지하도록 회사명을 복제
+    n_companies = max(len(distribution.companies) * n_rows // max(len(distribution.lengths), 1), 1)
+    company_ids = rng.integers(n_companies, size=n_rows)
+    base_companies = distribution.companies[company_ids % len(distribution.companies)]
+    copies = company_ids // len(distribution.companies)
+    companies = np.where(copies == 0, base_companies, base_companies + "_" + copies.astype(str))
+
+    return pd.DataFrame({
+        "company": companies,
+        "position": rng.choice(distribution.positions, size=n_rows, p=distribution.position_p),
+        "skill": skills,
+    })
+
+
+def make_raw_skill_strings(skills, seed=0):
+    """
+    정리된 skill 문자열에 스크래핑 원본과 같은 잡음(한글, 숫자, 개행 등)을 섞은 목록을 만듭니다.
+    """
+    rng = np.random.default_rng(seed)
+    raw = []
+    for skill in skills:
+        if not isinstance(skill, str):
+            raw.append(None)
+            continue
+        pieces = skill.split(",")
+        pieces.insert(int(rng.integers(len(pieces) + 1)), NOISE[int(rng.integers(len(NOISE)))])
+        raw.append(["\n", ",", " "][int(rng.integers(3))].join(pieces))
+    return raw
+
+
+def write_scraper_files(directory, n_rows, seed=0, duplicate_rate=0.2, distribution=None):
+    """
+    directory에 스크래퍼 출력과 같은 이름(data_<사이트>_<카테고리>.csv)의 파일을 만듭니다.
+    사이트별로 약 n_rows / 사이트 수 행을 쓰고, duplicate_rate 비율의 행은 다른 사이트의 공고를 반복하여
+    merge_and_deduplicate_csv_files의 중복 제거 경로를 함께 측정합니다.
+
+    Returns:
+        작성한 파일 경로 목록.
+    """
+    distribution = distribution or PostingDistribution()
+    rng = np.random.default_rng(seed)
+    postings = make_job_postings(n_rows, seed=seed, distribution=distribution)
+
+    n_duplicates = int(n_rows * duplicate_rate)
+    duplicates = postings.iloc[rng.integers(n_rows, size=n_duplicates)]
+    rows = pd.concat([postings, duplicates], ignore_index=True)
+    site_ids = rng.integers(len(SITES), size=len(rows))
+
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for site_id, site in enumerate(SITES):
+        site_rows = rows[site_ids == site_id]
+        is_frontend = site_rows["position"].str.contains("프론트|Front|front", regex=True, na=False).to_numpy()
+        for category, part in (
+            ("backend", site_rows[~is_frontend]),
+            ("frontend", site_rows[is_frontend]),
+            ("total", site_rows),
+        ):
+            path = os.path.join(directory, f"data_{site}_{category}.csv")
+            part.to_csv(path, index=False, encoding="utf-8-sig")
+            paths.append(path)
+    return paths
@@ -1,5 +1,9 @@
 import streamlit as st
-from src.dashboard.data_loader import load_all_data, filter_data
+from src.dashboard.data_loader import load_all_data, get_filtered_row_ids, get_data_versions, get_top_skills
+from src.dashboard.search.prefetch import prefetch_enabled, ensure_related_prefetch
+from src.dashboard.skill_index import MATCH_EXACT, MATCH_FUZZY, MATCH_SUBSTRING
+from src.dashboard.profiling import start_rerun, phase, fragment_phase, finish_rerun
+from src.dashboard.charts import get_figure_cache
 from src.dashboard.renderer import (
     setup_page,
     render_sidebar,
@@ -7,9 +11,53 @@ from src.dashboard.renderer import (
     render_skill_analysis,
     render_job_analysis,
     render_data_table,
-    render_related_information
+    render_related_information,
+    render_profile_panel,
+    SUMMARY_METRICS_FRAGMENT,
+    RELATED_INFO_FRAGMENT,
+    SKILL_ANALYSIS_FRAGMENT,
+    JOB_ANALYSIS_FRAGMENT,
+    DATA_TABLE_FRAGMENT,
 )
 
+
+# --- 탭 내용 fragment ---
+# 각 영역은 자기 입력(그래프 클릭, 페이지 이동 등)이 바뀔 때 해당 fragment만 다시 실행됩니다.
+# 사이드바 검색 조건이 바뀌면 앱 전체가 다시 실행되어 새 인자로 다시 그려집니다.
+
+@st.fragment(key=SUMMARY_METRICS_FRAGMENT)
+def summary_metrics_fragment(filtered_df):
+    # '선택 키워드'는 그래프 클릭으로 바뀌므로 클릭 시 함께 다시 실행됨
+    with fragment_phase("render_summary_metrics", rows=len(filtered_df)):
+        render_summary_metrics(filtered_df)
+
+
+@st.fragment(key=RELATED_INFO_FRAGMENT)
+def related_information_fragment():
+    with fragment_phase("render_related_information"):
+        render_related_information()
+
+
+@st.fragment(key=SKILL_ANALYSIS_FRAGMENT)
+def skill_analysis_fragment(data):
+    with fragment_phase("render_skill_analysis", rows=len(data['total'])):
+        render_skill_analysis(data)
+
+
+@st.fragment(key=JOB_ANALYSIS_FRAGMENT)
+def job_analysis_fragment(filtered_df):
+    with fragment_phase("render_job_analysis", rows=len(filtered_df)):
+        render_job_analysis(filtered_df)
+
+
+@st.fragment(key=DATA_TABLE_FRAGMENT)
+def data_table_fragment(total_df, filtered_row_ids):
+    # 데이터 테이블은 필터링된 복사본 대신 행 번호에서 현재 페이지만 가져옴
+    rows = len(total_df) if filtered_row_ids is None else len(filtered_row_ids)
+    with fragment_phase("render_data_table", rows=rows):
+        render_data_table(total_df, filtered_row_ids)
+
+
 def main():
     """
     Streamlit 애플리케이션의 메인 실행 함수.
@@ -19,50 +67,83 @@ def main():
     # 페이지 기본 설정 (제목, 아이콘, 레이아웃 등)
     setup_page()
 
+    # 재실행 단계별 시간 기록 시작 (DASHBOARD_PROFILE이 켜져 있을 때만)
+    start_rerun()
+
     # 필요한 모든 데이터 로드 (캐싱 적용)
-    data = load_all_data()
+    with phase("load_all_data") as p:
+        data = load_all_data()
+        p["rows"] = len(data['total']) if data and data.get('total') is not None else 0
 
     # 데이터 로드 성공 여부 확인
     if data is None or data.get('total') is None: # .get()을 사용하여 키 부재 시 오류 방지
         st.error("애플리케이션 실행에 필요한 데이터를 로드하지 못했습니다. 데이터 로드 함수(load_all_data) 또는 파일 경로를 확인해주세요.")
         return
 
+    # 상위 스킬의 관련 정보를 백그라운드에서 미리 가져오기 (RELATED_PREFETCH가 켜져 있을 때만)
+    # 서버 시작 후 첫 실행과 데이터가 다시 병합된 뒤에 한 번씩 시작합니다.
+    if prefetch_enabled():
+        ensure_related_prefetch(get_data_versions(), get_top_skills)
+
     # 사이드바 검색 옵션 렌더링.
     # render_sidebar 함수는 이제 값을 반환하지 않고, 세션 상태(sb_search_term, sb_selected_skill)를 직접 업데이트합니다.
-    render_sidebar(data)
+    render_sidebar()
 
     # 사이드바 세션 상태에서 현재 검색/선택 값을 가져와서 데이터 필터링에 사용합니다.
     # 필터링 로직은 사이드바 입력/선택에만 기반하며, 그래프 클릭 상태(clicked_skills)에는 영향을 받지 않습니다.
     current_sb_search_term = st.session_state.get('sb_search_term', '')
     current_sb_selected_skill = st.session_state.get('sb_selected_skill', '직접 입력')
+    if st.session_state.get('sb_fuzzy_match', False):
+        current_match_mode = MATCH_FUZZY
+    elif st.session_state.get('sb_exact_match', False):
+        current_match_mode = MATCH_EXACT
+    else:
+        current_match_mode = MATCH_SUBSTRING
 
     # 사이드바 설정에 따라 전체 데이터를 필터링
-    # filter_data 함수는 여전히 검색어와 선택 스킬을 인자로 받습니다.
-    # web_load_data.py의 filter_data 함수 구현이 이 인자들을 사용하도록 되어 있어야 합니다.
-    filtered_df = filter_data(data.get('total'), current_sb_search_term, current_sb_selected_skill)
+    # 데이터 로드 시 한 번 만들어 둔 역색인으로 조회한 행 번호를 조건별로 캐시하여 사용합니다.
+    with phase("filter_data") as p:
+        filtered_row_ids = get_filtered_row_ids(
+            'total',
+            current_sb_search_term,
+            current_sb_selected_skill,
+            match_mode=current_match_mode
+        )
+        total_df = data.get('total')
+        filtered_df = total_df if filtered_row_ids is None else total_df.iloc[filtered_row_ids]
+        p["rows"] = len(filtered_df)
 
 
     # 필터링된 데이터 요약 정보 표시
-    render_summary_metrics(filtered_df)
+    summary_metrics_fragment(filtered_df)
 
     # 메인 콘텐츠 영역에 탭 생성
-    # 이 시점에서 탭 선택창이 UI에 나타납니다.
+    # 탭 전환 시 앱을 다시 실행하여, 열려 있는 탭의 내용만 렌더링합니다 (닫힌 탭은 아무 작업도 하지 않음).
     tab1, tab2, tab3 = st.tabs(
-        ["🧩 기술 스택 분석", "🔍 직무 분석", "📋 데이터 테이블"]
+        ["🧩 기술 스택 분석", "🔍 직무 분석", "📋 데이터 테이블"],
+        key="main_tabs",
+        on_change="rerun"
     )
 
-    # 각 탭 클릭 시 해당 섹션의 렌더링 함수 호출
-    # 이 함수들은 사용자가 탭을 클릭할 때 해당 탭 내용이 렌더링되도록 합니다.
-    with tab1:
-        # 검색 정보를 탭 안에, 그래프보다 위에 표시
-        render_related_information()
-        render_skill_analysis(data)
+    if tab1.open:
+        with tab1:
+            # 검색 정보를 탭 안에, 그래프보다 위에 표시
+            related_information_fragment()
+            skill_analysis_fragment(data)
 
-    with tab2:
-        render_job_analysis(filtered_df)
+    if tab2.open:
+        with tab2:
+            job_analysis_fragment(filtered_df)
+
+    if tab3.open:
+        with tab3:
+            data_table_fragment(total_df, filtered_row_ids)
 
-    with tab3:
-        render_data_table(filtered_df)
+    # 재실행 기록을 마치고 (켜져 있으면) 사이드바 디버그 패널에 표시
+    # 그래프 캐시 적중률은 프로세스 누적 값입니다.
+    record = finish_rerun(extra={"figure_cache": get_figure_cache().stats()})
+    if record is not None:
+        render_profile_panel(record)
 
 
 if __name__ == "__main__":
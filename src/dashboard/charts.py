@@ -1,11 +1,102 @@
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd # 데이터프레임 처리를 위해 필요
 
-def create_animated_bar_chart(data_df, x_col, y_col, title, orientation="v", color_scale="Plasma"):
+# 그래프 캐시에 보관할 최대 그래프 수 (카테고리/필터 조합별 TOP 20 그래프)
+FIGURE_CACHE_SIZE = 128
+
+
+class FigureCache:
+    """
+    Plotly 그래프 캐시.
+
+    입력 데이터와 그래프 옵션의 지문(fingerprint)을 키로 직렬화된 그래프(fig.to_dict())를 LRU로 보관하고,
+    조회할 때마다 복사본을 검증 없이 Figure로 감싸 반환합니다. go.Figure 생성과 속성 검증을
+    다시 하지 않으므로, TOP 20 표가 바뀌지 않은 재실행에서는 그래프 생성 비용이 복사 비용으로 줄어듭니다.
+    반환된 그래프를 수정해도 캐시에는 영향이 없습니다.
+    여러 Streamlit 세션(스레드)에서 동시에 사용할 수 있도록 잠금으로 보호합니다.
+    """
+
+    def __init__(self, max_entries=FIGURE_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # 지문 -> fig.to_dict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def fingerprint(data_df, **options):
+        """데이터프레임 내용(값, 컬럼, 인덱스)과 그래프 옵션으로 캐시 키를 만듭니다."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(pd.util.hash_pandas_object(data_df, index=True).to_numpy().tobytes())
+        digest.update(json.dumps([list(map(str, data_df.columns)), options], sort_keys=True, default=str).encode("utf-8"))
+        return digest.hexdigest()
+
+    def get_or_build(self, key, build):
+        """
+        캐시된 그래프의 복사본을 반환합니다. 없으면 build()로 만들어 저장합니다.
+        build()가 None을 반환하면 저장하지 않고 None을 반환합니다.
+        """
+        with self._lock:
+            figure_dict = self._entries.get(key)
+            if figure_dict is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if figure_dict is None:
+            fig = build()
+            if fig is None:
+                return None
+            figure_dict = fig.to_dict()
+            with self._lock:
+                self._entries[key] = figure_dict
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        # 캐시에 저장된 값은 이미 검증된 그래프이므로 다시 검증하지 않음
+        return go.Figure(copy.deepcopy(figure_dict), _validate=False)
+
+    def stats(self):
+        """hit/miss 횟수, 적중률, 보관 중인 그래프 수를 반환합니다."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / max(self.hits + self.misses, 1),
+                "entries": len(self._entries),
+            }
+
+    def clear(self):
+        """모든 그래프와 통계를 삭제합니다."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+_figure_cache = FigureCache()
+
+
+def get_figure_cache():
+    """프로세스 공용 FigureCache를 반환합니다."""
+    return _figure_cache
+
+
+def create_animated_bar_chart(data_df, x_col, y_col, title, orientation="v", color_scale="Plasma",
+                              layout=None, use_cache=True):
     """
     주어진 데이터프레임을 사용하여 정적 막대 그래프(Plotly)를 생성합니다.
 
+    같은 데이터와 옵션(orientation, color_scale, title, layout)의 그래프는 FigureCache에서
+    복사본으로 반환합니다. 그래프에 추가할 레이아웃(주석 등)은 반환된 그래프를 수정하는 대신
+    layout으로 넘겨야 캐시된 그래프에 함께 포함됩니다.
+
     Args:
         data_df: 그래프를 그릴 데이터 (Pandas DataFrame, x_col, y_col 컬럼 포함).
         x_col: X축으로 사용할 컬럼 이름.
@@ -13,6 +104,8 @@ def create_animated_bar_chart(data_df, x_col, y_col, title, orientation="v", col
         title: 그래프 제목.
         orientation: 막대 방향 ('v' for vertical, 'h' for horizontal).
         color_scale: 막대에 사용할 색상 스케일 이름 (Plotly 내장).
+        layout: 그래프 생성 후 적용할 추가 레이아웃 (fig.update_layout 인자 딕셔너리).
+        use_cache: False이면 캐시를 사용하지 않고 새로 생성합니다.
 
     Returns:
         Plotly go.Figure 객체 또는 데이터가 비어있을 경우 None.
@@ -21,6 +114,25 @@ def create_animated_bar_chart(data_df, x_col, y_col, title, orientation="v", col
         # 데이터가 비어있으면 None을 반환
         return None
 
+    def build():
+        fig = _build_bar_chart(data_df, x_col, y_col, title, orientation, color_scale)
+        if layout:
+            fig.update_layout(**layout)
+        return fig
+
+    if not use_cache:
+        return build()
+
+    key = FigureCache.fingerprint(
+        data_df[[x_col, y_col]],
+        chart="bar", x_col=x_col, y_col=y_col, title=title,
+        orientation=orientation, color_scale=color_scale, layout=layout,
+    )
+    return _figure_cache.get_or_build(key, build)
+
+
+def _build_bar_chart(data_df, x_col, y_col, title, orientation, color_scale):
+    """create_animated_bar_chart의 그래프를 새로 생성합니다 (캐시 미사용)."""
     # 정적 그래프 생성 (애니메이션 제거)
     if orientation == "h": # 가로 막대 그래프
         fig = go.Figure(
@@ -101,3 +213,46 @@ def create_animated_bar_chart(data_df, x_col, y_col, title, orientation="v", col
     )
 
     return fig
+
+
+def create_trend_line_chart(trend_df, x_col, y_col, color_col, title="", y_title="비율"):
+    """
+    항목별 추이를 꺾은선 그래프(Plotly)로 생성합니다.
+
+    Args:
+        trend_df: 그래프를 그릴 데이터 (긴 형식, x_col, y_col, color_col 컬럼 포함).
+        x_col: X축으로 사용할 컬럼 이름 (날짜).
+        y_col: Y축으로 사용할 컬럼 이름 (비율 또는 빈도).
+        color_col: 선을 구분할 컬럼 이름 (스킬 이름 등).
+        title: 그래프 제목.
+        y_title: Y축 제목.
+
+    Returns:
+        Plotly go.Figure 객체 또는 데이터가 비어있을 경우 None.
+    """
+    if trend_df.empty:
+        return None
+
+    fig = go.Figure()
+    for name, group in trend_df.groupby(color_col, sort=False):
+        fig.add_trace(
+            go.Scatter(
+                x=group[x_col],
+                y=group[y_col],
+                mode="lines+markers",
+                name=str(name),
+                hovertemplate=f"<b>{name}</b><br>%{{x}}<br>{y_title}: %{{y:.1%}}<extra></extra>",
+            )
+        )
+
+    fig.update_layout(
+        title={"text": title, "x": 0.5, "xanchor": "center"},
+        xaxis_title="",
+        yaxis_title=y_title,
+        yaxis_tickformat=".0%",
+        height=350,
+        margin=dict(l=60, r=30, t=50 if title else 20, b=40),
+        legend=dict(orientation="h", y=-0.15),
+    )
+    return fig
+
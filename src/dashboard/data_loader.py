@@ -1,50 +1,266 @@
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
 import streamlit as st
+import numpy as np
 import pandas as pd
-from collections import Counter
+from src.dashboard.position_normalizer import add_position_group
+from src.dashboard.skill_index import SkillIndex, MATCH_SUBSTRING
+from src.processing.columnar import columnar_path_for, load_columnar_if_fresh
+from src.processing.skill_stats import (
+    SkillCooccurrence,
+    compute_skill_leaderboard,
+    count_display_skills,
+    count_skills,
+    leaderboard_path_for,
+    load_leaderboard_if_fresh,
+)
+from src.processing.snapshots import SnapshotHistory, snapshot_paths_for
+from src.processing.wordcloud_image import (
+    fit_display_image,
+    load_wordcloud_if_fresh,
+    wordcloud_available,
+    wordcloud_digest,
+    write_wordcloud,
+)
 
 
-def count_skills(df):
+# 대시보드에서 사용하는 데이터 카테고리별 파일 이름
+DATA_FILES = {
+    'total': "merged_data_total.csv",
+    'backend': "merged_data_backend.csv",
+    'frontend': "merged_data_frontend.csv",
+}
+
+# 워드 클라우드를 만들 수 없을 때(wordcloud 패키지 없음, 생성 중) 대신 표시할 정적 이미지
+STATIC_WORDCLOUD_PATH = "data/wordcloud_TECH_STACK.png"
+
+# 사이드바 selectbox에서 "스킬 선택 없음"을 의미하는 값
+NO_SKILL_SELECTED = ("직접 입력", "---")
+
+
+# 데이터 파일 버전을 다시 확인하기 전까지 기억해 두는 시간(초).
+# 재실행마다(그리고 한 재실행 안에서 get_dataset을 부를 때마다) 파일을 stat하지 않도록 합니다.
+DATA_VERSION_CHECK_SECONDS = 1.0
+
+_data_versions = {}  # 파일 이름 -> (확인한 시각, 버전)
+
+
+def get_data_version(file_name):
     """
-    주어진 데이터프레임의 'skill' 컬럼에서 기술 스택 빈도를 계산합니다.
-    특정 제외 목록에 있는 스킬은 계산에서 제외합니다.
+    데이터 파일(CSV, 컬럼형 캐시, 스킬 순위표, 스냅샷 기록)의 수정 시각(ns)을 반환합니다. 캐시 키로 사용하여
+    파일이 다시 병합되면 데이터와 색인이 함께 새로 로드되도록 합니다.
+    마지막 확인 후 DATA_VERSION_CHECK_SECONDS가 지나기 전에는 기억해 둔 버전을 반환합니다.
     """
-    skill_counts = Counter()
-    for index, row in df.iterrows():
-        skills_str = row.get("skill") # .get()을 사용하여 컬럼이 없을 경우 오류 방지
-        if pd.notna(skills_str) and isinstance(skills_str, str): # 문자열인지 확인
-            # 쉼표로 분리하고 공백 제거 및 대문자 변환
-            skills = [skill.strip().upper() for skill in skills_str.split(",")]
-            skill_counts.update(skills)
+    now = time.monotonic()
+    checked = _data_versions.get(file_name)
+    if checked is not None and now - checked[0] < DATA_VERSION_CHECK_SECONDS:
+        return checked[1]
 
-    # count에서 제외될 스킬 목록 정의 (너무 일반적인 단어, 기술 스택이 아닌 것, 정규화 후 쓰레기값 등)
-    # 이 목록은 data_loader 모듈 내부에 두거나 별도 설정 파일에서 관리할 수 있습니다.
-    # 여기서는 임시로 함수 내부에 정의합니다.
-    excluded_skills = ["AI", "UI", "UIUX", "NATIVE", "BOOT", "API", "WEB", "SW", "PC", "CICD"]
+    file_path = f"data/{file_name}"
+    version = []
+    for path in (file_path, columnar_path_for(file_path), leaderboard_path_for(file_path),
+                 snapshot_paths_for(file_path)[0]):
+        try:
+            version.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            version.append(None)
+    version = tuple(version)
+    _data_versions[file_name] = (now, version)
+    return version
 
-    if excluded_skills:
-        excluded_skills_upper = [skill.upper() for skill in excluded_skills]
-        # 제외 목록에 없는 스킬만 결과에 포함
-        skill_counts = {
-            skill: count
-            for skill, count in skill_counts.items()
-            if skill not in excluded_skills_upper
-        }
 
-    # 결과를 Pandas Series로 변환하고 내림차순 정렬하여 반환
-    return pd.Series(skill_counts).sort_values(ascending=False)
+# 데이터셋별로 기억해 둘 (검색어, 선택 스킬, 매칭 방식) 조회 결과 수
+ROW_CACHE_SIZE = 256
 
+# 워드 클라우드 생성에 실패한 뒤 다시 시도하기까지 기다리는 시간(초)
+WORDCLOUD_RETRY_SECONDS = 300
 
-@st.cache_data(ttl=3600, show_spinner=False)
-def load_csv_data(file_name):
+# 사이드바 '대표 스킬 선택'에 보여줄 스킬 수
+SIDEBAR_SKILL_COUNT = 20
+
+
+class Dataset:
     """
-    CSV 파일을 읽어와 데이터프레임으로 로드합니다.
-    Streamlit의 캐싱을 적용하여 데이터 로딩 성능을 최적화합니다.
+    모든 Streamlit 세션이 공유하는 읽기 전용 데이터셋 (데이터 파일 하나).
+
+    - frame: 데이터프레임 (프로세스에 한 벌만 존재하므로 세션에서 수정하면 안 됩니다)
+    - index: 스킬/직무 역색인 (SkillIndex)
+    - leaderboard, cooccurrence: 처음 사용할 때 한 번만 만드는 스킬 순위표와 동시 등장 행렬
+    - sidebar_skills: 사이드바 대표 스킬 목록 (원본 표기, 처음 사용할 때 한 번 계산)
+    - snapshots: 병합할 때마다 쌓인 스킬/직무별 공고 수 기록 (SnapshotHistory, 처음 사용할 때 로드)
+    - row_ids(): (검색어, 선택 스킬, 매칭 방식)별 행 번호 조회 결과 LRU 캐시
+
+    st.cache_data와 달리 호출마다 복사본을 만들지 않으므로, 동시 접속 세션 수가 늘어나도
+    데이터와 색인은 한 벌만 메모리에 유지됩니다. 여러 세션 스레드에서 동시에 사용할 수 있도록
+    지연 생성과 캐시 갱신은 잠금으로 보호합니다.
+    """
+
+    def __init__(self, file_name, frame, skill_tokens=None, row_cache_size=ROW_CACHE_SIZE):
+        self.file_name = file_name
+        self.frame = frame
+        self.index = SkillIndex(frame, skill_tokens=skill_tokens)
+        self.row_cache_size = row_cache_size
+        self.row_cache_hits = 0
+        self.row_cache_misses = 0
+        self._leaderboard = None
+        self._sidebar_skills = None
+        self._cooccurrence = None
+        self._snapshots = None
+        self._wordcloud = None
+        self._wordcloud_source = None  # (스킬 빈도, 해시): 데이터셋마다 한 번 계산
+        self._wordcloud_thread = None
+        self._wordcloud_error = None   # (실패 시각, 예외): WORDCLOUD_RETRY_SECONDS 후 다시 시도
+        self._row_cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def leaderboard(self):
+        """
+        전체 스킬 순위표 (skill, count, cooccurrence).
+        csv_merge.py가 만든 순위표(.skills.json)가 원본과 일치하면 그대로 읽고, 없으면 한 번 계산합니다.
+        """
+        with self._lock:
+            if self._leaderboard is None:
+                leaderboard = load_leaderboard_if_fresh(f"data/{self.file_name}")
+                self._leaderboard = leaderboard if leaderboard is not None else compute_skill_leaderboard(self.frame)
+            return self._leaderboard
+
+    @property
+    def sidebar_skills(self):
+        """
+        공고 수 상위 SIDEBAR_SKILL_COUNT개 스킬 목록 (사이드바 '대표 스킬 선택').
+        순위표(대문자)와 달리 원본 표기('Python')를 그대로 보여주며, 처음 사용할 때 한 번 계산합니다.
+        """
+        with self._lock:
+            if self._sidebar_skills is None:
+                self._sidebar_skills = count_display_skills(self.frame).head(SIDEBAR_SKILL_COUNT).index.tolist()
+            return self._sidebar_skills
+
+    @property
+    def cooccurrence(self):
+        """스킬 동시 등장 희소 행렬 (SkillCooccurrence). 처음 사용할 때 만듭니다."""
+        with self._lock:
+            if self._cooccurrence is None:
+                self._cooccurrence = SkillCooccurrence.from_frame(self.frame)
+            return self._cooccurrence
+
+    @property
+    def snapshots(self):
+        """날짜별 스킬/직무 공고 수 기록 (SnapshotHistory). 스냅샷 파일이 없으면 빈 기록입니다."""
+        with self._lock:
+            if self._snapshots is None:
+                self._snapshots = SnapshotHistory.load(f"data/{self.file_name}")
+            return self._snapshots
+
+    def wordcloud_image(self):
+        """
+        스킬 빈도로 만든 워드 클라우드 이미지 (JPEG 바이트).
+        디스크 캐시에 현재 빈도의 이미지가 있으면 읽어 두고, 없으면 백그라운드 스레드에서 만들어
+        저장하며 그동안은 None을 반환합니다. wordcloud 패키지가 없으면 항상 None입니다.
+        스킬 빈도와 해시, 디스크 캐시 확인은 데이터셋마다 한 번만 하고,
+        생성에 실패하면 WORDCLOUD_RETRY_SECONDS가 지난 뒤 다시 시도합니다.
+        """
+        if self._wordcloud is not None or not wordcloud_available():
+            return self._wordcloud
+
+        csv_path = f"data/{self.file_name}"
+        if self._wordcloud_source is None:
+            skill_counts = self.skill_counts()
+            digest = wordcloud_digest(skill_counts)
+            image = load_wordcloud_if_fresh(csv_path, skill_counts, digest=digest)
+            if image is not None:
+                self._wordcloud = image
+                return image
+            self._wordcloud_source = (skill_counts, digest)
+
+        with self._lock:
+            if self._wordcloud is None and self._wordcloud_build_due():
+                self._wordcloud_thread = threading.Thread(
+                    target=self._build_wordcloud, args=(csv_path, *self._wordcloud_source),
+                    name="wordcloud", daemon=True,
+                )
+                self._wordcloud_thread.start()
+        return self._wordcloud
+
+    @property
+    def wordcloud_error(self):
+        """마지막 워드 클라우드 생성 실패 예외 (성공했거나 시도하지 않았으면 None)."""
+        return self._wordcloud_error[1] if self._wordcloud_error is not None else None
+
+    def _wordcloud_build_due(self):
+        """생성 스레드를 (다시) 시작할 때인지 확인합니다. self._lock을 잡은 상태에서 호출합니다."""
+        if self._wordcloud_thread is None:
+            return True
+        if self._wordcloud_thread.is_alive() or self._wordcloud_error is None:
+            return False
+        return time.monotonic() - self._wordcloud_error[0] >= WORDCLOUD_RETRY_SECONDS
+
+    def _build_wordcloud(self, csv_path, skill_counts, digest):
+        try:
+            with open(write_wordcloud(csv_path, skill_counts, digest=digest), "rb") as f:
+                self._wordcloud = f.read()
+            self._wordcloud_error = None
+        except Exception as e:
+            self._wordcloud_error = (time.monotonic(), e)
+            logging.warning(f"워드 클라우드 생성 실패 ({csv_path}), {WORDCLOUD_RETRY_SECONDS}초 후 다시 시도: {e}")
+
+    def skill_counts(self):
+        """스킬 빈도 Series (count_skills와 같은 형식)를 순위표에서 만듭니다."""
+        leaderboard = self.leaderboard
+        return pd.Series(leaderboard["count"].to_numpy(), index=leaderboard["skill"].to_numpy())
+
+    def row_ids(self, search_term, selected_skill, match_mode=MATCH_SUBSTRING):
+        """
+        조건에 해당하는 행 번호 배열(읽기 전용)을 반환합니다. 필터가 없으면 None.
+        같은 조건의 결과는 세션과 관계없이 재사용합니다.
+        """
+        if selected_skill in NO_SKILL_SELECTED:
+            selected_skill = None
+        key = (search_term or "", selected_skill or "", match_mode)
+
+        with self._lock:
+            if key in self._row_cache:
+                self._row_cache.move_to_end(key)
+                self.row_cache_hits += 1
+                return self._row_cache[key]
+            self.row_cache_misses += 1
+
+        rows = filter_row_ids(self.frame, search_term, selected_skill, self.index, match_mode)
+        if rows is not None:
+            rows = np.asarray(rows)
+            rows.flags.writeable = False  # 세션 간에 공유되는 배열
+
+        with self._lock:
+            self._row_cache[key] = rows
+            while len(self._row_cache) > self.row_cache_size:
+                self._row_cache.popitem(last=False)
+        return rows
+
+
+# 파일마다 현재 버전의 Dataset 하나만 유지: 다시 병합되어 새 버전을 로드하면 이전 버전은 캐시에서 제거됨
+@st.cache_resource(ttl=3600, max_entries=len(DATA_FILES), show_spinner=False)
+def load_dataset(file_name, data_version=None):
+    """
+    데이터 파일을 읽어 모든 세션이 공유하는 Dataset을 만듭니다.
+    data_version은 캐시 키로만 사용됩니다 (파일이 다시 병합되면 새로 로드).
+
+    csv_merge.py가 만든 컬럼형 캐시(.npz)가 있고 CSV와 일치하면 CSV 대신 그 파일을 읽고,
+    사전 토큰화된 스킬 코드로 바로 색인합니다. 이 경우 company, position, skill 컬럼은 범주형으로 로드됩니다.
+
+    정규화된 직무명(position_group, 범주형) 컬럼을 로드 시 한 번 추가하여
+    직무 분석 탭이 재실행마다 직무명을 다시 정규화하지 않도록 합니다.
     """
     try:
         # 'data' 서브폴더 내의 파일 경로 설정
         file_path = f"data/{file_name}"
+        columnar = load_columnar_if_fresh(file_path)
+        if columnar is not None:
+            return Dataset(file_name, add_position_group(columnar.frame), skill_tokens=columnar.skill_tokens)
         df = pd.read_csv(file_path)
-        return df
+        return Dataset(file_name, add_position_group(df))
     except FileNotFoundError:
         st.warning(f"데이터 파일 '{file_name}'을(를) 찾을 수 없습니다. 'data' 폴더에 파일을 넣어주세요.")
         return None
@@ -52,53 +268,228 @@ def load_csv_data(file_name):
         st.error(f"데이터 로딩 중 오류 발생: {e}")
         return None
 
+
+def get_dataset(category='total'):
+    """카테고리('total', 'backend', 'frontend')의 공유 Dataset을 현재 데이터 버전으로 반환합니다."""
+    file_name = DATA_FILES[category]
+    return load_dataset(file_name, get_data_version(file_name))
+
+
+def get_skill_counts(category, filtered_df=None):
+    """
+    카테고리의 스킬 빈도 Series를 반환합니다 (count_skills와 같은 형식).
+
+    필터가 적용된 데이터(filtered_df)가 주어지면 그 데이터로 다시 계산하고,
+    그렇지 않으면 미리 계산된 순위표를 사용하므로 재실행마다 집계하지 않습니다.
+    """
+    if filtered_df is not None:
+        return count_skills(filtered_df)
+
+    dataset = get_dataset(category)
+    if dataset is None:
+        return pd.Series(dtype="int64")
+    return dataset.skill_counts()
+
+
+def get_sidebar_skills(category='total'):
+    """카테고리의 사이드바 대표 스킬 목록 (Dataset.sidebar_skills). 데이터가 없으면 빈 목록."""
+    dataset = get_dataset(category)
+    return dataset.sidebar_skills if dataset is not None else []
+
+
+def get_top_skills(top_n, categories=None):
+    """
+    카테고리별 공고 수 상위 top_n개 스킬을 합친 목록 (중복 제거, 그래프 막대와 같은 표기).
+    관련 정보 미리 가져오기에 사용합니다.
+    """
+    skills = []
+    for category in categories or DATA_FILES:
+        skills.extend(get_skill_counts(category).head(top_n).index.astype(str))
+    return list(dict.fromkeys(skills))
+
+
+@st.cache_resource(show_spinner=False)
+def load_static_image(path):
+    """
+    정적 이미지 파일을 st.image가 다시 인코딩하지 않는 형식/크기로 한 번만 변환한 바이트.
+    파일이 없으면 None.
+    """
+    try:
+        with open(path, "rb") as f:
+            return fit_display_image(f.read())
+    except OSError:
+        return None
+
+
+def get_wordcloud_image(category='total'):
+    """
+    카테고리 워드 클라우드 이미지 바이트.
+    데이터 버전별로 만든(디스크 캐시) 이미지를 사용하고, 아직 없으면 정적 이미지를 반환합니다.
+    """
+    dataset = get_dataset(category)
+    image = dataset.wordcloud_image() if dataset is not None else None
+    return image if image is not None else load_static_image(STATIC_WORDCLOUD_PATH)
+
+
+def get_wordcloud_error(category='total'):
+    """카테고리 워드 클라우드의 마지막 생성 실패 예외. 실패하지 않았으면 None."""
+    dataset = get_dataset(category)
+    return dataset.wordcloud_error if dataset is not None else None
+
+
+def get_data_versions():
+    """모든 카테고리 데이터 파일의 버전. 하나라도 다시 병합되면 값이 바뀝니다."""
+    return tuple(get_data_version(file_name) for file_name in DATA_FILES.values())
+
+
+def get_related_skills(category, skill, top_k=5):
+    """
+    카테고리 데이터에서 skill과 가장 자주 함께 등장한 스킬 top_k개를 반환합니다.
+
+    Returns:
+        [(스킬, 함께 등장한 공고 수), ...] 리스트.
+    """
+    dataset = get_dataset(category)
+    if dataset is None or not skill:
+        return []
+    return dataset.cooccurrence.related_skills(skill, top_k)
+
+
+def get_snapshot_history(category):
+    """카테고리의 날짜별 스킬/직무 공고 수 기록(SnapshotHistory)을 반환합니다. 데이터가 없으면 None."""
+    dataset = get_dataset(category)
+    return dataset.snapshots if dataset is not None else None
+
+
 def load_all_data():
     """
     애플리케이션에 필요한 모든 데이터 파일을 로드합니다.
+    데이터프레임은 모든 세션이 공유하는 한 벌이므로 수정하지 않아야 합니다.
     """
-    data = {
-        'total': load_csv_data("merged_data_total.csv"),
-        'backend': load_csv_data("merged_data_backend.csv"),
-        'frontend': load_csv_data("merged_data_frontend.csv")
-    }
+    data = {}
+    for category in DATA_FILES:
+        dataset = get_dataset(category)
+        data[category] = dataset.frame if dataset is not None else None
     return data
 
 
+def load_index(category='total'):
+    """
+    카테고리('total', 'backend', 'frontend')에 해당하는 데이터의 역색인을 반환합니다.
+    """
+    dataset = get_dataset(category)
+    return dataset.index if dataset is not None else None
+
+
+def get_search_suggestions(category, prefix, limit=8):
+    """검색어 자동 완성 목록 (스킬/직무 단어 어휘 기준, 데이터 행 수와 무관한 비용)."""
+    index = load_index(category)
+    if index is None or not prefix:
+        return []
+    return index.suggest(prefix, limit)
+
+
 # --- 데이터 필터링 함수 ---
-def filter_data(df, search_term, selected_skill):
+def filter_row_ids(df, search_term, selected_skill, index=None, match_mode=MATCH_SUBSTRING):
+    """
+    검색어, 선택된 기술 스택 조건을 만족하는 행 번호(iloc 기준, 오름차순) 배열을 반환합니다.
+    검색어와 기술 스택 선택이 모두 없으면 None을 반환합니다 (전체 행).
+
+    Args는 filter_data와 같습니다.
+    """
+    if selected_skill in NO_SKILL_SELECTED:
+        selected_skill = None
+
+    # 검색어와 기술 스택 선택이 모두 없을 경우 필터링하지 않음
+    if not search_term and not selected_skill:
+        return None
+
+    if index is None or index.n_rows != len(df):
+        index = SkillIndex(df)
+
+    rows = index.lookup(search_term, selected_skill, match_mode)
+    if rows is None:
+        # 색인으로 처리할 수 없는 검색어 (예: 쉼표로 여러 스킬을 잇거나 앞뒤에 공백이 있는 문자열)
+        return np.flatnonzero(_scan_mask(df, search_term, selected_skill))
+    return rows
+
+
+def filter_data(df, search_term, selected_skill, index=None, match_mode=MATCH_SUBSTRING):
     """
     주어진 데이터프레임을 검색어, 선택된 기술 스택 기준으로 필터링합니다.
     검색어와 기술 스택 선택이 모두 없을 경우 원본 데이터프레임을 반환합니다.
 
+    행 단위 문자열 검색 대신 역색인(SkillIndex)에서 행 번호를 조회하고,
+    일치하는 행만 iloc으로 가져옵니다.
+
     Args:
         df: 필터링할 원본 데이터프레임.
         search_term: 키워드 검색어.
-        selected_skill: 선택된 기술 스택 (단일 문자열, '---' 또는 스킬 이름).
+        selected_skill: 선택된 기술 스택 (단일 문자열, '직접 입력' 또는 스킬 이름).
+        index: df에 대해 미리 만들어 둔 SkillIndex. 없으면 이 자리에서 생성합니다.
+        match_mode: 'substring' (부분 문자열 일치) 또는 'exact' (토큰 단위 정확히 일치).
 
     Returns:
         필터링된 데이터프레임 또는 원본 데이터프레임.
     """
-    # 검색어와 기술 스택 선택이 모두 없을 경우, 원본 데이터프레임을 그대로 반환
-    if not search_term and selected_skill == "---":
+    rows = filter_row_ids(df, search_term, selected_skill, index, match_mode)
+    if rows is None:
         return df # <-- 필터링 없이 원본 데이터 반환
+    return df.iloc[rows]
+
 
-    filtered_df = df.copy()
+def get_filtered_row_ids(category, search_term, selected_skill, match_mode=MATCH_SUBSTRING):
+    """
+    카테고리 데이터에서 (검색어, 선택 스킬, 매칭 방식)에 해당하는 행 번호 배열을 반환합니다.
+    결과는 공유 Dataset에 캐시되어 같은 조건의 재실행은 조회 없이 끝납니다. 필터가 없으면 None.
+    """
+    dataset = get_dataset(category)
+    if dataset is None:
+        return None
+    return dataset.row_ids(search_term, selected_skill, match_mode)
+
+
+def query_page(df, row_ids, page_number, page_size):
+    """
+    행 번호 배열에서 한 페이지의 행만 가져옵니다 (페이지 크기에 비례하는 비용).
+
+    Args:
+        df: 원본 데이터프레임.
+        row_ids: get_filtered_row_ids의 결과 (None이면 전체 행).
+        page_number: 1부터 시작하는 페이지 번호.
+        page_size: 페이지당 행 수.
+
+    Returns:
+        (page_df, total_rows) 튜플.
+    """
+    total_rows = len(df) if row_ids is None else len(row_ids)
+    start = max(page_number - 1, 0) * page_size
+    end = min(start + page_size, total_rows)
+    if start >= end:
+        return df.iloc[0:0], total_rows
+    if row_ids is None:
+        return df.iloc[start:end], total_rows
+    return df.iloc[row_ids[start:end]], total_rows
+
+
+def _scan_mask(df, search_term, selected_skill):
+    """
+    색인 없이 전체 행을 문자열 검색하여 조건을 만족하는 행의 불리언 배열을 반환합니다 (부분 문자열 일치).
+    검색어는 정규식이 아닌 일반 문자열로 취급합니다.
+    """
+    mask = np.ones(len(df), dtype=bool)
 
     # 키워드 검색어로 필터링 (스킬 / 직무 컬럼에서 검색)
     if search_term:
         # 대소문자 구분 없이 검색, NaN 값은 False 처리
-        search_mask = (
-            filtered_df["position"].astype(str).str.contains(search_term, case=False, na=False) |
-            filtered_df["skill"].astype(str).str.contains(search_term, case=False, na=False)
-        )
-        filtered_df = filtered_df[search_mask]
+        mask &= (
+            df["position"].astype(str).str.lower().str.contains(search_term.lower(), regex=False, na=False) |
+            df["skill"].astype(str).str.lower().str.contains(search_term.lower(), regex=False, na=False)
+        ).to_numpy()
 
     # 선택한 기술 스택으로 필터링
-    if selected_skill != "직접 입력":
-        # 기술 스택 컬럼이 문자열이고, 해당 스킬 문자열을 포함하는지 확인
+    if selected_skill:
         # 대소문자 구분 없이 검색
-        filtered_df = filtered_df[
-            filtered_df["skill"].astype(str).str.contains(selected_skill, case=False, na=False)
-        ]
+        mask &= df["skill"].astype(str).str.lower().str.contains(selected_skill.lower(), regex=False, na=False).to_numpy()
 
-    return filtered_df
\ No newline at end of file
+    return mask
@@ -0,0 +1,81 @@
+import re
+import threading
+import numpy as np
+import pandas as pd
+
+# 직무명 정규화 규칙 (정규식 -> 대표 직무명). 위에서부터 순서대로 적용됩니다.
+POSITION_MAPPING = {
+    r'\b(백엔드 엔지니어|백엔드 개발자 (5년 이상)|백엔드 개발자 (3년 이상)|시니어 백엔드 개발자|Backend Engineer|Back-end Engineer)\b': '백엔드 개발자',
+    r'\b(프론트엔드 엔지니어|프론트엔드 개발자 (5년 이상)|프론트엔드 개발자 (3년 이상)|시니어 프론트엔드 개발자|Frontend Engineer|Front-end Engineer)\b': '프론트엔드 개발자',
+    r'\b(DevOps Engineer|데브옵스 엔지니어)\b': 'DevOps 엔지니어',
+    r'\bSoftware Engineer\b': '소프트웨어 엔지니어',
+    r'\bData Engineer\b': '데이터 엔지니어',
+    r'\bQA Engineer\b': 'QA 엔지니어',
+    r'\b(Android Developer|Android 개발자)\b': '안드로이드 개발자',
+    r'\biOS Developer\b': 'iOS 개발자'
+}
+
+# 정규화된 직무명을 저장하는 컬럼 (데이터 로드 시 한 번만 계산)
+POSITION_GROUP_COLUMN = "position_group"
+
+
+class PositionNormalizer:
+    """
+    직무명 정규화기.
+
+    정규식은 생성 시 한 번만 컴파일하고, 원본 직무명별 결과를 기억해 두어
+    같은 직무명은 다시 정규식을 적용하지 않습니다.
+    데이터프레임 컬럼은 고유 직무명만 정규화한 뒤 범주 코드로 전체 행에 펼칩니다.
+
+    결과는 기존 Series.replace(POSITION_MAPPING, regex=True)와 같습니다
+    (규칙을 순서대로 re.sub로 적용, 결측값은 문자열 'nan'으로 취급).
+    """
+
+    def __init__(self, mapping=POSITION_MAPPING):
+        self._rules = [(re.compile(pattern), replacement) for pattern, replacement in mapping.items()]
+        self._memo = {}
+        self._lock = threading.Lock()
+
+    def normalize(self, position):
+        """직무명 하나를 정규화합니다."""
+        position = str(position)
+        normalized = self._memo.get(position)
+        if normalized is None:
+            normalized = position
+            for pattern, replacement in self._rules:
+                normalized = pattern.sub(replacement, normalized)
+            with self._lock:
+                self._memo[position] = normalized
+        return normalized
+
+    def normalize_series(self, positions):
+        """
+        직무명 Series를 정규화하여 같은 인덱스의 범주형 Series로 반환합니다.
+        고유 직무명 수만큼만 정규식을 적용합니다.
+        """
+        if isinstance(positions.dtype, pd.CategoricalDtype):
+            codes = positions.cat.codes.to_numpy()
+            uniques = positions.cat.categories
+        else:
+            codes, uniques = pd.factorize(positions, use_na_sentinel=True)
+
+        # 고유 직무명 (+ 결측값 'nan') 정규화
+        normalized = [self.normalize(value) for value in uniques] + [self.normalize(np.nan)]
+        group_codes, groups = pd.factorize(np.array(normalized, dtype=object))
+        # 결측값 코드 -1은 마지막 항목('nan')을 가리킴
+        row_codes = group_codes[np.where(codes < 0, len(uniques), codes)]
+        return pd.Series(
+            pd.Categorical.from_codes(row_codes, categories=groups),
+            index=positions.index,
+            name=POSITION_GROUP_COLUMN,
+        )
+
+
+_normalizer = PositionNormalizer()
+
+
+def add_position_group(df):
+    """position 컬럼을 정규화한 position_group 컬럼을 추가한 데이터프레임을 반환합니다."""
+    if df is None or "position" not in df.columns:
+        return df
+    return df.assign(**{POSITION_GROUP_COLUMN: _normalizer.normalize_series(df["position"])})
@@ -0,0 +1,223 @@
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# 재실행 프로파일링 설정 (환경 변수)
+PROFILE_ENV = "DASHBOARD_PROFILE"          # 1/true/on이면 단계별 시간을 기록하고 사이드바에 표시
+PROFILE_LOG_ENV = "DASHBOARD_PROFILE_LOG"  # 지정하면 재실행마다 한 줄씩 JSON Lines로 기록
+HISTORY_SIZE = 50                          # 세션별로 사이드바 통계에 사용할 최근 재실행 수
+
+_PROFILE_KEY = "_rerun_profile"
+_HISTORY_KEY = "_rerun_profile_history"
+_SESSION_KEY = "_rerun_profile_session"
+_log_lock = threading.Lock()
+
+
+def profiling_enabled():
+    """DASHBOARD_PROFILE 환경 변수로 프로파일링이 켜져 있는지 확인합니다."""
+    return os.getenv(PROFILE_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class RerunProfile:
+    """
+    재실행 한 번의 단계별 실행 시간(ms)과 처리 행 수 기록.
+
+    phase()로 감싼 구간마다 {"name", "ms", "rows"} 항목이 하나씩 추가됩니다.
+    scope는 앱 전체 재실행이면 "app", fragment만 다시 실행되었으면 그 fragment 이름입니다.
+    """
+
+    def __init__(self, session_id, scope="app"):
+        self.session_id = session_id
+        self.scope = scope
+        self.started_at = time.time()
+        self.phases = []
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name, rows=None):
+        """
+        구간의 실행 시간을 기록합니다.
+        구간 안에서 반환된 딕셔너리의 "rows"를 바꾸면 처리 행 수가 함께 기록됩니다.
+        """
+        record = {"name": name, "ms": 0.0, "rows": rows}
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["ms"] = (time.perf_counter() - start) * 1000
+            self.phases.append(record)
+
+    def to_record(self):
+        """JSON으로 기록할 딕셔너리를 반환합니다."""
+        return {
+            "timestamp": self.started_at,
+            "session": self.session_id,
+            "scope": self.scope,
+            "total_ms": (time.perf_counter() - self._start) * 1000,
+            "phases": self.phases,
+        }
+
+
+def start_rerun(scope="app"):
+    """
+    재실행 프로파일링을 시작합니다. 프로파일링이 꺼져 있으면 아무것도 하지 않고 None을 반환합니다.
+    """
+    if not profiling_enabled():
+        st.session_state.pop(_PROFILE_KEY, None)
+        return None
+    if _SESSION_KEY not in st.session_state:
+        st.session_state[_SESSION_KEY] = uuid.uuid4().hex[:8]
+    profile = RerunProfile(st.session_state[_SESSION_KEY], scope)
+    st.session_state[_PROFILE_KEY] = profile
+    return profile
+
+
+@contextmanager
+def phase(name, rows=None):
+    """
+    현재 재실행의 단계 구간을 기록합니다. 프로파일링이 꺼져 있으면 시간을 재지 않습니다.
+
+    사용 예:
+        with phase("filter_data") as p:
+            ...
+            p["rows"] = len(filtered_df)
+    """
+    profile = st.session_state.get(_PROFILE_KEY)
+    if profile is None:
+        yield {"name": name, "ms": 0.0, "rows": rows}
+        return
+    with profile.phase(name, rows) as record:
+        yield record
+
+
+@contextmanager
+def fragment_phase(name, rows=None):
+    """
+    fragment 본문 구간을 기록합니다.
+    앱 전체 재실행 중이면 phase()와 같고, fragment만 다시 실행될 때는
+    이 구간 하나로 된 재실행 기록(scope=name)을 따로 남깁니다.
+    """
+    if st.session_state.get(_PROFILE_KEY) is not None:
+        with phase(name, rows) as record:
+            yield record
+        return
+
+    profile = start_rerun(scope=name)
+    if profile is None:
+        yield {"name": name, "ms": 0.0, "rows": rows}
+        return
+    try:
+        with profile.phase(name, rows) as record:
+            yield record
+    finally:
+        finish_rerun()
+
+
+def finish_rerun(extra=None):
+    """
+    현재 재실행의 기록을 마치고 세션 기록에 추가합니다.
+    DASHBOARD_PROFILE_LOG가 지정되어 있으면 JSON Lines 파일에 한 줄을 추가합니다.
+
+    Args:
+        extra: 기록에 함께 남길 값 (예: {"figure_cache": 캐시 통계}).
+
+    Returns:
+        기록한 딕셔너리. 프로파일링이 꺼져 있으면 None.
+    """
+    profile = st.session_state.pop(_PROFILE_KEY, None)
+    if profile is None:
+        return None
+
+    record = profile.to_record()
+    if extra:
+        record.update(extra)
+    history = st.session_state.setdefault(_HISTORY_KEY, deque(maxlen=HISTORY_SIZE))
+    history.append(record)
+
+    log_path = os.getenv(PROFILE_LOG_ENV)
+    if log_path:
+        try:
+            append_profile_log(log_path, record)
+        except OSError as e:
+            print(f"프로파일 기록 실패 ({log_path}): {e}")
+    return record
+
+
+def append_profile_log(path, record):
+    """기록 하나를 JSON Lines 파일에 추가합니다 (여러 세션에서 동시에 호출 가능)."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    line = json.dumps(record, ensure_ascii=False)
+    with _log_lock:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def session_history():
+    """현재 세션의 최근 재실행 기록 목록 (오래된 순)."""
+    return list(st.session_state.get(_HISTORY_KEY, ()))
+
+
+def summarize_profiles(records):
+    """
+    재실행 기록 목록을 단계별로 집계합니다.
+
+    Returns:
+        phase, runs, p50_ms, p95_ms, max_ms, rows_p50 컬럼의 데이터프레임
+        (앱 전체 재실행 시간은 phase 'total', fragment만 다시 실행된 시간은 'total:<fragment>').
+        기록 순서대로 단계를 나열합니다.
+    """
+    timings = {"total": ([], [])}
+    for record in records:
+        scope = record.get("scope", "app")
+        total_name = "total" if scope == "app" else f"total:{scope}"
+        timings.setdefault(total_name, ([], []))[0].append(record["total_ms"])
+        for item in record["phases"]:
+            ms, rows = timings.setdefault(item["name"], ([], []))
+            ms.append(item["ms"])
+            if item.get("rows") is not None:
+                rows.append(item["rows"])
+
+    summary = []
+    for name, (ms, rows) in timings.items():
+        if not ms:
+            continue
+        ms = np.asarray(ms)
+        summary.append({
+            "phase": name,
+            "runs": len(ms),
+            "p50_ms": float(np.percentile(ms, 50)),
+            "p95_ms": float(np.percentile(ms, 95)),
+            "max_ms": float(ms.max()),
+            "rows_p50": float(np.median(rows)) if rows else None,
+        })
+    return pd.DataFrame(summary, columns=["phase", "runs", "p50_ms", "p95_ms", "max_ms", "rows_p50"])
+
+
+def read_profile_log(path):
+    """JSON Lines 기록 파일을 읽어 기록 목록을 반환합니다. 읽을 수 없는 줄은 건너뜁니다."""
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return records
+
+
+if __name__ == "__main__":
+    # 기록 파일 집계: python -m src.dashboard.profiling [logs/rerun_profile.jsonl]
+    import sys
+
+    log_file = sys.argv[1] if len(sys.argv) > 1 else os.getenv(PROFILE_LOG_ENV, "logs/rerun_profile.jsonl")
+    print(summarize_profiles(read_profile_log(log_file)).to_string(index=False, float_format="%.1f"))
@@ -1,10 +1,44 @@
+from functools import partial
+
 import streamlit as st
 import pandas as pd
-from src.dashboard.data_loader import count_skills
-from src.dashboard.charts import create_animated_bar_chart
-from streamlit_plotly_events import plotly_events
+from src.dashboard.data_loader import (
+    get_related_skills,
+    get_search_suggestions,
+    get_sidebar_skills,
+    get_skill_counts,
+    get_snapshot_history,
+    get_wordcloud_error,
+    get_wordcloud_image,
+    query_page,
+)
+from src.dashboard.position_normalizer import POSITION_GROUP_COLUMN, add_position_group
+from src.dashboard.charts import create_animated_bar_chart, create_trend_line_chart
 from src.dashboard.search import youtube as yt
-from src.dashboard.search.work24 import fetch_work24_data, render_work24_results_table
+from src.dashboard.search.work24 import render_work24_results_table, start_work24_fetch, work24_fetch_results
+from src.dashboard.search.background import get_background_fetcher
+from src.dashboard.search.cache import get_response_cache
+from src.dashboard.search.prefetch import get_related_prefetcher
+from src.dashboard.profiling import session_history, summarize_profiles
+
+# app.py에서 각 영역을 감싸는 fragment의 key.
+# 그래프 클릭처럼 일부 영역에만 영향을 주는 상호작용은 해당 fragment만 다시 실행합니다.
+SUMMARY_METRICS_FRAGMENT = "summary_metrics"
+RELATED_INFO_FRAGMENT = "related_info"
+SKILL_ANALYSIS_FRAGMENT = "skill_analysis"
+JOB_ANALYSIS_FRAGMENT = "job_analysis"
+DATA_TABLE_FRAGMENT = "data_table"
+WORDCLOUD_FRAGMENT = "wordcloud"
+
+# 현재 선택 키워드(그래프 클릭)가 바뀌었을 때 다시 실행할 fragment (요약 정보의 '선택 키워드' 포함)
+SELECTION_FRAGMENTS = [SUMMARY_METRICS_FRAGMENT, RELATED_INFO_FRAGMENT, SKILL_ANALYSIS_FRAGMENT]
+# 기술 스택 분석 카테고리(전체/백엔드/프론트엔드)가 바뀌었을 때 다시 실행할 fragment
+CATEGORY_FRAGMENTS = SELECTION_FRAGMENTS + [WORDCLOUD_FRAGMENT]
+
+# 관련 정보(고용24, YouTube) 백그라운드 검색 설정
+RELATED_FETCH_KEY = "related_fetch"  # 세션 상태: {"keyword": 선택 키워드, "jobs": {이름: FetchJob}}
+RELATED_FETCH_POLL_SECONDS = 0.5     # 결과를 기다리는 동안 완료 여부를 확인하는 간격 (초)
+
 
 # --- 현재 활성 선택 키워드를 결정하는 함수 ---
 def get_active_selection():
@@ -29,48 +63,6 @@ def get_active_selection():
         # 아무것도 선택되지 않았으면 None 반환
         return None
 
-# --- 클릭 이벤트 핸들러 함수 ---
-# 사이드바 세션 상태를 직접 수정하는 코드를 제거합니다.
-def handle_chart_click(clicked_data, orientation="v"):
-    """
-    Plotly chart 클릭 이벤트를 처리하여 선택된 항목을 st.session_state.clicked_skills에 설정하고
-    필요시 rerun을 요청합니다.
-    """
-    if clicked_data:
-        clicked_point = clicked_data[0]
-        selected_item = None
-
-        if orientation == "h":
-            selected_item = clicked_point.get('y')
-        else: # orientation == "v"
-            selected_item = clicked_point.get('x')
-
-        if selected_item:
-            # 이미 선택된 스킬과 동일한 스킬을 다시 클릭했는지 확인
-            # 동일한 스킬을 다시 클릭했다면, 상태를 변경하지 않고 rerun을 방지
-            # get_active_selection()을 사용하여 현재 활성 선택과 비교
-            current_active_selection = get_active_selection()
-            if current_active_selection == selected_item:
-                # 이미 활성 선택된 항목과 동일하므로 아무것도 하지 않음
-                pass
-            else:
-                # 새로운 항목이 클릭되었거나, 이전 항목과 다를 경우
-                st.session_state.clicked_skills = [selected_item] # 클릭된 스킬 업데이트
-
-                # --- 아래 두 줄을 제거합니다. Streamlit 위젯 상태 직접 수정 오류 방지 ---
-                # st.session_state.sb_search_term = ""
-                # st.session_state.sb_selected_skill = "직접 입력"
-                # ----------------------------------------------------------------------
-
-                # render_id 증가 및 rerun 트리거
-                # clicked_skills 상태가 변경되었으므로 rerun이 필요합니다.
-                if 'render_id' not in st.session_state:
-                    st.session_state.render_id = 0 # 방어적 코드
-                st.session_state.render_id += 1
-                st.rerun()
-    # 클릭 데이터가 없으면 (예: 그래프 빈 공간 클릭) clicked_skills를 변경하지 않습니다.
-
-
 # --- 선택 초기화 버튼 클릭 시 호출될 콜백 함수를 새로 정의합니다. ---
 def reset_selection_callback():
     """
@@ -82,10 +74,12 @@ def reset_selection_callback():
     st.session_state.sb_selected_skill = "직접 입력" # selectbox 기본값으로 되돌림
 
     # render_id 증가 (상태 변경으로 rerun 발생)
-    # 콜백 내부에서 세션 상태 변경은 자동으로 rerun을 트리거하므로 st.rerun()은 필요 없습니다.
     if 'render_id' in st.session_state:
         st.session_state.render_id += 1
 
+    # 버튼은 관련 정보 fragment 안에 있지만 사이드바 검색 조건도 바뀌므로 앱 전체를 다시 실행
+    st.rerun()
+
 
 # --- 선택 초기화 버튼 및 텍스트 표시 함수를 수정합니다. ---
 # 이 함수는 모든 선택 상태를 초기화하므로 그대로 둡니다.
@@ -127,7 +121,7 @@ def setup_page():
     if 'skill_chart_type' not in st.session_state:
         st.session_state.skill_chart_type = "total"
 
-    # 그래프에서 클릭된 스킬 목록 (handle_chart_click에서 업데이트)
+    # 그래프에서 클릭된 스킬 목록 (on_skill_chart_select에서 업데이트)
     if 'clicked_skills' not in st.session_state:
         st.session_state.clicked_skills = []
 
@@ -136,20 +130,38 @@ def setup_page():
         st.session_state.sb_selected_skill = "직접 입력"
     if 'sb_search_term' not in st.session_state:
         st.session_state.sb_search_term = ""
+    if 'sb_exact_match' not in st.session_state:
+        st.session_state.sb_exact_match = False
+    if 'sb_fuzzy_match' not in st.session_state:
+        st.session_state.sb_fuzzy_match = False
 
-    st.image("data/wordcloud_TECH_STACK.png")
+    render_wordcloud_banner()
     st.title("🚀 IT 채용정보로 분석한 기술 스택 트렌드")
 
 
+# --- 상단 워드 클라우드 ---
+@st.fragment(key=WORDCLOUD_FRAGMENT)
+def render_wordcloud_banner():
+    """
+    기술 스택 분석에서 선택한 카테고리의 워드 클라우드를 표시합니다.
+    이미지는 데이터 버전별로 한 번 만들어 캐시한 바이트이므로 재실행마다 다시 만들거나 읽지 않습니다.
+    """
+    category = st.session_state.get("skill_chart_type", "total")
+    image = get_wordcloud_image(category)
+    if image is not None:
+        st.image(image)
+    error = get_wordcloud_error(category)
+    if error is not None:
+        st.warning(f"워드 클라우드를 만들지 못해 기본 이미지를 표시합니다 (잠시 후 다시 시도합니다): {error}")
+
+
 # --- 사이드바 렌더링 함수 (수정) ---
-def render_sidebar(data):
+def render_sidebar():
     st.sidebar.title("💻 검색 옵션")
     st.sidebar.subheader("📊 검색 기준 선택")
 
-    common_skills = ["직접 입력"]
-    if data['total'] is not None and 'skill' in data['total'].columns and not data['total'].empty:
-        skill_counts = data['total']['skill'].dropna().str.split(',').explode().str.strip().value_counts()
-        common_skills.extend(skill_counts.head(20).index.tolist())
+    # 공고 수 상위 스킬 (공유 Dataset에서 한 번만 계산, 재실행마다 skill 컬럼을 다시 집계하지 않음)
+    common_skills = ["직접 입력"] + get_sidebar_skills('total')
 
     # --- 사이드바 위젯 변경 시 호출될 콜백 함수들 정의 ---
 
@@ -179,6 +191,11 @@ def render_sidebar(data):
         if 'sb_selected_skill' in st.session_state and st.session_state.sb_selected_skill != "직접 입력":
             st.session_state.sb_selected_skill = "직접 입력"
 
+    def sb_suggestion_on_click(term):
+        """추천 검색어 버튼 클릭 시 검색어를 바꾸고, 입력창 변경과 같이 다른 선택 상태를 초기화합니다."""
+        st.session_state.sb_search_term = term
+        sb_text_input_on_change()
+
     # --- 위젯 렌더링 및 on_change 콜백 연결 ---
 
     # 대표 스킬 선택 selectbox
@@ -207,16 +224,178 @@ def render_sidebar(data):
         on_change=sb_text_input_on_change # 콜백 함수 연결
     )
 
+    # 입력한 검색어로 시작하는 스킬/직무 단어 (없으면 오타를 고친 후보) 추천
+    current_term = st.session_state.get('sb_search_term', "").strip()
+    if current_term and not text_input_disabled:
+        suggestions = [
+            term for term in get_search_suggestions('total', current_term, limit=5)
+            if term.lower() != current_term.lower()
+        ]
+        if suggestions:
+            st.sidebar.caption("추천 검색어")
+            for term in suggestions:
+                st.sidebar.button(
+                    term,
+                    key=f"sb_suggestion_{term}",
+                    on_click=sb_suggestion_on_click,
+                    args=(term,),
+                )
+
+    # 정확히 일치 옵션: "C"가 "CSS"에, "Java"가 "JavaScript"에 매칭되지 않도록 토큰 단위로 비교
+    st.sidebar.checkbox(
+        "정확히 일치하는 스킬/단어만 검색",
+        key="sb_exact_match",
+        help="선택하면 스킬 이름 또는 직무명의 단어가 정확히 일치하는 공고만 표시합니다."
+    )
+
+    # 오타 허용 옵션: "kuberntes"처럼 철자가 조금 틀려도 가까운 스킬/단어를 찾음 (정확히 일치보다 우선)
+    st.sidebar.checkbox(
+        "오타 허용 검색",
+        key="sb_fuzzy_match",
+        help="선택하면 검색어와 철자가 한두 글자 다른 스킬 이름 또는 직무명 단어도 함께 검색합니다."
+    )
+
+    # 외부 API 응답 캐시 통계
+    render_api_cache_stats()
+
     # 푸터
     st.sidebar.markdown("---")
     st.sidebar.markdown("© 2025 IT 채용정보 분석 대시보드")
 
 
+# --- 외부 API 응답 캐시 통계 렌더링 ---
+def render_api_cache_stats():
+    """
+    고용24/YouTube 응답 캐시의 hit/miss 횟수를 사이드바에 표시합니다.
+    hit 횟수만큼 외부 API 호출(쿼터)을 절약한 것입니다.
+    """
+    stats = get_response_cache().stats()
+    prefetcher = get_related_prefetcher()
+    with st.sidebar.expander("📈 API 캐시 통계", expanded=False):
+        if prefetcher is not None:
+            prefetch_stats = prefetcher.stats()
+            last_round = prefetch_stats["last_round_s"]
+            st.caption(
+                f"**미리 가져오기**: 키워드 {len(prefetcher.keywords)}개, {prefetch_stats['rounds']}회 완료"
+                + (f" (마지막 {last_round:.1f}초)" if last_round is not None else " (진행 중)")
+            )
+        if not stats:
+            st.caption("아직 외부 API 조회 기록이 없습니다.")
+            return
+        for namespace, counts in stats.items():
+            st.caption(
+                f"**{namespace}**: hit {counts['hits']:,} / miss {counts['misses']:,} "
+                f"(적중률 {counts['hit_rate']:.0%})"
+            )
+
+
+def render_profile_panel(record):
+    """
+    재실행 단계별 실행 시간을 사이드바 디버그 패널에 표시합니다 (DASHBOARD_PROFILE이 켜져 있을 때).
+    이번 재실행의 단계별 시간과 그래프 캐시 적중률, 현재 세션의 최근 재실행 p50/p95를 함께 보여줍니다.
+    """
+    with st.sidebar.expander("⏱️ 재실행 프로파일", expanded=False):
+        st.caption(f"이번 재실행: {record['total_ms']:,.0f} ms")
+        figure_cache = record.get("figure_cache")
+        if figure_cache:
+            st.caption(
+                f"그래프 캐시: hit {figure_cache['hits']:,} / miss {figure_cache['misses']:,} "
+                f"(적중률 {figure_cache['hit_rate']:.0%}, {figure_cache['entries']}개 보관)"
+            )
+        st.dataframe(
+            pd.DataFrame(record["phases"]).rename(columns={"name": "phase"}),
+            hide_index=True,
+            column_config={"ms": st.column_config.NumberColumn(format="%.1f")},
+        )
+        history = session_history()
+        st.caption(f"최근 {len(history)}회 재실행 기준")
+        st.dataframe(
+            summarize_profiles(history),
+            hide_index=True,
+            column_config={
+                column: st.column_config.NumberColumn(format="%.1f")
+                for column in ("p50_ms", "p95_ms", "max_ms", "rows_p50")
+            },
+        )
+
+
+# --- 관련 정보 백그라운드 검색 ---
+def get_related_fetches(keyword):
+    """
+    keyword의 고용24/YouTube 검색 작업을 반환합니다 (세션 상태에 보관).
+    선택 키워드가 바뀌면 이전 작업을 놓고(다른 세션이 기다리지 않으면 취소) 새로 시작합니다.
+    """
+    current = st.session_state.get(RELATED_FETCH_KEY)
+    if current is not None and current["keyword"] == keyword:
+        return current["jobs"]
+
+    release_related_fetches()
+    jobs = {
+        "work24": start_work24_fetch(keyword),
+        "youtube": yt.start_youtube_fetch(yt.related_video_query(keyword), yt.RELATED_VIDEO_COUNT),
+    }
+    st.session_state[RELATED_FETCH_KEY] = {"keyword": keyword, "jobs": jobs}
+    return jobs
+
+
+def release_related_fetches():
+    """세션의 관련 정보 검색 작업을 놓습니다. 오래된(stale) 검색은 결과를 기다리지 않고 취소됩니다."""
+    current = st.session_state.pop(RELATED_FETCH_KEY, None)
+    if current is None:
+        return
+    fetcher = get_background_fetcher()
+    for job in current["jobs"].values():
+        if job is not None:
+            fetcher.release(job)
+
+
+def related_fetches_done(jobs):
+    return all(job is None or job.done() for job in jobs.values())
+
+
+def poll_related_fetches(keyword):
+    """
+    관련 정보 검색이 끝났는지 주기적으로 확인하는 fragment 본문.
+    검색이 끝났거나 다른 키워드를 선택하여 오래된 검색이 되면 앱을 다시 실행합니다.
+    다시 실행된 render_related_information()은 결과를 바로 그리고 이 fragment를 등록하지 않으므로
+    Streamlit이 자동 재실행(run_every) 타이머를 멈춥니다.
+    """
+    current = st.session_state.get(RELATED_FETCH_KEY)
+    if current is not None and current["keyword"] == keyword and not related_fetches_done(current["jobs"]):
+        st.info(f"'{keyword}' 관련 훈련과정과 YouTube 영상을 불러오는 중입니다...")
+        return
+    st.rerun()
+
+
+def youtube_fetch_results(job):
+    """
+    완료된 YouTube 검색 작업의 결과를 반환합니다.
+    검색 오류(None)나 작업 예외는 경고를 표시하고 빈 목록으로 대신합니다 (다시 검색하지 않음).
+    """
+    try:
+        videos = job.future.result()
+    except Exception as e:
+        st.warning(f"YouTube 검색 중 오류가 발생했습니다: {e}")
+        return []
+    if videos is None:
+        st.warning("YouTube 검색 중 오류가 발생했습니다.")
+        return []
+    return videos
+
+
+def render_related_results(keyword, jobs):
+    """완료된 관련 정보 검색 결과 (고용24, YouTube)를 렌더링합니다."""
+    render_work24_results_table(work24_fetch_results(jobs["work24"]), keyword)
+    render_youtube_search(keyword, youtube_fetch_results(jobs["youtube"]))
+
+
 # --- 선택된 스킬/키워드 관련 정보 렌더링 ---
 # 이 함수는 get_active_selection()을 사용하여 검색어를 결정하고 render_selection_info_and_reset을 호출합니다.
 def render_related_information():
     """
     get_active_selection()에 기반하여 관련 정보 (고용24, YouTube)를 렌더링합니다.
+    외부 API 검색은 백그라운드에서 실행되므로, 결과를 기다리는 동안 자리 표시자를 보여주고
+    아래의 그래프는 바로 그려집니다.
     """
     active_selection = get_active_selection()
 
@@ -226,15 +405,17 @@ def render_related_information():
         # 현재 선택 정보 및 초기화 버튼 표시
         render_selection_info_and_reset()
 
-        # Work24 검색 결과 (단일 활성 선택 키워드 사용)
-        work24_results = fetch_work24_data(active_selection)
-        render_work24_results_table(work24_results, active_selection)
-
-        # YouTube 검색 결과 (단일 활성 선택 키워드 사용)
-        render_youtube_search(active_selection)
+        # Work24, YouTube 검색 결과 (단일 활성 선택 키워드 사용)
+        jobs = get_related_fetches(active_selection)
+        if related_fetches_done(jobs):
+            render_related_results(active_selection, jobs)
+        else:
+            st.fragment(poll_related_fetches, run_every=RELATED_FETCH_POLL_SECONDS)(active_selection)
 
         st.markdown("---")
-    # 활성 선택이 없으면 아무것도 렌더링하지 않음.
+    else:
+        # 활성 선택이 없으면 아무것도 렌더링하지 않고, 진행 중인 검색은 놓음
+        release_related_fetches()
 
 # --- 요약 정보 렌더링 함수 ---
 # 이 함수는 filtered_df와 get_active_selection()을 사용합니다.
@@ -260,6 +441,30 @@ def render_summary_metrics(filtered_df):
         st.metric(label="관련 기업", value=f"{company_count:,}")
 
 
+# --- 스킬 그래프 클릭 콜백 ---
+def on_skill_chart_select(graph_key, orientation):
+    """
+    스킬 그래프 클릭 콜백.
+    클릭한 스킬을 선택 키워드로 저장하고, 요약 정보, 관련 정보, 스킬 분석 fragment만 다시 실행합니다.
+    """
+    selection = st.session_state.get(graph_key)
+    points = selection.selection.get("points", []) if selection and selection.selection else []
+    if not points:
+        return
+
+    # orientation에 따라 선택된 항목 추출
+    point = points[0]
+    selected_item = point.get("y") if orientation == "h" else point.get("x")
+
+    # 현재 활성 선택과 비교
+    if selected_item and selected_item != get_active_selection():
+        st.session_state.clicked_skills = [selected_item]
+        if 'render_id' not in st.session_state:
+            st.session_state.render_id = 0
+        st.session_state.render_id += 1
+        st.rerun(SELECTION_FRAGMENTS)
+
+
 # --- 기술 스택 분석 섹션 렌더링 함수 (수정) ---
 # 차트 타입 변경 시 사이드바 세션 상태를 초기화하는 코드를 제거합니다.
 def render_skill_analysis(data):
@@ -280,30 +485,27 @@ def render_skill_analysis(data):
     </style>
     """, unsafe_allow_html=True)
 
-    # 버튼 클릭 처리를 위한 함수 (세션 상태만 업데이트)
+    # 버튼 클릭 처리를 위한 콜백 (세션 상태만 업데이트)
     def set_skill_chart_type(chart_type):
         st.session_state.skill_chart_type = chart_type
         # 차트 전환 시 이전 클릭 정보 초기화
         st.session_state.clicked_skills = []
 
-        # render_id를 증가시켜 plotly_events 키를 갱신하고 rerun 트리거
+        # render_id를 증가시켜 그래프 key를 갱신하고, 카테고리에 영향을 받는 fragment(워드 클라우드 포함)만 다시 실행
         if 'render_id' in st.session_state:
             st.session_state.render_id += 1
-        st.rerun()
+        st.rerun(CATEGORY_FRAGMENTS)
 
 
     btn_col1, btn_col2, btn_col3, spacer_col = st.columns([0.8, 1, 2, 10])
 
-    # 버튼 클릭 시 set_skill_chart_type 함수 호출
+    # 버튼 클릭 시 set_skill_chart_type 콜백 호출
     with btn_col1:
-        if st.button("전체", key="btn_total_skill"):
-            set_skill_chart_type("total")
+        st.button("전체", key="btn_total_skill", on_click=set_skill_chart_type, args=("total",))
     with btn_col2:
-        if st.button("백엔드", key="btn_backend_skill"):
-            set_skill_chart_type("backend")
+        st.button("백엔드", key="btn_backend_skill", on_click=set_skill_chart_type, args=("backend",))
     with btn_col3:
-        if st.button("프론트엔드", key="btn_frontend_skill"):
-            set_skill_chart_type("frontend")
+        st.button("프론트엔드", key="btn_frontend_skill", on_click=set_skill_chart_type, args=("frontend",))
 
     current_type = st.session_state.skill_chart_type
     source_df = pd.DataFrame()
@@ -318,7 +520,8 @@ def render_skill_analysis(data):
 
 
     if source_df is not None and isinstance(source_df, pd.DataFrame) and not source_df.empty:
-        skill_counts = count_skills(source_df)
+        # 필터가 없는 카테고리 전체 집계는 병합 시 미리 계산된 순위표를 사용
+        skill_counts = get_skill_counts(current_type)
 
         if not skill_counts.empty:
             skill_df = skill_counts.head(skill_display).reset_index()
@@ -326,17 +529,9 @@ def render_skill_analysis(data):
 
             chart_orientation = "v"
 
-            fig = create_animated_bar_chart(
-                skill_df,
-                x_col="skill",
-                y_col="count",
-                title="",
-                orientation=chart_orientation,
-                color_scale="Viridis"
-            )
-
-            # --- 여기에 그래프 우측 상단에 텍스트를 추가합니다. ---
-            fig.update_layout(
+            # --- 그래프 우측 상단에 표시할 텍스트 ---
+            # 반환된 그래프를 수정하지 않고 layout으로 넘겨 캐시된 그래프에 함께 포함되도록 합니다.
+            click_hint_layout = dict(
                 annotations=[
                     dict(
                         text="콘텐츠 추천을 원하는 스킬의 그래프 막대를 클릭하세요!", # 표시할 텍스트
@@ -358,40 +553,35 @@ def render_skill_analysis(data):
                     )
                 ]
             )
+
+            fig = create_animated_bar_chart(
+                skill_df,
+                x_col="skill",
+                y_col="count",
+                title="",
+                orientation=chart_orientation,
+                color_scale="Viridis",
+                layout=click_hint_layout
+            )
             # ----------------------------------------------------
 
             # 그래프 표시 및 클릭 이벤트 처리
             graph_key = f"skill_chart_{current_type}_{st.session_state.render_id}"
 
-            # Streamlit의 on_select 이벤트를 사용하여 클릭 처리
-            selection = st.plotly_chart(
+            # Streamlit의 on_select 콜백으로 클릭 처리 (앱 전체가 아닌 선택 관련 fragment만 다시 실행)
+            st.plotly_chart(
                 fig,
                 use_container_width=True,
                 key=graph_key,
-                on_select="rerun",
+                on_select=partial(on_skill_chart_select, graph_key, chart_orientation),
                 selection_mode="points"
             )
 
-            # 선택된 데이터 처리
-            if selection and selection.selection and len(selection.selection.get("points", [])) > 0:
-                point = selection.selection["points"][0]
-
-                # orientation에 따라 선택된 항목 추출
-                if chart_orientation == "h":
-                    selected_item = point.get("y")
-                else:  # orientation == "v"
-                    selected_item = point.get("x")
-
-                if selected_item:
-                    # 현재 활성 선택과 비교
-                    current_active_selection = get_active_selection()
-                    if current_active_selection != selected_item:
-                        st.session_state.clicked_skills = [selected_item]
-                        if 'render_id' not in st.session_state:
-                            st.session_state.render_id = 0
-                        st.session_state.render_id += 1
-                        st.rerun()
+            # 클릭된 스킬과 함께 자주 등장하는 스킬 표시
+            render_related_skills(current_type)
 
+            # 병합 시 쌓인 스냅샷으로 스킬 수요 추이 표시
+            render_skill_trend(current_type, skill_df["skill"].head(5).tolist())
         else:
             st.info("선택된 조건에 해당하는 기술 스택 데이터에서 유의미한 스킬을 찾을 수 없습니다.")
     elif source_df is not None and isinstance(source_df, pd.DataFrame) and source_df.empty:
@@ -402,28 +592,63 @@ def render_skill_analysis(data):
             st.info(f"{current_type.capitalize()} 데이터 파일을 찾을 수 없어 기술 스택 분석을 표시할 수 없습니다.")
 
 
+def render_related_skills(category, top_k=5):
+    """그래프에서 클릭한 스킬과 같은 공고에 자주 함께 등장하는 스킬을 표시합니다."""
+    clicked_skills_list = st.session_state.get('clicked_skills', [])
+    if not clicked_skills_list:
+        return
+
+    skill = clicked_skills_list[0]
+    related = get_related_skills(category, skill, top_k)
+    if related:
+        related_text = ", ".join(f"**{name}** ({count:,})" for name, count in related)
+        st.caption(f"🔗 '{skill}'와(과) 자주 함께 등장하는 스킬: {related_text}")
+
+
+def render_skill_trend(category, default_skills, last_n=30, top_k=5):
+    """
+    스냅샷 기록(병합할 때마다 저장)으로 스킬별 공고 비율 추이와 최근 변화가 큰 스킬을 표시합니다.
+    선택된 스킬이 있으면 그 스킬을, 없으면 default_skills(상위 스킬)의 추이를 그립니다.
+    스냅샷이 2개 미만이면 표시하지 않습니다.
+    """
+    history = get_snapshot_history(category)
+    if history is None or len(history) < 2:
+        return
+
+    active_selection = get_active_selection()
+    skills = [active_selection] if active_selection else default_skills
+    trend_df = pd.concat(
+        [history.history(skill, last_n=last_n).assign(skill=skill) for skill in skills],
+        ignore_index=True,
+    )
+
+    with st.expander(f"📈 스킬 수요 추이 (최근 {min(len(history), last_n)}회 병합 기준)", expanded=False):
+        fig = create_trend_line_chart(trend_df, x_col="date", y_col="share", color_col="skill", y_title="공고 비율")
+        if fig is not None:
+            st.plotly_chart(fig, use_container_width=True, key=f"skill_trend_{category}")
+
+        start_date = history.dates[max(len(history) - last_n, 0)]
+        movers = history.top_movers(start_date=start_date, top_k=top_k)
+        if not movers.empty:
+            movers_text = ", ".join(
+                f"**{row.name}** ({row.share_change * 100:+.1f}%p)" for row in movers.itertuples()
+            )
+            st.caption(f"{start_date} 이후 비율 변화가 큰 스킬: {movers_text}")
+
+
 # --- 직무 분석 섹션 렌더링 함수 ---
 def render_job_analysis(filtered_df):
     """직무 분석 섹션 렌더링 (애니메이션 막대 그래프)"""
     job_display = 20
     st.subheader(f"TOP {job_display} 관련 직무 분석")
 
-    position_mapping = {
-        r'\b(백엔드 엔지니어|백엔드 개발자 (5년 이상)|백엔드 개발자 (3년 이상)|시니어 백엔드 개발자|Backend Engineer|Back-end Engineer)\b': '백엔드 개발자',
-        r'\b(프론트엔드 엔지니어|프론트엔드 개발자 (5년 이상)|프론트엔드 개발자 (3년 이상)|시니어 프론트엔드 개발자|Frontend Engineer|Front-end Engineer)\b': '프론트엔드 개발자',
-        r'\b(DevOps Engineer|데브옵스 엔지니어)\b': 'DevOps 엔지니어',
-        r'\bSoftware Engineer\b': '소프트웨어 엔지니어',
-        r'\bData Engineer\b': '데이터 엔지니어',
-        r'\bQA Engineer\b': 'QA 엔지니어',
-        r'\b(Android Developer|Android 개발자)\b': '안드로이드 개발자',
-        r'\biOS Developer\b': 'iOS 개발자'
-    }
     if filtered_df is not None and not filtered_df.empty:
-        temp_df = filtered_df.copy()
-        temp_df['position'] = temp_df['position'].astype(str).replace(position_mapping, regex=True) # replace 사용 시 na=False는 지원 안됨. astype(str) 먼저 적용.
-
-
-        position_counts = temp_df["position"].value_counts().head(job_display).reset_index()
+        # 정규화된 직무명은 데이터 로드 시 position_group 컬럼으로 미리 계산됨
+        if POSITION_GROUP_COLUMN not in filtered_df.columns:
+            filtered_df = add_position_group(filtered_df)
+        position_counts = filtered_df[POSITION_GROUP_COLUMN].value_counts()
+        position_counts = position_counts[position_counts > 0]  # 범주형 컬럼은 등장하지 않는 범주도 0으로 포함
+        position_counts = position_counts.head(job_display).reset_index()
         position_counts.columns = ["position", "count"]
 
         if not position_counts.empty:
@@ -445,14 +670,21 @@ def render_job_analysis(filtered_df):
 
 
 # --- 데이터 테이블 섹션 렌더링 함수 ---
-def render_data_table(filtered_df):
-    """데이터 테이블 섹션 렌더링 (페이지네이션 포함)"""
+def render_data_table(df, row_ids=None):
+    """
+    데이터 테이블 섹션 렌더링 (페이지네이션 포함)
+
+    Args:
+        df: 원본 데이터프레임.
+        row_ids: 필터 조건에 해당하는 행 번호 배열 (None이면 전체 행).
+            현재 페이지의 행만 가져오므로 페이지 이동 비용은 페이지 크기에 비례합니다.
+    """
     st.subheader("데이터 테이블")
 
-    if filtered_df is not None and not filtered_df.empty:
+    total_rows = 0 if df is None else (len(df) if row_ids is None else len(row_ids))
+    if total_rows > 0:
         page_size = st.selectbox("페이지 크기", [10, 25, 50, 100], key="data_table_page_size")
 
-        total_rows = len(filtered_df)
         total_pages = (total_rows + page_size - 1) // page_size
 
         max_page = max(1, total_pages)
@@ -472,27 +704,30 @@ def render_data_table(filtered_df):
         )
         st.session_state['data_table_page'] = page_number # 페이지 번호 변경 시 세션 상태 업데이트
 
-
+        page_df, total_rows = query_page(df, row_ids, page_number, page_size)
         start_idx = (page_number - 1) * page_size
-        end_idx = min(start_idx + page_size, total_rows)
-
-        display_df = filtered_df.iloc[start_idx:end_idx]
+        end_idx = start_idx + len(page_df)
 
         st.write(
             f"전체 {total_rows:,}개 중 {start_idx+1:,}~{end_idx:,}개 데이터를 표시합니다."
         )
-        st.dataframe(display_df)
+        # 내부 계산용 컬럼(position_group)은 표시하지 않음
+        st.dataframe(page_df.drop(columns=[POSITION_GROUP_COLUMN], errors="ignore"))
 
-    elif filtered_df is not None and filtered_df.empty:
+    elif df is not None:
         st.info("필터링된 데이터가 없습니다.")
 
 
 # --- YouTube 검색 결과 렌더링 함수 ---
 # 이 함수는 render_related_information에서 호출됩니다.
-def render_youtube_search(search_term):
-    """특정 search_term에 대한 YouTube 검색 결과를 렌더링합니다."""
+def render_youtube_search(search_term, results=None):
+    """
+    특정 search_term에 대한 YouTube 검색 결과를 렌더링합니다.
+    results(미리 가져온 검색 결과)가 없으면 직접 검색합니다.
+    """
     st.subheader(f"YouTube '{search_term}' 검색 결과")
-    results = yt.search_youtube(f'{search_term} Tutorial', 3)
+    if results is None:
+        results = yt.search_youtube(yt.related_video_query(search_term), yt.RELATED_VIDEO_COUNT)
     if results:
         for video in results:
             col1, col2 = st.columns([1, 3])
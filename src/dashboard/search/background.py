@@ -0,0 +1,142 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# 백그라운드 검색 설정
+MAX_BACKGROUND_WORKERS = 4  # 외부 API 검색을 동시에 실행할 최대 스레드 수 (프로세스 공용)
+
+
+class FetchCancelled(Exception):
+    """기다리는 세션이 없어져 취소된 백그라운드 검색."""
+
+
+class FetchJob:
+    """
+    백그라운드 검색 작업 하나.
+
+    future: 검색 결과 (concurrent.futures.Future)
+    cancelled: 작업 함수가 중간에 확인하는 취소 신호 (threading.Event)
+    """
+
+    def __init__(self, key, future, cancelled):
+        self.key = key
+        self.future = future
+        self.cancelled = cancelled
+        self.waiters = 1
+
+    def done(self):
+        return self.future.done()
+
+
+class BackgroundFetcher:
+    """
+    외부 API 검색(고용24, YouTube)을 백그라운드 스레드에서 실행하는 프로세스 공용 작업 관리자.
+
+    - 같은 키의 검색이 진행 중이면 새로 요청하지 않고 그 작업을 함께 기다립니다 (세션 간 공유).
+    - 세션이 다른 키워드로 넘어가면 release()로 작업을 놓습니다. 기다리는 세션이 모두 떠난 작업은
+      아직 시작하지 않았으면 취소하고, 실행 중이면 취소 신호를 보내 남은 요청을 건너뛰게 합니다.
+    - 끝난 작업은 목록에서 제거합니다. 성공한 결과는 각 검색 함수가 응답 캐시에 저장합니다.
+    """
+
+    def __init__(self, max_workers=MAX_BACKGROUND_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="related-fetch")
+        self._jobs = {}  # 키 -> 진행 중인 FetchJob
+        self._lock = threading.Lock()
+
+    def submit(self, key, func, *args, **kwargs):
+        """
+        func(*args, cancelled=Event, **kwargs)를 백그라운드에서 실행하는 작업을 반환합니다.
+        같은 키의 작업이 진행 중이면 그 작업을 반환합니다.
+        """
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and not job.cancelled.is_set():
+                job.waiters += 1
+                return job
+
+            cancelled = threading.Event()
+            future = self._executor.submit(func, *args, cancelled=cancelled, **kwargs)
+            job = self._jobs[key] = FetchJob(key, future, cancelled)
+        future.add_done_callback(lambda _: self._forget(job))
+        return job
+
+    @staticmethod
+    def completed(key, result):
+        """이미 결과가 있는 (캐시 적중) 작업을 만듭니다. 스레드를 사용하지 않습니다."""
+        future = Future()
+        future.set_result(result)
+        return FetchJob(key, future, threading.Event())
+
+    def release(self, job):
+        """
+        세션이 작업 결과를 더 이상 기다리지 않음을 알립니다.
+        기다리는 세션이 없어지면 작업을 취소합니다.
+        """
+        with self._lock:
+            if self._jobs.get(job.key) is not job:
+                return
+            job.waiters -= 1
+            if job.waiters > 0:
+                return
+            del self._jobs[job.key]
+        job.cancelled.set()
+        job.future.cancel()
+
+    def _forget(self, job):
+        with self._lock:
+            if self._jobs.get(job.key) is job:
+                del self._jobs[job.key]
+
+    def pending_count(self):
+        """진행 중인 작업 수."""
+        with self._lock:
+            return len(self._jobs)
+
+
+class RateLimiter:
+    """
+    API별 초당 요청 수 제한 (토큰 버킷). 여러 스레드에서 공유합니다.
+    rate가 0 이하이면 제한하지 않습니다.
+    """
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, cancelled=None):
+        """
+        요청 하나를 보낼 수 있을 때까지 기다립니다.
+        cancelled(threading.Event)가 설정되면 기다리지 않고 FetchCancelled를 발생시킵니다.
+        """
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_seconds = (1 - self._tokens) / self.rate
+            if cancelled is not None:
+                if cancelled.wait(wait_seconds):
+                    raise FetchCancelled("rate limit wait")
+            else:
+                time.sleep(wait_seconds)
+
+
+_fetcher = None
+_fetcher_lock = threading.Lock()
+
+
+def get_background_fetcher():
+    """프로세스 공용 BackgroundFetcher를 반환합니다."""
+    global _fetcher
+    with _fetcher_lock:
+        if _fetcher is None:
+            _fetcher = BackgroundFetcher()
+        return _fetcher
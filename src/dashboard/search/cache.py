@@ -0,0 +1,141 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+# 캐시 기본 설정 (get_response_cache에서 환경 변수로 변경 가능)
+DEFAULT_TTL_SECONDS = 3600  # 응답 유효 시간 (초), SEARCH_CACHE_TTL
+DEFAULT_MAX_ENTRIES = 512   # 메모리 LRU 최대 항목 수, SEARCH_CACHE_MAX_ENTRIES
+                            # SEARCH_CACHE_DB: 지정하면 해당 SQLite 파일에 영구 저장
+
+
+class ResponseCache:
+    """
+    외부 API 응답 캐시 (고용24, YouTube 공용).
+
+    - 메모리: TTL이 있는 LRU (OrderedDict)
+    - 선택 사항: SQLite 파일에 함께 저장하여 서버 재시작 후에도 재사용
+    - 네임스페이스(API)별 hit/miss 카운터 제공
+
+    값은 JSON으로 직렬화할 수 있어야 합니다 (리스트, 딕셔너리 등).
+    여러 Streamlit 세션(스레드)에서 동시에 사용할 수 있도록 잠금으로 보호합니다.
+    """
+
+    def __init__(self, ttl_seconds=DEFAULT_TTL_SECONDS, max_entries=DEFAULT_MAX_ENTRIES, sqlite_path=None):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # (namespace, key) -> (만료 시각, 값)
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._db = None
+        if sqlite_path:
+            self._db = sqlite3.connect(sqlite_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " namespace TEXT NOT NULL, key TEXT NOT NULL, expires_at REAL NOT NULL, value TEXT NOT NULL,"
+                " PRIMARY KEY (namespace, key))"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def make_key(*parts):
+        """호출 인자로 캐시 키 문자열을 만듭니다."""
+        return json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+
+    def _count(self, namespace, field):
+        stats = self._stats.setdefault(namespace, {"hits": 0, "misses": 0})
+        stats[field] += 1
+
+    def get(self, namespace, key):
+        """
+        캐시된 값을 조회합니다.
+
+        Returns:
+            (hit, value) 튜플. 값이 없거나 만료되었으면 (False, None).
+            메모리 캐시의 값은 복사 없이 공유되므로 호출 측에서 수정하지 않아야 합니다.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end((namespace, key))
+                self._count(namespace, "hits")
+                return True, entry[1]
+            if entry is not None:
+                del self._entries[(namespace, key)]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT expires_at, value FROM responses WHERE namespace = ? AND key = ?",
+                    (namespace, key),
+                ).fetchone()
+                if row is not None and row[0] > now:
+                    value = json.loads(row[1])
+                    self._store_in_memory(namespace, key, row[0], value)
+                    self._count(namespace, "hits")
+                    return True, value
+
+            self._count(namespace, "misses")
+            return False, None
+
+    def set(self, namespace, key, value, ttl_seconds=None):
+        """값을 캐시에 저장합니다."""
+        expires_at = time.time() + (ttl_seconds if ttl_seconds is not None else self.ttl_seconds)
+        with self._lock:
+            self._store_in_memory(namespace, key, expires_at, value)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (namespace, key, expires_at, value) VALUES (?, ?, ?, ?)",
+                    (namespace, key, expires_at, json.dumps(value, ensure_ascii=False)),
+                )
+                self._db.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+                self._db.commit()
+
+    def _store_in_memory(self, namespace, key, expires_at, value):
+        self._entries[(namespace, key)] = (expires_at, value)
+        self._entries.move_to_end((namespace, key))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self):
+        """
+        네임스페이스별 hit/miss 횟수와 적중률을 반환합니다.
+        hits는 외부 API 호출을 절약한 횟수입니다.
+        """
+        with self._lock:
+            return {
+                namespace: dict(counts, hit_rate=counts["hits"] / max(counts["hits"] + counts["misses"], 1))
+                for namespace, counts in self._stats.items()
+            }
+
+    def clear(self):
+        """모든 캐시 항목과 통계를 삭제합니다."""
+        with self._lock:
+            self._entries.clear()
+            self._stats.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache():
+    """
+    프로세스 공용 ResponseCache를 반환합니다.
+    처음 호출될 때 환경 변수(.env 포함)를 읽어 설정합니다.
+    SEARCH_CACHE_DB가 지정되어 있으면 해당 SQLite 파일을 함께 사용합니다.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache(
+                ttl_seconds=int(os.getenv("SEARCH_CACHE_TTL", DEFAULT_TTL_SECONDS)),
+                max_entries=int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+                sqlite_path=os.getenv("SEARCH_CACHE_DB") or None,
+            )
+        return _cache
@@ -0,0 +1,187 @@
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+import xml.etree.ElementTree as ET
+
+from src.dashboard.search import youtube as yt
+from src.dashboard.search.background import FetchCancelled, RateLimiter
+from src.dashboard.search.work24 import search_work24_courses
+
+# 관련 정보 미리 가져오기 설정 (환경 변수)
+PREFETCH_ENV = "RELATED_PREFETCH"                    # 1/true/on이면 켜짐 (기본: 꺼짐)
+PREFETCH_TOP_N_ENV = "RELATED_PREFETCH_TOP_N"        # 카테고리별로 미리 가져올 상위 스킬 수
+PREFETCH_WORKERS_ENV = "RELATED_PREFETCH_WORKERS"    # 동시에 요청할 최대 스레드 수
+PREFETCH_INTERVAL_ENV = "RELATED_PREFETCH_INTERVAL"  # 새로 고침 간격(초), 0이면 시작할 때 한 번만
+WORK24_RATE_ENV = "WORK24_RATE_LIMIT"                # 고용24 초당 최대 요청 수 (페이지 단위), 0이면 제한 없음
+YOUTUBE_RATE_ENV = "YOUTUBE_RATE_LIMIT"              # YouTube 초당 최대 검색 수, 0이면 제한 없음
+
+DEFAULT_TOP_N = 20          # 기술 스택 분석 그래프의 막대 수와 같음
+DEFAULT_WORKERS = 4
+DEFAULT_INTERVAL = 1800     # 응답 캐시 TTL(SEARCH_CACHE_TTL, 기본 3600초)보다 짧게 두어 만료 전에 새로 고침
+DEFAULT_WORK24_RATE = 2.0
+DEFAULT_YOUTUBE_RATE = 5.0
+
+
+def prefetch_enabled():
+    """RELATED_PREFETCH 환경 변수로 미리 가져오기가 켜져 있는지 확인합니다."""
+    return os.getenv(PREFETCH_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class RelatedPrefetcher:
+    """
+    상위 스킬의 관련 정보(고용24 훈련과정, YouTube 영상)를 미리 가져와 응답 캐시에 저장하는 백그라운드 작업.
+
+    그래프 막대를 처음 클릭해도 관련 정보 패널이 API를 기다리지 않고 캐시(메모리)에서 결과를 읽도록 합니다.
+    - 고용24: 키워드마다 search_work24_courses를 workers개 스레드로 실행 (페이지 요청마다 속도 제한)
+    - YouTube: search_youtube_batch로 배치 요청 (검색마다 속도 제한)
+    - 첫 회차는 이미 캐시에 있는 키워드를 건너뛰고, 이후 interval초마다 캐시를 무시하고 새로 고칩니다.
+    API 키가 없는 서비스는 건너뜁니다. 실패한 키워드는 다음 회차에 다시 시도합니다.
+    """
+
+    def __init__(self, keywords, workers=DEFAULT_WORKERS, interval=DEFAULT_INTERVAL,
+                 work24_rate=DEFAULT_WORK24_RATE, youtube_rate=DEFAULT_YOUTUBE_RATE):
+        self.keywords = list(dict.fromkeys(keywords))
+        self.workers = max(int(workers), 1)
+        self.interval = interval
+        self.work24_limiter = RateLimiter(work24_rate)
+        self.youtube_limiter = RateLimiter(youtube_rate)
+        self._stats = {"rounds": 0, "last_round_s": None, "work24_failed": 0, "youtube_failed": 0}
+        self._stats_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="related-prefetch", daemon=True)
+
+    @classmethod
+    def from_env(cls, keywords):
+        """환경 변수 설정으로 만듭니다."""
+        return cls(
+            keywords,
+            workers=int(os.getenv(PREFETCH_WORKERS_ENV, DEFAULT_WORKERS)),
+            interval=float(os.getenv(PREFETCH_INTERVAL_ENV, DEFAULT_INTERVAL)),
+            work24_rate=float(os.getenv(WORK24_RATE_ENV, DEFAULT_WORK24_RATE)),
+            youtube_rate=float(os.getenv(YOUTUBE_RATE_ENV, DEFAULT_YOUTUBE_RATE)),
+        )
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stats(self):
+        """완료한 회차 수, 마지막 회차 소요 시간(초, 첫 회차 전에는 None), 서비스별 실패 횟수를 반환합니다."""
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def stop(self):
+        """진행 중인 회차를 멈춥니다 (남은 요청은 보내지 않음)."""
+        self._stop.set()
+
+    def _run(self):
+        refresh = False
+        while not self._stop.is_set():
+            try:
+                self.run_round(refresh)
+            except FetchCancelled:
+                break
+            refresh = True
+            if self.interval <= 0 or self._stop.wait(self.interval):
+                break
+
+    def run_round(self, refresh=False):
+        """
+        모든 키워드의 관련 정보를 한 번 가져옵니다.
+        refresh가 False이면 캐시에 있는 키워드는 건너뜁니다.
+        """
+        start = time.perf_counter()
+        work24_key = os.getenv("YOUR_WORK24_API_KEY", "")
+        youtube_key = os.getenv("YOUR_YOUTUBE_API_KEY", "")
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="related-prefetch") as pool:
+            futures = {}  # Future -> (실패 통계 키, 로그에 남길 작업 이름)
+            if youtube_key:
+                futures[pool.submit(self._prefetch_youtube, refresh)] = ("youtube_failed", "YouTube 미리 가져오기")
+            if work24_key:
+                for keyword in self.keywords:
+                    future = pool.submit(self._prefetch_work24, keyword, work24_key, refresh)
+                    futures[future] = ("work24_failed", f"고용24 미리 가져오기 ({keyword})")
+
+            # 작업 안에서 처리하지 못한 예외도 결과를 확인하여 실패로 기록 (다음 회차에 다시 시도)
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    stat_key, task_name = futures[future]
+                    with self._stats_lock:
+                        self._stats[stat_key] += 1
+                    logging.warning(f"{task_name} 실패: {e}")
+
+        if self._stop.is_set():
+            raise FetchCancelled("prefetch stopped")
+        with self._stats_lock:
+            self._stats["rounds"] += 1
+            self._stats["last_round_s"] = time.perf_counter() - start
+
+    def _prefetch_work24(self, keyword, api_key, refresh):
+        try:
+            search_work24_courses(
+                keyword, api_key, use_cache=not refresh, cancelled=self._stop, rate_limiter=self.work24_limiter
+            )
+        except FetchCancelled:
+            pass
+        except (requests.exceptions.RequestException, ET.ParseError) as e:
+            with self._stats_lock:
+                self._stats["work24_failed"] += 1
+            logging.warning(f"고용24 미리 가져오기 실패 ({keyword}): {e}")
+
+    def _prefetch_youtube(self, refresh):
+        try:
+            results = yt.search_youtube_batch(
+                [yt.related_video_query(keyword) for keyword in self.keywords],
+                yt.RELATED_VIDEO_COUNT,
+                use_cache=not refresh,
+                rate_limiter=self.youtube_limiter,
+                cancelled=self._stop,
+            )
+        except FetchCancelled:
+            return
+        with self._stats_lock:
+            self._stats["youtube_failed"] += sum(videos is None for videos in results.values())
+
+
+_prefetcher = None
+_prefetch_version = None
+_prefetch_lock = threading.Lock()
+
+
+def ensure_related_prefetch(data_version, keywords_for):
+    """
+    데이터 버전마다 한 번 관련 정보 미리 가져오기를 시작합니다 (서버 시작, 데이터 다시 로드).
+    데이터 버전이 바뀌면 이전 작업을 멈추고 새 상위 스킬로 다시 시작합니다.
+
+    Args:
+        data_version: 데이터 파일 버전 (바뀌면 다시 시작).
+        keywords_for: 상위 스킬 수 N을 받아 미리 가져올 키워드 목록을 반환하는 함수.
+            버전이 바뀌었을 때만 호출합니다.
+
+    Returns:
+        실행 중인 RelatedPrefetcher. RELATED_PREFETCH가 꺼져 있으면 None.
+    """
+    global _prefetcher, _prefetch_version
+    if not prefetch_enabled():
+        return None
+    with _prefetch_lock:
+        if _prefetcher is not None and _prefetch_version == data_version:
+            return _prefetcher
+        if _prefetcher is not None:
+            _prefetcher.stop()
+        keywords = keywords_for(int(os.getenv(PREFETCH_TOP_N_ENV, DEFAULT_TOP_N)))
+        _prefetcher = RelatedPrefetcher.from_env(keywords).start()
+        _prefetch_version = data_version
+        return _prefetcher
+
+
+def get_related_prefetcher():
+    """실행 중인 RelatedPrefetcher (없으면 None)."""
+    return _prefetcher
@@ -1,40 +1,258 @@
 import streamlit as st
 import requests
+import threading
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 import pandas as pd
 import streamlit.components.v1 as components
 import urllib.parse
 import os
+from src.dashboard.search.cache import get_response_cache
+from src.dashboard.search.background import FetchCancelled, get_background_fetcher
 
-# 고용24 오픈 API 기본 URL
+# 고용24 오픈 API 기본 URL (로컬 테스트 서버 등으로 바꿀 때는 WORK24_API_URL 환경 변수 사용)
 BASE_URL = "https://www.work24.go.kr/cm/openApi/call/hr/callOpenApiSvcInfo310L01.do"
 
+# 페이지 요청 설정
+REQUEST_TIMEOUT = (3.05, 10)  # (연결, 읽기) 타임아웃 초
+MAX_CONCURRENT_PAGES = 4      # 2페이지 이후를 동시에 요청할 최대 스레드 수
+RETRY_TOTAL = 3               # 연결 오류 및 429/5xx 응답 재시도 횟수
+RETRY_BACKOFF = 0.5           # 재시도 간격 (0.5초, 1초, 2초 ...)
 
-def fetch_work24_data(keyword, max_pages=7):
-    api_key = os.getenv("YOUR_WORK24_API_KEY", "")
-    
+# 응답 캐시 네임스페이스
+CACHE_NAMESPACE = "work24"
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_work24_session():
     """
-    고용24 API를 호출하여 훈련과정 정보를 가져옵니다.
+    고용24 API 호출에 사용할 프로세스 공용 requests.Session을 반환합니다.
+    keep-alive 연결 풀과 재시도(지수 백오프) 설정을 한 번만 만들어 재사용합니다.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=RETRY_TOTAL,
+                backoff_factor=RETRY_BACKOFF,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(["GET"]),
+            )
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_CONCURRENT_PAGES, max_retries=retry)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+# 고용24 응답 XML에서 사용하는 항목 태그
+ITEM_FIELDS = ("title", "subTitle", "traStartDate", "traEndDate", "address")  # TrainingCourse 필드 순서
+MISSING = "정보 없음"
+
+
+@dataclass(slots=True, frozen=True)
+class TrainingCourse:
+    """고용24 훈련과정 한 건 (응답 XML의 scn_list 요소)."""
+    title: str | None
+    institution: str | None
+    start_date: str | None
+    end_date: str | None
+    address: str | None
+
+
+@lru_cache(maxsize=4096)
+def _parse_ymd(value):
+    """'YYYYMMDD' 문자열을 datetime으로 변환합니다. 같은 날짜 문자열은 한 번만 파싱합니다."""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y%m%d")
+    except (ValueError, TypeError):
+        return None
+
+
+def _clean(value):
+    """요소 텍스트의 앞뒤 공백을 제거하고, 비어 있으면 None을 반환합니다."""
+    if value is None:
+        return None
+    value = value.strip()
+    return value or None
+
+
+def parse_work24_page(content):
+    """
+    응답 XML 바이트를 파싱하여 각 scn_list 요소를 한 번만 읽어 훈련과정 레코드로 만듭니다.
+    이후 필터링, 중복 제거, 정렬은 XML 트리가 아닌 레코드 목록에서 처리합니다.
+
+    Returns:
+        (total_results, courses) 튜플. total_results는 scn_cnt 값 (없으면 0).
+    """
+    root = ET.fromstring(content)
+    total_text = root.findtext('.//scn_cnt')
+    total_results = int(total_text) if total_text and total_text.isdigit() else 0
+    # 직계 자식 요소의 텍스트만 읽음 (요소는 있지만 텍스트가 없으면 "")
+    courses = [
+        TrainingCourse(*[item.findtext(tag) for tag in ITEM_FIELDS])
+        for item in root.iterfind('.//srchList/scn_list')
+    ]
+    return total_results, courses
+
+
+def select_training_courses(courses, keyword):
+    """
+    과정명에 키워드가 포함된 과정만 남기고, (과정명, 기관명)이 같은 과정은 종료일이 가장 늦은 것만 유지한 뒤
+    시작일 기준 내림차순으로 정렬합니다. 레코드 목록을 한 번만 순회합니다.
     """
-    if not api_key:
-        st.warning("고용24 API 키가 입력되지 않았습니다. 사이드바에서 API 키를 입력해주세요.")
-        return []
-    
-    # 키워드가 없으면 빈 결과 반환
-    if not keyword:
-        return []
-    
-    # 검색어 준비
     keyword_lower = keyword.lower()
-    
-    # 날짜 범위 설정
+    unique_trainings = {}
+
+    for course in courses:
+        # 키워드 필터링
+        if keyword_lower not in (course.title or "").lower():
+            continue
+
+        # 중복 판단 기준 키 생성
+        duplicate_key = ((_clean(course.title) or MISSING).lower(), (_clean(course.institution) or MISSING).lower())
+        current_end_date = _parse_ymd(_clean(course.end_date))
+
+        # 중복 관리: 종료일자가 더 늦은 과정으로 교체
+        stored = unique_trainings.get(duplicate_key)
+        if stored is None:
+            unique_trainings[duplicate_key] = (course, current_end_date)
+        elif current_end_date is not None and (stored[1] is None or current_end_date > stored[1]):
+            unique_trainings[duplicate_key] = (course, current_end_date)
+
+    # 훈련 시작일자 기준으로 내림차순 정렬
+    selected = [course for course, _ in unique_trainings.values()]
+    selected.sort(key=lambda course: _parse_ymd(_clean(course.start_date)) or datetime.min, reverse=True)
+    return selected
+
+
+def _format_date(value):
+    """'YYYYMMDD'를 'YYYY-MM-DD'로 변환합니다. 형식이 다르면 원래 값을 그대로 사용합니다."""
+    value = _clean(value)
+    if value is None:
+        return MISSING
+    parsed = _parse_ymd(value)
+    return parsed.strftime("%Y-%m-%d") if parsed else value
+
+
+def format_training_courses(courses):
+    """훈련과정 레코드를 화면 표시용 딕셔너리 목록으로 변환합니다."""
+    return [
+        {
+            "과정명": _clean(course.title) or MISSING,
+            "기관명": _clean(course.institution) or MISSING,
+            "시작일": _format_date(course.start_date),
+            "종료일": _format_date(course.end_date),
+            "소재지": _clean(course.address) or MISSING,
+        }
+        for course in courses
+    ]
+
+
+def _fetch_page(session, base_url, params, page_num):
+    """페이지 하나를 요청하여 (전체 결과 수, 훈련과정 레코드 목록)을 반환합니다."""
+    page_params = dict(params, pageNum=str(page_num))
+    response = session.get(base_url, params=page_params, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return parse_work24_page(response.content)
+
+
+def fetch_work24_pages(params, max_pages, session=None, base_url=None, on_page_done=None, cancelled=None,
+                       rate_limiter=None):
+    """
+    고용24 API의 검색 결과 페이지를 가져옵니다.
+
+    1페이지에서 전체 결과 수(scn_cnt)를 확인한 뒤, 필요한 나머지 페이지(2..N)는
+    스레드 풀에서 동시에 요청합니다. Streamlit 호출은 하지 않으므로 진행 상황은
+    on_page_done(완료 페이지 수, 전체 페이지 수) 콜백으로 알립니다 (호출 스레드에서 실행됨).
+
+    Args:
+        params (dict): pageNum을 제외한 API 요청 파라미터 (pageSize 포함).
+        max_pages (int): 가져올 최대 페이지 수.
+        session (requests.Session, optional): 사용할 세션. 기본값은 get_work24_session().
+        base_url (str, optional): API URL. 기본값은 WORK24_API_URL 환경 변수 또는 BASE_URL.
+        on_page_done (callable, optional): 페이지가 완료될 때마다 호출되는 콜백.
+        cancelled (threading.Event, optional): 설정되면 아직 시작하지 않은 페이지 요청을 건너뛰고
+            FetchCancelled를 발생시킵니다 (백그라운드 검색 취소).
+        rate_limiter (RateLimiter, optional): 페이지 요청마다 acquire()하여 초당 요청 수를 제한합니다.
+
+    Returns:
+        (total_results, courses) 튜플. courses는 페이지 순서대로 이어 붙인 TrainingCourse 목록입니다.
+    """
+    session = session or get_work24_session()
+    base_url = base_url or os.getenv("WORK24_API_URL", BASE_URL)
+    page_size = int(params.get("pageSize", 100))
+
+    def fetch_page(page_num):
+        if cancelled is not None and cancelled.is_set():
+            raise FetchCancelled(page_num)
+        if rate_limiter is not None:
+            rate_limiter.acquire(cancelled)
+        return _fetch_page(session, base_url, params, page_num)
+
+    total_results, first_page = fetch_page(1)
+    if total_results == 0:
+        return 0, first_page
+
+    page_count = min(max_pages, -(-total_results // page_size))
+    pages = {1: first_page}
+    if on_page_done:
+        on_page_done(1, page_count)
+
+    if page_count > 1:
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_PAGES, page_count - 1)) as executor:
+            futures = {
+                executor.submit(fetch_page, page_num): page_num
+                for page_num in range(2, page_count + 1)
+            }
+            for future in as_completed(futures):
+                pages[futures[future]] = future.result()[1]
+                if on_page_done:
+                    on_page_done(len(pages), page_count)
+
+    return total_results, [course for page_num in sorted(pages) for course in pages[page_num]]
+
+
+def _search_window():
+    """검색 기간 (내일부터 1년 뒤까지)을 'YYYYMMDD' 문자열 튜플로 반환합니다."""
     today = datetime.now()
     tomorrow = today + timedelta(days=1)
     one_year_later = today + timedelta(days=365)
-    start_date_filter = tomorrow.strftime("%Y%m%d")
-    end_date_filter = one_year_later.strftime("%Y%m%d")
-    
+    return tomorrow.strftime("%Y%m%d"), one_year_later.strftime("%Y%m%d")
+
+
+def work24_cache_key(keyword, max_pages):
+    """키워드와 검색 기간으로 응답 캐시 키를 만듭니다."""
+    start_date_filter, end_date_filter = _search_window()
+    return get_response_cache().make_key(keyword.lower(), max_pages, start_date_filter, end_date_filter)
+
+
+def search_work24_courses(keyword, api_key, max_pages=7, on_page_done=None, use_cache=True, cancelled=None,
+                          rate_limiter=None):
+    """
+    고용24 API로 훈련과정을 검색하여 표시용 딕셔너리 목록을 반환합니다.
+    Streamlit을 호출하지 않으므로 백그라운드 스레드에서도 사용할 수 있습니다.
+    성공한 결과는 응답 캐시에 저장합니다. 요청/파싱 오류와 취소(FetchCancelled)는 호출 측으로 전달됩니다.
+    """
+    cache = get_response_cache()
+    cache_key = work24_cache_key(keyword, max_pages)
+    if use_cache:
+        hit, cached_results = cache.get(CACHE_NAMESPACE, cache_key)
+        if hit:
+            return cached_results
+
+    start_date_filter, end_date_filter = _search_window()
+
     # API 호출을 위한 파라미터 설정
     params = {
         "authKey": api_key,
@@ -48,145 +266,49 @@ def fetch_work24_data(keyword, max_pages=7):
         "sort": "ASC",
         "sortCol": "TRNG_BGDE",
     }
+
+    total_results, courses = fetch_work24_pages(
+        params, max_pages, on_page_done=on_page_done, cancelled=cancelled, rate_limiter=rate_limiter
+    )
+    if total_results == 0:
+        return []
+
+    result_list = format_training_courses(select_training_courses(courses, keyword))
+    cache.set(CACHE_NAMESPACE, cache_key, result_list)
+    return result_list
+
+
+def fetch_work24_data(keyword, max_pages=7):
+    api_key = os.getenv("YOUR_WORK24_API_KEY", "")
+    
+    """
+    고용24 API를 호출하여 훈련과정 정보를 가져옵니다.
+    """
+    if not api_key:
+        st.warning("고용24 API 키가 입력되지 않았습니다. 사이드바에서 API 키를 입력해주세요.")
+        return []
+    
+    # 키워드가 없으면 빈 결과 반환
+    if not keyword:
+        return []
+    
+    # 같은 키워드/기간의 결과가 캐시에 있으면 API를 호출하지 않음
+    hit, cached_results = get_response_cache().get(CACHE_NAMESPACE, work24_cache_key(keyword, max_pages))
+    if hit:
+        return cached_results
     
     with st.spinner("고용24 데이터를 불러오는 중..."):
-        all_fetched_items = []
-        
-        pageNum = 1
         progress_bar = st.progress(0)
         
         try:
-            while pageNum <= max_pages:
-                params['pageNum'] = str(pageNum)
-                
-                response = requests.get(BASE_URL, params=params)
-                response.raise_for_status()
-                
-                root = ET.fromstring(response.text)
-                
-                # 총 결과 수 (첫 페이지에서만 확인)
-                if pageNum == 1:
-                    scn_cnt_element = root.find('.//scn_cnt')
-                    total_results = int(scn_cnt_element.text) if scn_cnt_element is not None and scn_cnt_element.text.isdigit() else 0
-                    if total_results == 0:
-                        st.warning("API 호출 결과가 없습니다. 검색 조건을 다시 확인하세요.")
-                        return []
-                
-                # 현재 페이지의 아이템 목록 찾기
-                current_page_items = root.findall('.//srchList/scn_list')
-                all_fetched_items.extend(current_page_items)
-                
-                # 진행 상황 업데이트
-                progress_percentage = min(pageNum / max_pages, 1.0)
-                progress_bar.progress(progress_percentage)
-                
-                # 다음 페이지가 있는지 확인
-                if len(current_page_items) < int(params['pageSize']):
-                    break
-                
-                pageNum += 1
-            
-            progress_bar.progress(1.0)
-            progress_bar.empty()  # ✅ 진행바 제거!
-            
-            # 키워드 필터링
-            keyword_filtered_items = []
-            for item in all_fetched_items:
-                trainning_nm_element = item.find('title')
-                trainning_nm = trainning_nm_element.text if trainning_nm_element is not None else ""
-                
-                if keyword_lower in trainning_nm.lower():
-                    keyword_filtered_items.append(item)
-            
-            # 중복 제거 및 종료일자 기준 선택
-            unique_trainings = {}
-            
-            for item in keyword_filtered_items:
-                # 상세 정보 추출
-                trainning_nm_element = item.find('title')
-                inst_nm_element = item.find('subTitle')
-                end_dt_element = item.find('traEndDate')
-                
-                trainning_nm = trainning_nm_element.text.strip() if trainning_nm_element is not None and trainning_nm_element.text else "정보 없음"
-                inst_nm = inst_nm_element.text.strip() if inst_nm_element is not None and inst_nm_element.text else "정보 없음"
-                end_dt_str = end_dt_element.text.strip() if end_dt_element is not None and end_dt_element.text else None
-                
-                # 중복 판단 기준 키 생성
-                duplicate_key = (trainning_nm.lower(), inst_nm.lower())
-                
-                # 종료일자 파싱 시도
-                current_end_date = None
-                if end_dt_str:
-                    try:
-                        current_end_date = datetime.strptime(end_dt_str, "%Y%m%d")
-                    except (ValueError, TypeError):
-                        pass
-                
-                # 중복 관리
-                if duplicate_key not in unique_trainings:
-                    unique_trainings[duplicate_key] = {'item': item, 'end_date': current_end_date}
-                else:
-                    stored_info = unique_trainings[duplicate_key]
-                    stored_end_date = stored_info['end_date']
-                    
-                    if (current_end_date is not None) and \
-                        (stored_end_date is None or current_end_date > stored_end_date):
-                        unique_trainings[duplicate_key] = {'item': item, 'end_date': current_end_date}
-            
-            final_trainings_list = [info['item'] for info in unique_trainings.values()]
-            
-            # 훈련 시작일자 기준으로 내림차순 정렬
-            def get_start_date(item_element):
-                start_dt_element = item_element.find('traStartDate')
-                start_dt_str = start_dt_element.text.strip() if start_dt_element is not None and start_dt_element.text else None
-                if start_dt_str:
-                    try:
-                        return datetime.strptime(start_dt_str, "%Y%m%d")
-                    except (ValueError, TypeError):
-                        pass
-                return datetime.min
-            
-            final_trainings_list.sort(key=get_start_date, reverse=True)
-            
-            # 훈련과정 정보 추출
-            result_list = []
-            for item in final_trainings_list:
-                training_nm_element = item.find('title')
-                inst_nm_element = item.find('subTitle')
-                bgng_dt_element = item.find('traStartDate')
-                end_dt_element = item.find('traEndDate')
-                lctn_nm_element = item.find('address')
-                
-                training_nm = training_nm_element.text.strip() if training_nm_element is not None and training_nm_element.text else "정보 없음"
-                inst_nm = inst_nm_element.text.strip() if inst_nm_element is not None and inst_nm_element.text else "정보 없음"
-                bgng_dt = bgng_dt_element.text.strip() if bgng_dt_element is not None and bgng_dt_element.text else "정보 없음"
-                end_dt = end_dt_element.text.strip() if end_dt_element is not None and end_dt_element.text else "정보 없음"
-                lctn_nm = lctn_nm_element.text.strip() if lctn_nm_element is not None and lctn_nm_element.text else "정보 없음"
-                
-                # 날짜 형식 변환
-                formatted_bgng_dt = bgng_dt
-                formatted_end_dt = end_dt
-                if bgng_dt != "정보 없음":
-                    try:
-                        formatted_bgng_dt = datetime.strptime(bgng_dt, "%Y%m%d").strftime("%Y-%m-%d")
-                    except ValueError:
-                        pass
-                
-                if end_dt != "정보 없음":
-                    try:
-                        formatted_end_dt = datetime.strptime(end_dt, "%Y%m%d").strftime("%Y-%m-%d")
-                    except ValueError:
-                        pass
-                
-                result_list.append({
-                    "과정명": training_nm,
-                    "기관명": inst_nm,
-                    "시작일": formatted_bgng_dt,
-                    "종료일": formatted_end_dt,
-                    "소재지": lctn_nm
-                })
-            
-            return result_list
+            # 1페이지 이후의 페이지는 동시에 요청하고, 완료될 때마다 진행바 갱신
+            return search_work24_courses(
+                keyword,
+                api_key,
+                max_pages,
+                on_page_done=lambda done, total: progress_bar.progress(min(done / total, 1.0)),
+                use_cache=False
+            )
             
         except requests.exceptions.RequestException as e:
             st.error(f"API 호출 중 오류 발생: {e}")
@@ -194,9 +316,51 @@ def fetch_work24_data(keyword, max_pages=7):
             st.error(f"API 응답 파싱 중 오류 발생: {e}")
         except Exception as e:
             st.error(f"예기치 않은 오류 발생: {e}")
+        finally:
+            progress_bar.empty()  # ✅ 진행바 제거!
         
         return []
 
+def start_work24_fetch(keyword, max_pages=7):
+    """
+    고용24 훈련과정 검색을 백그라운드 스레드에서 시작하고 FetchJob을 반환합니다.
+    캐시에 결과가 있으면 바로 완료된 작업을, API 키나 키워드가 없으면 None을 반환합니다.
+    결과는 work24_fetch_results()로 꺼냅니다.
+    """
+    api_key = os.getenv("YOUR_WORK24_API_KEY", "")
+    if not api_key or not keyword:
+        return None
+
+    fetcher = get_background_fetcher()
+    cache_key = work24_cache_key(keyword, max_pages)
+    hit, cached_results = get_response_cache().get(CACHE_NAMESPACE, cache_key)
+    if hit:
+        return fetcher.completed((CACHE_NAMESPACE, cache_key), cached_results)
+    return fetcher.submit(
+        (CACHE_NAMESPACE, cache_key), search_work24_courses, keyword, api_key, max_pages, use_cache=False
+    )
+
+
+def work24_fetch_results(job):
+    """
+    완료된 고용24 검색 작업의 결과를 반환합니다.
+    작업이 없으면(API 키 없음) fetch_work24_data와 같은 경고를, 오류가 있으면 오류를 표시하고 빈 목록을 반환합니다.
+    """
+    if job is None:
+        if not os.getenv("YOUR_WORK24_API_KEY", ""):
+            st.warning("고용24 API 키가 입력되지 않았습니다. 사이드바에서 API 키를 입력해주세요.")
+        return []
+
+    try:
+        return job.future.result()
+    except requests.exceptions.RequestException as e:
+        st.error(f"API 호출 중 오류 발생: {e}")
+    except ET.ParseError as e:
+        st.error(f"API 응답 파싱 중 오류 발생: {e}")
+    except Exception as e:
+        st.error(f"예기치 않은 오류 발생: {e}")
+    return []
+
 # web_search_work24.py 파일의 render_work24_results_table 함수를 수정합니다
 
 # 검색어를 고용24에서 새 탭으로 열 수 있는 버튼 추가
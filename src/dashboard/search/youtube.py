@@ -1,57 +1,152 @@
 import googleapiclient.discovery
+import googleapiclient.errors
+import httplib2
 import os
+import threading
 from dotenv import load_dotenv
+from src.dashboard.search.cache import get_response_cache
+from src.dashboard.search.background import FetchCancelled, get_background_fetcher
 
 # .env 파일에서 환경 변수를 로드합니다.
 # 이 함수는 스크립트의 시작 부분에서 한 번만 호출하면 됩니다.
 load_dotenv()
 
-def search_youtube(query, max_results=10):
+# 응답 캐시 네임스페이스
+CACHE_NAMESPACE = "youtube"
+
+# 배치 요청 하나에 담을 최대 검색 수
+BATCH_MAX_REQUESTS = 50
+
+# 관련 정보 패널의 YouTube 검색 (키워드 + " Tutorial", 결과 3개)
+RELATED_VIDEO_COUNT = 3
+
+_clients = {}  # API 키 -> YouTube Resource 객체
+_clients_lock = threading.Lock()
+_client_factory = None  # None이면 _build_client 사용 (테스트에서 교체)
+_thread_local = threading.local()
+
+
+def _build_client(api_key):
+    """
+    YouTube Data API 클라이언트를 만듭니다.
+    라이브러리에 포함된 discovery 문서(static_discovery)를 사용하므로 네트워크 요청이 없습니다.
+    """
+    return googleapiclient.discovery.build(
+        "youtube", "v3", developerKey=api_key, static_discovery=True, cache_discovery=False
+    )
+
+
+def get_youtube_client(api_key=None):
+    """
+    API 키별로 한 번만 만든 프로세스 공용 YouTube 클라이언트를 반환합니다.
+    discovery 문서 파싱은 처음 호출할 때만 일어납니다.
+
+    Args:
+        api_key (str, optional): API 키. 기본값은 YOUR_YOUTUBE_API_KEY 환경 변수.
+    """
+    if api_key is None:
+        api_key = os.getenv("YOUR_YOUTUBE_API_KEY")
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            client = (_client_factory or _build_client)(api_key)
+            _clients[api_key] = client
+        return client
+
+
+def set_youtube_client_factory(factory):
+    """
+    클라이언트 생성 함수를 교체하고 기존 클라이언트를 모두 버립니다 (오프라인 테스트용).
+    factory(api_key)는 googleapiclient Resource와 같은 인터페이스의 객체를 반환해야 합니다.
+    예: lambda key: build("youtube", "v3", developerKey=key, http=HttpMock(...))
+    None을 넘기면 기본 생성 함수로 되돌립니다.
+    """
+    global _client_factory
+    with _clients_lock:
+        _client_factory = factory
+        _clients.clear()
+
+
+def _execute(request):
+    """
+    요청을 실행합니다.
+    httplib2.Http는 스레드 간에 공유할 수 없으므로, 기본 클라이언트는 스레드별 Http 객체로 실행합니다.
+    교체된 클라이언트(테스트용 HttpMock 등)는 클라이언트에 설정된 http를 그대로 사용합니다.
+    """
+    if _client_factory is not None:
+        return request.execute()
+    http = getattr(_thread_local, "http", None)
+    if http is None:
+        http = _thread_local.http = httplib2.Http(timeout=10)
+    return request.execute(http=http)
+
+
+def _search_request(client, query, max_results):
+    """검색 요청 객체를 만듭니다 (아직 실행하지 않음)."""
+    return client.search().list(
+        part="snippet", # 결과에서 'snippet' 부분을 가져옴 (제목, 설명 등 포함)
+        q=query,       # 검색 키워드
+        type="video",  # 검색할 리소스 타입 (동영상)
+        maxResults=max_results # 가져올 최대 결과 개수
+    )
+
+
+def _parse_videos(response):
+    """검색 응답에서 동영상 정보(제목, 설명, 동영상 ID) 목록을 추출합니다."""
+    videos = []
+    for item in response.get("items", []):
+        # 동영상 타입 결과만 처리
+        if item["id"]["kind"] == "youtube#video":
+            videos.append({
+                "title": item["snippet"]["title"],
+                "description": item["snippet"]["description"],
+                "video_id": item["id"]["videoId"]
+            })
+    return videos
+
+
+def related_video_query(keyword):
+    """관련 정보 패널에서 키워드로 검색할 YouTube 검색어."""
+    return f"{keyword} Tutorial"
+
+
+def youtube_cache_key(query, max_results):
+    """검색어와 결과 개수로 응답 캐시 키를 만듭니다."""
+    return get_response_cache().make_key(query, max_results)
+
+
+def search_youtube(query, max_results=10, use_cache=True, cancelled=None):
     """
     YouTube Data API를 사용하여 동영상을 검색합니다.
 
     Args:
         query (str): 검색할 키워드.
         max_results (int): 가져올 최대 검색 결과 개수.
+        use_cache (bool): False이면 캐시를 확인하지 않고 API를 호출합니다 (결과는 저장).
+        cancelled (threading.Event, optional): 백그라운드 검색 취소 신호.
+            요청 하나로 끝나므로 시작 전에만 확인합니다.
 
     Returns:
         list: 검색 결과 동영상의 리스트 (제목, 설명, 동영상 ID 포함),
         또는 오류 발생 시 None.
     """
 
-    API_KEY = os.getenv("YOUR_YOUTUBE_API_KEY")
+    # 같은 검색어의 결과가 캐시에 있으면 API를 호출하지 않음 (검색 1회당 100 쿼터 절약)
+    cache = get_response_cache()
+    cache_key = youtube_cache_key(query, max_results)
+    if use_cache:
+        hit, cached_videos = cache.get(CACHE_NAMESPACE, cache_key)
+        if hit:
+            return cached_videos
+    if cancelled is not None and cancelled.is_set():
+        raise FetchCancelled(query)
     
     try:
-        # API 서비스 빌드
-        # youtube 변수는 googleapiclient.discovery.build로 생성된 Resource 객체입니다.
-        youtube = googleapiclient.discovery.build(
-            "youtube", "v3", developerKey=API_KEY
-        )
-
-        # 검색 요청 실행:
-        # youtube 객체의 search() 리소스에 접근하고, list() 메서드를 호출해야 합니다.
-        # --- 수정된 부분 ---
-        request = youtube.search().list(
-        # ------------------
-            part="snippet", # 결과에서 'snippet' 부분을 가져옴 (제목, 설명 등 포함)
-            q=query,       # 검색 키워드
-            type="video",  # 검색할 리소스 타입 (동영상)
-            maxResults=max_results # 가져올 최대 결과 개수
-        )
-        response = request.execute()
-
-        videos = []
-        # 검색 결과 파싱
-        for item in response.get("items", []):
-            # 동영상 타입 결과만 처리
-            if item["id"]["kind"] == "youtube#video":
-                video_info = {
-                    "title": item["snippet"]["title"],
-                    "description": item["snippet"]["description"],
-                    "video_id": item["id"]["videoId"]
-                }
-                videos.append(video_info)
+        response = _execute(_search_request(get_youtube_client(), query, max_results))
+        videos = _parse_videos(response)
 
+        # 오류(None)는 캐시하지 않고, 성공한 결과만 저장
+        cache.set(CACHE_NAMESPACE, cache_key, videos)
         return videos
 
     except googleapiclient.errors.HttpError as e:
@@ -63,6 +158,81 @@ def search_youtube(query, max_results=10):
         return None
 
 
+def start_youtube_fetch(query, max_results=10):
+    """
+    YouTube 검색을 백그라운드 스레드에서 시작하고 FetchJob을 반환합니다.
+    캐시에 결과가 있으면 바로 완료된 작업을 반환합니다. 작업 결과는 search_youtube와 같습니다.
+    """
+    fetcher = get_background_fetcher()
+    cache_key = youtube_cache_key(query, max_results)
+    hit, cached_videos = get_response_cache().get(CACHE_NAMESPACE, cache_key)
+    if hit:
+        return fetcher.completed((CACHE_NAMESPACE, cache_key), cached_videos)
+    return fetcher.submit((CACHE_NAMESPACE, cache_key), search_youtube, query, max_results, use_cache=False)
+
+
+def search_youtube_batch(queries, max_results=10, use_cache=True, rate_limiter=None, cancelled=None):
+    """
+    여러 검색어를 한 번에 검색합니다 (미리 가져오기용).
+    캐시에 없는 검색어만 HTTP 배치 요청 하나로 묶어 보내고, 결과는 캐시에 저장합니다.
+    배치 요청 자체가 실패하면 검색어별로 search_youtube를 호출합니다.
+
+    Args:
+        queries (list[str]): 검색할 키워드 목록.
+        max_results (int): 검색어별 최대 검색 결과 개수.
+        use_cache (bool): False이면 캐시를 확인하지 않고 모두 다시 검색합니다 (새로 고침).
+        rate_limiter (RateLimiter, optional): 검색 하나마다 acquire()하여 초당 검색 수를 제한합니다
+            (배치 안의 검색도 쿼터는 하나씩 소모됨).
+        cancelled (threading.Event, optional): 설정되면 남은 검색을 보내지 않고 FetchCancelled를 발생시킵니다.
+
+    Returns:
+        dict: 검색어 -> 동영상 리스트 (해당 검색어에서 오류 발생 시 None).
+    """
+    cache = get_response_cache()
+    results = {}
+    pending = []
+    for query in dict.fromkeys(queries):
+        hit, cached_videos = cache.get(CACHE_NAMESPACE, cache.make_key(query, max_results)) if use_cache else (False, None)
+        if hit:
+            results[query] = cached_videos
+        else:
+            pending.append(query)
+
+    def on_response(request_id, response, exception):
+        query = pending[int(request_id)]
+        if exception is not None:
+            print(f"API 호출 중 오류 발생 ({query}): {exception}")
+            results[query] = None
+            return
+        videos = _parse_videos(response)
+        cache.set(CACHE_NAMESPACE, cache.make_key(query, max_results), videos)
+        results[query] = videos
+
+    try:
+        client = get_youtube_client()
+        for start in range(0, len(pending), BATCH_MAX_REQUESTS):
+            batch = client.new_batch_http_request(callback=on_response)
+            for i in range(start, min(start + BATCH_MAX_REQUESTS, len(pending))):
+                if rate_limiter is not None:
+                    rate_limiter.acquire(cancelled)
+                batch.add(_search_request(client, pending[i], max_results), request_id=str(i))
+            _execute(batch)
+    except FetchCancelled:
+        raise
+    except Exception as e:
+        print(f"배치 요청 실패, 개별 검색으로 전환합니다: {e}")
+        for query in pending:
+            if query not in results:
+                # 속도 제한이 없어도 검색마다 취소 여부를 확인 (검색 1회당 100 쿼터)
+                if cancelled is not None and cancelled.is_set():
+                    raise FetchCancelled(query)
+                if rate_limiter is not None:
+                    rate_limiter.acquire(cancelled)
+                results[query] = search_youtube(query, max_results, use_cache=use_cache, cancelled=cancelled)
+
+    return {query: results.get(query) for query in queries}
+
+
 
 
 # # --- 테스트를 위한 메인 실행 부분 ---
@@ -0,0 +1,221 @@
+import re
+import numpy as np
+import pandas as pd
+from src.dashboard.trigram_index import TrigramIndex
+
+# 직무명 토큰 분리 기준: 단어 문자와 '#', '+'(C#, C++ 등)를 제외한 모든 문자
+POSITION_TOKEN_PATTERN = re.compile(r"[^\w#+]+")
+
+# filter_data에서 지원하는 매칭 방식
+MATCH_SUBSTRING = "substring"  # 부분 문자열 일치 (기존 동작)
+MATCH_EXACT = "exact"          # 토큰 단위 정확히 일치 ("C"가 "CSS"에, "Java"가 "JavaScript"에 매칭되지 않음)
+MATCH_FUZZY = "fuzzy"          # 오타 허용 ("kuberntes"가 "KUBERNETES"에 매칭, 트라이그램 색인 + 편집 거리)
+
+# 오타 허용 검색에서 검색어 하나가 매칭될 수 있는 최대 어휘 수
+FUZZY_MAX_TERMS = 50
+
+
+def _build_postings(tokens):
+    """
+    (행 번호를 인덱스로 갖는) 토큰 Series에서 토큰 -> 정렬된 행 번호 배열 역색인을 만듭니다.
+    같은 행에 같은 토큰이 여러 번 나와도 행 번호는 한 번만 기록됩니다.
+    """
+    if tokens.empty:
+        return {}
+    codes, vocab = pd.factorize(tokens.to_numpy())
+    return _postings_from_codes(tokens.index.to_numpy(dtype=np.int64), codes, np.asarray(vocab, dtype=object))
+
+
+def _postings_from_codes(row_ids, codes, vocab):
+    """
+    (행 번호, 토큰 코드) 쌍 배열에서 토큰 -> 정렬된 행 번호 배열 역색인을 만듭니다.
+    빈 문자열 토큰은 제외합니다.
+    """
+    if len(codes) == 0:
+        return {}
+
+    # 토큰 코드, 행 번호 순으로 정렬하여 토큰별 연속 구간으로 나눔
+    order = np.lexsort((row_ids, codes))
+    codes, row_ids = codes[order], row_ids[order]
+
+    # (토큰, 행) 중복 제거
+    keep = np.ones(len(codes), dtype=bool)
+    keep[1:] = (codes[1:] != codes[:-1]) | (row_ids[1:] != row_ids[:-1])
+    codes, row_ids = codes[keep], row_ids[keep]
+
+    boundaries = np.flatnonzero(np.diff(codes)) + 1
+    postings = dict(zip(vocab[codes[np.r_[0, boundaries]]], np.split(row_ids, boundaries)))
+    postings.pop("", None)
+    return postings
+
+
+def _union(postings):
+    """여러 행 번호 배열의 합집합 (정렬됨)."""
+    postings = [p for p in postings if len(p)]
+    if not postings:
+        return np.empty(0, dtype=np.int64)
+    if len(postings) == 1:
+        return postings[0]
+    return np.unique(np.concatenate(postings))
+
+
+def _intersect(postings):
+    """여러 행 번호 배열의 교집합 (정렬됨)."""
+    result = postings[0]
+    for posting in postings[1:]:
+        result = np.intersect1d(result, posting, assume_unique=True)
+    return result
+
+
+class SkillIndex:
+    """
+    데이터셋 한 개에 대한 역색인.
+
+    - skill_postings: 대문자 스킬 토큰 -> 해당 스킬을 가진 행 번호 배열
+    - position_postings: 소문자 직무 토큰 -> 행 번호 배열
+    - position_values: 소문자 직무명 전체 -> 행 번호 배열 (부분 문자열 검색용)
+
+    행 번호는 원본 데이터프레임의 위치(iloc) 기준입니다.
+    데이터셋이 로드될 때 한 번만 만들고, 이후 필터링은 어휘(vocabulary) 조회와
+    행 번호 배열 간 집합 연산으로 처리합니다.
+
+    오타 허용 검색과 자동 완성에 쓰는 어휘 트라이그램 색인(skill_vocab, position_vocab)은
+    처음 사용할 때 만듭니다.
+    """
+
+    def __init__(self, df, skill_tokens=None):
+        """
+        Args:
+            df: 색인할 데이터프레임.
+            skill_tokens: 컬럼형 캐시에서 읽은 사전 토큰화 스킬 (SkillTokens).
+                있으면 skill 컬럼 문자열을 다시 분리하지 않고 토큰 코드로 바로 색인합니다.
+        """
+        self.n_rows = len(df)
+
+        if skill_tokens is not None:
+            row_ids, token_codes = skill_tokens.row_token_pairs()
+            self.skill_postings = _postings_from_codes(row_ids, token_codes, skill_tokens.vocab)
+        else:
+            skills = self._string_column(df, "skill")
+            skill_tokens = skills.str.split(",").explode().dropna().str.strip().str.upper()
+            self.skill_postings = _build_postings(skill_tokens)
+
+        positions = self._string_column(df, "position").str.lower()
+        self.position_values = _build_postings(positions)
+        position_tokens = positions.str.split(POSITION_TOKEN_PATTERN).explode().dropna()
+        self.position_postings = _build_postings(position_tokens)
+
+        self._skill_vocab = None
+        self._position_vocab = None
+
+    @property
+    def skill_vocab(self):
+        """스킬 토큰 어휘의 트라이그램 색인 (빈도 = 공고 수)."""
+        if self._skill_vocab is None:
+            self._skill_vocab = TrigramIndex(
+                self.skill_postings.keys(), [len(rows) for rows in self.skill_postings.values()]
+            )
+        return self._skill_vocab
+
+    @property
+    def position_vocab(self):
+        """직무명 단어 어휘의 트라이그램 색인 (빈도 = 공고 수)."""
+        if self._position_vocab is None:
+            self._position_vocab = TrigramIndex(
+                self.position_postings.keys(), [len(rows) for rows in self.position_postings.values()]
+            )
+        return self._position_vocab
+
+    def suggest(self, prefix, limit=8):
+        """
+        사이드바 검색어 자동 완성 목록을 반환합니다.
+        prefix로 시작하는 스킬과 직무 단어를 빈도순으로 보여주고, 부족하면 오타를 고친 후보를 덧붙입니다.
+        """
+        suggestions = []
+        for term in (
+            self.skill_vocab.complete(prefix, limit)
+            + self.position_vocab.complete(prefix, limit)
+            + [term for term, _ in self.skill_vocab.search(prefix, limit=limit)]
+        ):
+            if term not in suggestions:
+                suggestions.append(term)
+        return suggestions[:limit]
+
+    @staticmethod
+    def _string_column(df, column):
+        """문자열 값만 남긴 컬럼을 위치 기준 인덱스로 반환합니다."""
+        if column not in df.columns:
+            return pd.Series(dtype=object)
+        values = df[column].reset_index(drop=True)
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # 컬럼형 캐시에서 읽은 범주형 컬럼: 범주는 모두 문자열
+            return values[values.notna()].astype(str)
+        return values[values.map(lambda v: isinstance(v, str))]
+
+    # --- 스킬 조회 ---
+    def rows_for_skill(self, skill, match_mode=MATCH_SUBSTRING):
+        """선택된 스킬을 가진 행 번호 배열을 반환합니다 (대소문자 구분 없음)."""
+        skill_upper = skill.strip().upper()
+        if match_mode == MATCH_EXACT:
+            return self.skill_postings.get(skill_upper, np.empty(0, dtype=np.int64))
+        if match_mode == MATCH_FUZZY:
+            matches = self.skill_vocab.search(skill_upper, limit=FUZZY_MAX_TERMS)
+            return _union(self.skill_postings[token] for token, _ in matches)
+        return _union(rows for token, rows in self.skill_postings.items() if skill_upper in token)
+
+    # --- 키워드(스킬 + 직무) 조회 ---
+    def rows_for_search(self, search_term, match_mode=MATCH_SUBSTRING):
+        """
+        검색어가 스킬 또는 직무에 포함된 행 번호 배열을 반환합니다 (대소문자 구분 없음).
+
+        exact 모드에서는 검색어가 스킬 토큰과 정확히 같거나,
+        검색어의 모든 단어가 직무명의 단어로 등장하는 행만 반환합니다.
+        fuzzy 모드는 exact 모드와 같은 기준에 단어마다 오타(편집 거리)를 허용합니다.
+        """
+        term = search_term.strip()
+        if match_mode == MATCH_FUZZY:
+            skill_rows = self.rows_for_skill(term, MATCH_FUZZY)
+            term_tokens = [t for t in POSITION_TOKEN_PATTERN.split(term.lower()) if t]
+            position_rows = np.empty(0, dtype=np.int64)
+            if term_tokens:
+                position_rows = _intersect([
+                    _union(
+                        self.position_postings[token]
+                        for token, _ in self.position_vocab.search(t, limit=FUZZY_MAX_TERMS)
+                    )
+                    for t in term_tokens
+                ])
+            return _union([skill_rows, position_rows])
+        if match_mode == MATCH_EXACT:
+            skill_rows = self.skill_postings.get(term.upper(), np.empty(0, dtype=np.int64))
+            term_tokens = [t for t in POSITION_TOKEN_PATTERN.split(term.lower()) if t]
+            position_rows = np.empty(0, dtype=np.int64)
+            if term_tokens and all(t in self.position_postings for t in term_tokens):
+                position_rows = _intersect([self.position_postings[t] for t in term_tokens])
+            return _union([skill_rows, position_rows])
+
+        if "," in search_term or term != search_term:
+            # 쉼표나 앞뒤 공백이 있는 검색어는 원본 스킬 문자열에서 토큰 경계에 걸칠 수 있으므로
+            # (예: ' java'는 'Spring, Java'에만 일치) 토큰 색인으로 이전 검색과 같은 결과를 낼 수 없음
+            return None
+        term_lower = term.lower()
+        position_rows = _union(rows for value, rows in self.position_values.items() if term_lower in value)
+        skill_rows = self.rows_for_skill(term)
+        return _union([position_rows, skill_rows])
+
+    def lookup(self, search_term, selected_skill, match_mode=MATCH_SUBSTRING):
+        """
+        검색어와 선택 스킬 조건을 모두 만족하는 행 번호 배열을 반환합니다.
+        색인으로 처리할 수 없는 조건이 있으면 None을 반환합니다.
+        """
+        postings = []
+        if search_term:
+            rows = self.rows_for_search(search_term, match_mode)
+            if rows is None:
+                return None
+            postings.append(rows)
+        if selected_skill:
+            postings.append(self.rows_for_skill(selected_skill, match_mode))
+        if not postings:
+            return np.arange(self.n_rows)
+        return _intersect(postings)
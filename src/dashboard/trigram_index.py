@@ -0,0 +1,128 @@
+import bisect
+import numpy as np
+
+# 트라이그램 패딩 문자: 단어의 시작/끝 트라이그램을 구분하기 위해 양쪽에 2개씩 붙임
+PAD = "\x00"
+TRIGRAM = 3
+
+
+def trigrams(term):
+    """단어의 (패딩된) 트라이그램 집합. 길이 n인 단어는 최대 n + 2개의 트라이그램을 가집니다."""
+    padded = PAD * (TRIGRAM - 1) + term + PAD * (TRIGRAM - 1)
+    return {padded[i:i + TRIGRAM] for i in range(len(padded) - TRIGRAM + 1)}
+
+
+def default_max_edits(term):
+    """검색어 길이에 따른 허용 편집 거리: 짧은 검색어는 오타 하나만, 길면 둘까지 허용합니다."""
+    if len(term) <= 2:
+        return 0
+    return 1 if len(term) <= 5 else 2
+
+
+def edit_distance(a, b, max_distance):
+    """
+    인접 문자 교환을 한 번의 편집으로 세는 편집 거리 (optimal string alignment).
+    max_distance를 넘는 것이 확실해지면 max_distance + 1을 반환합니다.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class TrigramIndex:
+    """
+    어휘(고유 스킬/직무 단어)에 대한 트라이그램 색인.
+
+    - search(): 오타를 허용하는 검색. 트라이그램을 공유하는 단어를 후보로 뽑은 뒤(근사),
+      후보만 실제 편집 거리로 확인합니다(정확). "kuberntes" -> "KUBERNETES"
+    - complete(): 접두어 자동 완성. 정렬된 어휘에서 이진 탐색으로 범위를 찾고 빈도순으로 반환합니다.
+
+    비용은 어휘 크기와 검색어의 트라이그램 수에만 비례하고, 데이터 행 수와는 무관합니다.
+    단어는 대소문자를 구분하지 않고 비교하며, 결과는 색인에 넣은 원래 표기로 반환합니다.
+    """
+
+    def __init__(self, terms, frequencies=None):
+        """
+        Args:
+            terms: 색인할 고유 단어 목록.
+            frequencies: 단어별 빈도 (공고 수). 결과 정렬에 사용하며 없으면 모두 1.
+        """
+        self.terms = np.asarray(list(terms), dtype=object)
+        self.frequencies = (
+            np.asarray(frequencies, dtype=np.int64) if frequencies is not None
+            else np.ones(len(self.terms), dtype=np.int64)
+        )
+        self._folded = [str(term).lower() for term in self.terms]
+        self._lengths = np.fromiter((len(term) for term in self._folded), dtype=np.int64, count=len(self._folded))
+
+        postings = {}
+        for term_id, term in enumerate(self._folded):
+            for gram in trigrams(term):
+                postings.setdefault(gram, []).append(term_id)
+        self._postings = {gram: np.asarray(ids, dtype=np.int32) for gram, ids in postings.items()}
+
+        # 접두어 검색용: 소문자 단어 오름차순
+        self._prefix_order = np.argsort(np.asarray(self._folded, dtype=object), kind="stable")
+        self._sorted_folded = [self._folded[i] for i in self._prefix_order]
+
+    def __len__(self):
+        return len(self.terms)
+
+    def search(self, query, max_edits=None, limit=10):
+        """
+        query와 편집 거리 max_edits 이내인 단어를 (단어, 편집 거리) 목록으로 반환합니다.
+        편집 거리 오름차순, 같으면 빈도 내림차순입니다. max_edits가 없으면 검색어 길이로 정합니다.
+        """
+        query = query.strip().lower()
+        if not query or not len(self.terms):
+            return []
+        if max_edits is None:
+            max_edits = default_max_edits(query)
+
+        # 근사 단계: 편집 한 번은 트라이그램을 최대 3개, 인접 문자 교환은 최대 4개 바꾸므로,
+        # 거리 k 이내인 단어는 검색어의 트라이그램을 적어도 (트라이그램 수) - 4k개 공유합니다 (q-gram 보조정리).
+        query_grams = trigrams(query)
+        matched = [self._postings[gram] for gram in query_grams if gram in self._postings]
+        if not matched:
+            return []
+        shared = np.bincount(np.concatenate(matched), minlength=len(self.terms))
+        required = max(len(query_grams) - (TRIGRAM + 1) * max_edits, 1)
+        candidates = np.flatnonzero(
+            (shared >= required) & (np.abs(self._lengths - len(query)) <= max_edits)
+        )
+
+        # 정확 단계: 후보만 편집 거리 계산
+        results = []
+        for term_id in candidates:
+            distance = edit_distance(query, self._folded[term_id], max_edits)
+            if distance <= max_edits:
+                results.append((distance, -self.frequencies[term_id], term_id))
+        results.sort()
+        return [(self.terms[term_id], distance) for distance, _, term_id in results[:limit]]
+
+    def complete(self, prefix, limit=10):
+        """prefix로 시작하는 단어를 빈도 내림차순으로 최대 limit개 반환합니다."""
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return []
+        start = bisect.bisect_left(self._sorted_folded, prefix)
+        end = bisect.bisect_left(self._sorted_folded, prefix + "\U0010ffff")
+        if start >= end:
+            return []
+        term_ids = self._prefix_order[start:end]
+        if len(term_ids) > limit:
+            term_ids = term_ids[np.argpartition(-self.frequencies[term_ids], limit - 1)[:limit]]
+        term_ids = sorted(term_ids, key=lambda term_id: (-self.frequencies[term_id], self._folded[term_id]))
+        return [self.terms[term_id] for term_id in term_ids]
@@ -0,0 +1,302 @@
+"""
+병합 데이터의 컬럼형(columnar) 바이너리 캐시.
+
+merged_data_{category}.csv 옆에 같은 이름의 .npz 파일을 만들어 두고,
+대시보드는 CSV 텍스트를 다시 파싱하는 대신 이 파일을 읽습니다.
+
+저장 형식 (numpy .npz, zip 압축):
+    - company / position: 범주형(categorical) 인코딩
+        {col}_codes       int32, 행별 범주 코드 (-1은 결측값)
+        {col}_vocab       uint8, 범주 문자열을 VOCAB_SEPARATOR로 이어 붙인 UTF-8 바이트
+    - skill: 행별 고유 skill 문자열 코드(skill_codes)와, 고유 문자열을 쉼표로 나눈 원본 토큰의 정수 코드 가변 길이 배열.
+      skill 문자열은 거의 모두 고유하므로 문자열 자체는 저장하지 않고 원본 토큰을 쉼표로 이어 붙여 복원합니다.
+        skill_raw_token_vocab   uint8, 원본 토큰 어휘 (공백 포함, 위와 같은 방식)
+        skill_token_offsets     int64, skill 범주 i의 토큰은 codes[offsets[i]:offsets[i+1]]
+        skill_raw_token_codes   int32, 원본 토큰 코드
+        skill_raw_to_token      int32, 원본 토큰 코드 -> 정규화(strip + upper) 토큰 코드
+        skill_token_vocab       uint8, 정규화 토큰 어휘
+    - 원본 CSV 정보: source_size, source_mtime_ns, source_sha256 (신선도 확인용), format_version
+"""
+import hashlib
+import os
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+FORMAT_VERSION = 2
+COLUMNS = ("company", "position", "skill")
+VOCAB_SEPARATOR = "\x1f"  # ASCII Unit Separator: 채용 데이터 문자열에 등장하지 않는 문자
+
+
+def columnar_path_for(csv_path):
+    """CSV 경로에 대응하는 컬럼형 캐시 파일 경로를 반환합니다."""
+    return os.path.splitext(csv_path)[0] + ".npz"
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    """파일 내용의 SHA-256 해시(hex)를 반환합니다."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _encode_vocab(values):
+    """문자열 목록을 구분자로 이어 붙인 UTF-8 바이트 배열로 인코딩합니다."""
+    values = [str(v) for v in values]
+    if any(VOCAB_SEPARATOR in v for v in values):
+        raise ValueError("컬럼 값에 어휘 구분자(\\x1f)가 포함되어 있어 컬럼형 캐시를 만들 수 없습니다.")
+    return np.frombuffer(VOCAB_SEPARATOR.join(values).encode("utf-8"), dtype=np.uint8)
+
+
+def _decode_vocab(blob, size):
+    """_encode_vocab으로 인코딩한 바이트 배열을 문자열 배열로 되돌립니다."""
+    if size == 0:
+        return np.empty(0, dtype=object)
+    return np.array(blob.tobytes().decode("utf-8").split(VOCAB_SEPARATOR), dtype=object)
+
+
+def _tokenize_raw(skill_strings):
+    """
+    고유 skill 문자열 목록을 쉼표로 나눈 원본 토큰의 정수 코드 가변 길이 배열로 변환하고,
+    원본 토큰별 정규화 토큰 코드를 함께 반환합니다.
+
+    Returns:
+        (raw_vocab, offsets, raw_codes, raw_to_token, token_vocab) 튜플.
+    """
+    tokens_per_string = np.fromiter((s.count(",") + 1 for s in skill_strings), dtype=np.int64, count=len(skill_strings))
+    offsets = np.zeros(len(skill_strings) + 1, dtype=np.int64)
+    np.cumsum(tokens_per_string, out=offsets[1:])
+
+    if len(skill_strings) == 0:
+        empty_codes = np.empty(0, dtype=np.int32)
+        return np.empty(0, dtype=object), offsets, empty_codes, empty_codes, np.empty(0, dtype=object)
+
+    raw_tokens = np.array(",".join(skill_strings).split(","), dtype=object)
+    raw_codes, raw_vocab = pd.factorize(raw_tokens)
+    # 고유 원본 토큰에만 정규화 적용 후 다시 코드화
+    raw_to_token, token_vocab = pd.factorize(pd.Index(raw_vocab).str.strip().str.upper())
+    return (
+        np.asarray(raw_vocab, dtype=object), offsets, raw_codes.astype(np.int32),
+        raw_to_token.astype(np.int32), np.asarray(token_vocab, dtype=object),
+    )
+
+
+def tokenize_skill_strings(skill_strings):
+    """
+    고유 skill 문자열 목록을 정규화된 토큰의 정수 코드 가변 길이 배열로 변환합니다.
+    토큰 정규화는 skill_stats.count_skills와 같습니다 (쉼표 분리, 공백 제거, 대문자 변환).
+
+    Returns:
+        (token_vocab, offsets, codes) 튜플.
+    """
+    _, offsets, raw_codes, raw_to_token, token_vocab = _tokenize_raw(skill_strings)
+    return token_vocab, offsets, raw_to_token[raw_codes]
+
+
+def _join_skill_strings(raw_vocab, offsets, raw_codes):
+    """_tokenize_raw의 원본 토큰 코드를 쉼표로 이어 붙여 skill 문자열 배열로 복원합니다."""
+    tokens = raw_vocab[raw_codes].tolist()
+    bounds = offsets.tolist()
+    return np.array([",".join(tokens[start:end]) for start, end in zip(bounds[:-1], bounds[1:])], dtype=object)
+
+
+@dataclass(frozen=True)
+class SkillTokens:
+    """
+    행별 사전 토큰화 스킬.
+
+    Attributes:
+        vocab: 정규화된 스킬 토큰 배열.
+        offsets: skill 범주별 토큰 구간 (길이: 범주 수 + 1).
+        codes: 토큰 코드 배열.
+        row_codes: 행별 skill 범주 코드 (-1은 결측값).
+    """
+    vocab: np.ndarray
+    offsets: np.ndarray
+    codes: np.ndarray
+    row_codes: np.ndarray
+
+    def row_token_pairs(self):
+        """
+        모든 (행 번호, 토큰 코드) 쌍을 벡터 연산으로 펼쳐 반환합니다.
+
+        Returns:
+            (row_ids, token_codes) 튜플. 같은 행의 토큰은 연속해서 나옵니다.
+        """
+        valid_rows = np.flatnonzero(self.row_codes >= 0)
+        categories = self.row_codes[valid_rows]
+        starts = self.offsets[categories]
+        lengths = self.offsets[categories + 1] - starts
+
+        row_ids = np.repeat(valid_rows, lengths)
+        # 각 행의 토큰 구간 시작 위치 + 구간 내 순번
+        within = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        token_codes = self.codes[np.repeat(starts, lengths) + within]
+        return row_ids, token_codes
+
+
+@dataclass(frozen=True)
+class ColumnarDataset:
+    """컬럼형 캐시에서 읽은 데이터프레임과 사전 토큰화 스킬."""
+    frame: pd.DataFrame
+    skill_tokens: SkillTokens
+
+
+def write_columnar(df, csv_path):
+    """
+    병합 데이터프레임을 컬럼형 캐시 파일로 저장합니다.
+    csv_path의 CSV를 먼저 저장한 뒤 호출해야 신선도 정보가 올바르게 기록됩니다.
+
+    Args:
+        df (pd.DataFrame): company, position, skill 컬럼을 가진 병합 데이터.
+        csv_path (str): 원본 CSV 경로 (캐시 파일은 같은 이름의 .npz로 저장됩니다).
+
+    Returns:
+        str: 저장된 캐시 파일 경로.
+    """
+    arrays = {"format_version": np.array(FORMAT_VERSION), "n_rows": np.array(len(df))}
+
+    for column in COLUMNS:
+        values = df[column] if column in df.columns else pd.Series([None] * len(df))
+        categorical = pd.Categorical(values.where(values.notna(), None))
+        arrays[f"{column}_codes"] = categorical.codes.astype(np.int32)
+        if column != "skill":
+            arrays[f"{column}_vocab"] = _encode_vocab(categorical.categories)
+            arrays[f"{column}_vocab_size"] = np.array(len(categorical.categories))
+            continue
+        raw_vocab, offsets, raw_codes, raw_to_token, token_vocab = _tokenize_raw([str(v) for v in categorical.categories])
+        arrays["skill_raw_token_vocab"] = _encode_vocab(raw_vocab)
+        arrays["skill_raw_token_vocab_size"] = np.array(len(raw_vocab))
+        arrays["skill_token_offsets"] = offsets
+        arrays["skill_raw_token_codes"] = raw_codes
+        arrays["skill_raw_to_token"] = raw_to_token
+        arrays["skill_token_vocab"] = _encode_vocab(token_vocab)
+        arrays["skill_token_vocab_size"] = np.array(len(token_vocab))
+
+    stat = os.stat(csv_path)
+    arrays["source_size"] = np.array(stat.st_size, dtype=np.int64)
+    arrays["source_mtime_ns"] = np.array(stat.st_mtime_ns, dtype=np.int64)
+    arrays["source_sha256"] = np.array(file_sha256(csv_path))
+
+    output_path = columnar_path_for(csv_path)
+    temp_path = output_path + ".tmp"
+    with open(temp_path, "wb") as f:
+        np.savez_compressed(f, **arrays)
+    os.replace(temp_path, output_path)
+    return output_path
+
+
+class ColumnarBuilder:
+    """
+    데이터프레임 청크를 받아 company, position, skill 범주형 컬럼을 만드는 누적기 (스트리밍 병합용).
+
+    청크마다 int32 범주 코드와 청크 안의 고유 값만 보관하고 마지막에 한 번 합치므로,
+    청크를 모두 합친 데이터프레임을 다시 읽지 않고 컬럼형 캐시, 스킬 순위표, 스냅샷의 입력을 만들 수 있습니다.
+    """
+
+    def __init__(self):
+        self._chunks = {column: [] for column in COLUMNS}  # 컬럼 -> [(청크 코드, 청크 고유 값), ...]
+        self.n_rows = 0
+
+    def add(self, df):
+        """청크의 행을 추가합니다. 없는 컬럼은 결측값으로 채웁니다."""
+        for column in COLUMNS:
+            values = df[column] if column in df.columns else pd.Series([None] * len(df), dtype=object)
+            codes, uniques = pd.factorize(values)
+            self._chunks[column].append((codes.astype(np.int32), pd.Series(uniques)))
+        self.n_rows += len(df)
+
+    def to_frame(self):
+        """
+        지금까지 추가한 행을 범주형 컬럼의 데이터프레임으로 반환합니다.
+        범주는 pd.Categorical과 같이 정렬하므로, 같은 행을 한 번에 읽어 만든 것과 같은 결과입니다.
+        """
+        columns = {}
+        for column in COLUMNS:
+            chunks = self._chunks[column]
+            if not chunks:
+                columns[column] = pd.Categorical([])
+                continue
+            # 청크별 고유 값을 이어 붙여 한 번에 정렬된 코드로 바꾸고, 청크 코드를 그 코드로 옮김
+            global_codes, categories = pd.factorize(
+                pd.concat([uniques for _, uniques in chunks], ignore_index=True), sort=True
+            )
+            codes = []
+            start = 0
+            for chunk_codes, uniques in chunks:
+                # 마지막 원소(-1)는 결측값 코드(-1)가 가리키는 자리
+                mapping = np.append(global_codes[start: start + len(uniques)], -1).astype(np.int32)
+                codes.append(mapping[chunk_codes])
+                start += len(uniques)
+            columns[column] = pd.Categorical.from_codes(np.concatenate(codes), categories=categories)
+        return pd.DataFrame(columns)
+
+
+def is_columnar_fresh(csv_path):
+    """
+    컬럼형 캐시가 존재하고 원본 CSV와 일치하는지 확인합니다.
+
+    - CSV가 없으면 캐시만으로 충분하므로 True
+    - CSV의 크기와 수정 시각이 기록과 같으면 True
+    - 수정 시각만 다르면 (git checkout, 파일 복사 등) 내용 해시를 비교
+    """
+    columnar_path = columnar_path_for(csv_path)
+    if not os.path.exists(columnar_path):
+        return False
+    try:
+        csv_stat = os.stat(csv_path)
+    except FileNotFoundError:
+        return True
+
+    with np.load(columnar_path) as npz:
+        if int(npz["format_version"]) != FORMAT_VERSION:
+            return False
+        if int(npz["source_size"]) != csv_stat.st_size:
+            return False
+        if int(npz["source_mtime_ns"]) == csv_stat.st_mtime_ns:
+            return True
+        return str(npz["source_sha256"]) == file_sha256(csv_path)
+
+
+def read_columnar(csv_path):
+    """
+    컬럼형 캐시 파일을 읽어 ColumnarDataset으로 반환합니다.
+    company, position, skill 컬럼은 pandas Categorical로 복원됩니다.
+    """
+    with np.load(columnar_path_for(csv_path)) as npz:
+        columns = {}
+        for column in COLUMNS:
+            if column == "skill":
+                continue
+            categories = _decode_vocab(npz[f"{column}_vocab"], int(npz[f"{column}_vocab_size"]))
+            columns[column] = pd.Categorical.from_codes(npz[f"{column}_codes"], categories=categories)
+
+        raw_vocab = _decode_vocab(npz["skill_raw_token_vocab"], int(npz["skill_raw_token_vocab_size"]))
+        offsets = npz["skill_token_offsets"]
+        raw_codes = npz["skill_raw_token_codes"]
+        columns["skill"] = pd.Categorical.from_codes(
+            npz["skill_codes"], categories=_join_skill_strings(raw_vocab, offsets, raw_codes)
+        )
+        skill_tokens = SkillTokens(
+            vocab=_decode_vocab(npz["skill_token_vocab"], int(npz["skill_token_vocab_size"])),
+            offsets=offsets,
+            codes=npz["skill_raw_to_token"][raw_codes],
+            row_codes=npz["skill_codes"],
+        )
+
+    columns = {column: columns[column] for column in COLUMNS}
+
+    return ColumnarDataset(frame=pd.DataFrame(columns), skill_tokens=skill_tokens)
+
+
+def load_columnar_if_fresh(csv_path):
+    """신선한 컬럼형 캐시가 있으면 읽어서 반환하고, 없으면 None을 반환합니다."""
+    try:
+        if is_columnar_fresh(csv_path):
+            return read_columnar(csv_path)
+    except (OSError, KeyError, ValueError) as e:
+        print(f"컬럼형 캐시를 읽지 못해 CSV를 사용합니다 ({csv_path}): {e}")
+    return None
@@ -1,40 +1,419 @@
+import argparse
+import json
 import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import pandas as pd
+from src.processing.columnar import ColumnarBuilder, file_sha256, load_columnar_if_fresh, write_columnar
+from src.processing.skill_stats import count_skills, write_leaderboard
+from src.processing.snapshots import append_snapshot
+from src.processing.wordcloud_image import write_wordcloud
 
-def merge_and_deduplicate_csv_files(directory='./data', deduplication_columns=None):
+# 카테고리별 원본 파일 접미사와 병합 결과 파일 이름
+CATEGORY_FILES = {
+    'backend': ('_backend.csv', 'merged_data_backend.csv'),
+    'frontend': ('_frontend.csv', 'merged_data_frontend.csv'),
+    'total': ('_total.csv', 'merged_data_total.csv'),
+}
+
+# 증분 병합 상태 파일 (병합 대상 디렉토리 안에 저장)
+MANIFEST_FILENAME = '.merge_manifest.json'
+KEY_STORE_FILENAME = '.merge_keys_{category}.npy'
+MANIFEST_VERSION = 1
+
+
+def list_source_files(directory, include_outputs=True):
+    """
+    카테고리별 병합 대상 CSV 파일 목록을 반환합니다.
+
+    전체 병합은 기존과 같이 이전 병합 결과(merged_data_*.csv)도 입력에 포함하여,
+    원본 파일이 정리된 뒤에도 과거 공고가 유지되도록 합니다.
+    증분 병합에서는 병합 결과가 추가 대상이므로 include_outputs=False로 제외합니다.
+    """
+    # 파일 이름순으로 병합하여 결과 행 순서가 디렉토리 나열 순서에 따라 달라지지 않도록 함
+    all_files = sorted(os.listdir(directory))
+    output_files = {output for _, output in CATEGORY_FILES.values()}
+    return {
+        category: [
+            f for f in all_files
+            if f.endswith(suffix) and (include_outputs or f not in output_files)
+        ]
+        for category, (suffix, _) in CATEGORY_FILES.items()
+    }
+
+
+def dedup_key_hashes(df, deduplication_columns):
+    """중복 제거 기준 컬럼 값 조합을 64비트 해시 배열로 변환합니다."""
+    keys = df[deduplication_columns].astype(object)
+    return pd.util.hash_pandas_object(keys, index=False).to_numpy(dtype=np.uint64)
+
+
+def _file_signature(path, with_hash=True):
+    """manifest에 기록할 파일 정보 (크기, 수정 시각, 내용 해시)."""
+    stat = os.stat(path)
+    signature = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    if with_hash:
+        signature['sha256'] = file_sha256(path)
+    return signature
+
+
+def _is_unchanged(path, recorded):
+    """manifest 기록과 비교하여 파일이 바뀌지 않았는지 확인합니다 (해시는 필요할 때만 계산)."""
+    current = _file_signature(path, with_hash=False)
+    if current['size'] != recorded.get('size'):
+        return False
+    if current['mtime_ns'] == recorded.get('mtime_ns'):
+        return True
+    return file_sha256(path) == recorded.get('sha256')
+
+
+def load_manifest(directory):
+    """증분 병합 manifest를 읽습니다. 없거나 읽을 수 없으면 None을 반환합니다."""
+    path = os.path.join(directory, MANIFEST_FILENAME)
+    try:
+        with open(path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get('version') != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def save_manifest(directory, manifest):
+    """증분 병합 manifest를 원자적으로 저장합니다."""
+    path = os.path.join(directory, MANIFEST_FILENAME)
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(temp_path, path)
+
+
+def _save_key_store(directory, category, key_hashes):
+    path = os.path.join(directory, KEY_STORE_FILENAME.format(category=category))
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        np.save(f, np.unique(key_hashes))
+    os.replace(temp_path, path)
+
+
+def _load_key_store(directory, category):
+    path = os.path.join(directory, KEY_STORE_FILENAME.format(category=category))
+    try:
+        return np.load(path)
+    except (OSError, ValueError):
+        return None
+
+
+def _merge_full(directory, category, files, deduplication_columns, write_images=True):
+    """
+    카테고리의 모든 원본 파일을 읽어 병합하고 중복을 제거하여 저장합니다.
+    write_images가 False이면 워드 클라우드 이미지를 그리지 않습니다 (대시보드가 백그라운드에서 그림).
+
+    Returns:
+        dict | None: manifest에 기록할 카테고리 상태. 원본 파일이 없으면 None.
+    """
+    output_filename = CATEGORY_FILES[category][1]
+    if not files:
+        print(f"{output_filename} 에 해당하는 파일이 없습니다.")
+        return None
+
+    dfs = [pd.read_csv(os.path.join(directory, f)) for f in files]
+    merged_df = pd.concat(dfs, ignore_index=True)
+    # 중복 제거
+    merged_df.drop_duplicates(subset=deduplication_columns, keep='first', inplace=True)
+    output_path = os.path.join(directory, output_filename)
+    merged_df.to_csv(output_path, index=False)
+    print(f"{output_filename} 파일이 성공적으로 저장되었습니다 (중복 제거됨).")
+    # 대시보드가 CSV 대신 빠르게 읽을 수 있는 컬럼형 캐시(.npz)와 스킬 순위표(.skills.json)도 함께 저장
+    write_columnar(merged_df, output_path)
+    write_leaderboard(merged_df, output_path)
+    # 병합 결과는 덮어쓰므로 스킬/직무별 공고 수를 날짜별 스냅샷으로 추가해 추이를 남김
+    append_snapshot(output_path, merged_df)
+    # 대시보드 상단 워드 클라우드 (wordcloud 패키지가 있을 때만, 스킬 빈도가 바뀐 경우에만 다시 그림)
+    if write_images:
+        write_wordcloud(output_path, count_skills(merged_df))
+
+    _save_key_store(directory, category, dedup_key_hashes(merged_df, deduplication_columns))
+    return {
+        'output': output_filename,
+        'sources': {
+            f: _file_signature(os.path.join(directory, f)) for f in files if f != output_filename
+        },
+    }
+
+
+class StreamingKeySet:
+    """
+    이미 기록한 중복 제거 키(64비트 해시)를 보관하는 집합.
+
+    키를 정렬된 numpy 배열(8바이트/키)로 보관하여, 청크 단위로 스트리밍 병합할 때
+    메모리 사용량이 입력 전체가 아니라 고유 키 수에 비례하도록 합니다.
+    새로 들어온 키는 작은 정렬 배열 목록에 쌓아 두었다가, 크기가 커지면 본 배열에 합칩니다.
+    """
+
+    def __init__(self, initial_keys=None):
+        self._merged = np.unique(initial_keys) if initial_keys is not None else np.empty(0, dtype=np.uint64)
+        self._recent = []
+        self._recent_size = 0
+
+    def __len__(self):
+        return len(self._merged) + self._recent_size
+
+    @staticmethod
+    def _contains(sorted_keys, keys):
+        positions = np.searchsorted(sorted_keys, keys)
+        positions[positions == len(sorted_keys)] = 0
+        return (sorted_keys[positions] == keys) if len(sorted_keys) else np.zeros(len(keys), dtype=bool)
+
+    def add_new(self, keys):
+        """
+        keys 중 처음 등장하는 키를 집합에 추가하고, 그 위치를 나타내는 bool 마스크를 반환합니다.
+        같은 배열 안에서 반복되는 키는 첫 번째 위치만 True입니다 (drop_duplicates(keep='first')와 같음).
+        """
+        is_new = np.zeros(len(keys), dtype=bool)
+        _, first_positions = np.unique(keys, return_index=True)
+        is_new[first_positions] = True
+
+        candidates = np.flatnonzero(is_new)
+        seen = self._contains(self._merged, keys[candidates])
+        for recent in self._recent:
+            seen |= self._contains(recent, keys[candidates])
+        is_new[candidates[seen]] = False
+
+        added = np.sort(keys[is_new])
+        if len(added):
+            self._recent.append(added)
+            self._recent_size += len(added)
+        # 최근 배열이 본 배열의 절반을 넘으면 합침 (합치는 비용을 전체적으로 O(n log n)으로 유지)
+        if self._recent_size > max(len(self._merged) // 2, 1 << 16):
+            self._compact()
+        return is_new
+
+    def _compact(self):
+        self._merged = np.sort(np.concatenate([self._merged, *self._recent]))
+        self._recent = []
+        self._recent_size = 0
+
+    def to_array(self):
+        """모든 키를 정렬된 배열로 반환합니다."""
+        self._compact()
+        return self._merged
+
+
+def _merge_streaming(directory, category, files, deduplication_columns, chunksize, write_images=True):
+    """
+    카테고리의 원본 파일을 chunksize 행씩 읽으면서 중복을 제거하여 저장합니다.
+    이미 기록한 키는 StreamingKeySet으로만 추적하므로, 입력 전체를 메모리에 올리지 않습니다.
+    결과는 임시 파일에 쓴 뒤 원자적으로 교체합니다.
+
+    컬럼형 캐시, 스킬 순위표, 스냅샷은 기록한 청크에서 모은 범주 코드(ColumnarBuilder)로 만들므로
+    병합 결과를 다시 읽지 않습니다. 메모리 사용량은 출력 행당 키 8바이트와 범주 코드 12바이트,
+    그리고 고유 값 어휘에 비례합니다.
+
+    Returns:
+        dict | None: manifest에 기록할 카테고리 상태. 원본 파일이 없으면 None.
+    """
+    output_filename = CATEGORY_FILES[category][1]
+    if not files:
+        print(f"{output_filename} 에 해당하는 파일이 없습니다.")
+        return None
+
+    output_path = os.path.join(directory, output_filename)
+    temp_path = output_path + '.tmp'
+    seen = StreamingKeySet()
+    builder = ColumnarBuilder()
+    columns = None
+    written_rows = 0
+
+    with open(temp_path, 'w', encoding='utf-8', newline='') as out:
+        for f in files:
+            for chunk in pd.read_csv(os.path.join(directory, f), chunksize=chunksize):
+                if columns is None:
+                    # 출력 컬럼은 첫 번째 파일 기준 (다른 파일의 추가 컬럼은 무시)
+                    columns = chunk.columns.tolist()
+                    out.write(pd.DataFrame(columns=columns).to_csv(index=False))
+                chunk = chunk[seen.add_new(dedup_key_hashes(chunk, deduplication_columns))].reindex(columns=columns)
+                chunk.to_csv(out, header=False, index=False)
+                builder.add(chunk)
+                written_rows += len(chunk)
+    os.replace(temp_path, output_path)
+    print(f"{output_filename} 파일이 성공적으로 저장되었습니다 (스트리밍 병합, {written_rows}행, 중복 제거됨).")
+
+    # 컬럼형 캐시와 스킬 순위표는 중복 제거된 결과(대시보드가 로드하는 데이터)로 만듭니다.
+    # 기록한 청크의 범주형 컬럼만 사용하며, 병합 결과 CSV를 다시 읽지 않습니다.
+    merged_df = builder.to_frame()
+    write_columnar(merged_df, output_path)
+    write_leaderboard(merged_df, output_path)
+    append_snapshot(output_path, merged_df)
+    if write_images:
+        write_wordcloud(output_path, count_skills(merged_df))
+
+    _save_key_store(directory, category, seen.to_array())
+    return {
+        'output': output_filename,
+        'sources': {
+            f: _file_signature(os.path.join(directory, f)) for f in files if f != output_filename
+        },
+    }
+
+
+def _merge_incremental(directory, category, files, deduplication_columns, state, write_images=True):
+    """
+    manifest에 기록된 이후 새로 추가되었거나 내용이 바뀐 원본 파일만 읽어,
+    기존 병합 결과에 없는 (중복 제거 키 기준) 행만 병합 결과 끝에 추가합니다.
+
+    바뀐 파일은 다시 읽지만 이미 병합된 키는 건너뛰므로, 원본에서 삭제된 행이나
+    삭제된 원본 파일은 병합 결과에 반영되지 않습니다 (전체 병합으로 다시 만들어야 합니다).
+
+    Returns:
+        dict | None: 갱신된 카테고리 상태. 증분 병합을 할 수 없으면 None.
+    """
+    output_filename = CATEGORY_FILES[category][1]
+    output_path = os.path.join(directory, output_filename)
+    key_store = _load_key_store(directory, category)
+    if state is None or key_store is None or not os.path.exists(output_path):
+        return None
+
+    recorded = state.get('sources', {})
+    removed = sorted(set(recorded) - set(files))
+    if removed:
+        print(f"{output_filename}: 삭제된 원본 파일은 반영되지 않습니다 (전체 병합 필요): {', '.join(removed)}")
+
+    pending = [
+        f for f in files
+        if f not in recorded or not _is_unchanged(os.path.join(directory, f), recorded[f])
+    ]
+    if not pending:
+        print(f"{output_filename}: 새로 병합할 파일이 없습니다.")
+        return state
+
+    new_df = pd.concat([pd.read_csv(os.path.join(directory, f)) for f in pending], ignore_index=True)
+    new_df.drop_duplicates(subset=deduplication_columns, keep='first', inplace=True)
+    new_keys = dedup_key_hashes(new_df, deduplication_columns)
+    is_new = ~np.isin(new_keys, key_store)
+    new_df = new_df[is_new]
+
+    if not new_df.empty:
+        # 추가하기 전에 기존 컬럼형 캐시를 읽어 두고, 새 행만 이어 붙여 다시 저장
+        existing = load_columnar_if_fresh(output_path)
+        with open(output_path, 'r', encoding='utf-8') as f:
+            header = pd.read_csv(f, nrows=0).columns.tolist()
+        new_df = new_df.reindex(columns=header)
+        new_df.to_csv(output_path, mode='a', header=False, index=False)
+
+        if existing is not None:
+            merged_df = pd.concat([existing.frame.astype(object), new_df], ignore_index=True)
+        else:
+            merged_df = pd.read_csv(output_path)
+        write_columnar(merged_df, output_path)
+        write_leaderboard(merged_df, output_path)
+        append_snapshot(output_path, merged_df)
+        if write_images:
+            write_wordcloud(output_path, count_skills(merged_df))
+
+        _save_key_store(directory, category, np.concatenate([key_store, new_keys[is_new]]))
+
+    print(f"{output_filename}: {len(pending)}개 파일에서 {len(new_df)}개 행을 추가했습니다 (증분 병합).")
+
+    sources = {f: sig for f, sig in recorded.items() if f in files}
+    sources.update({f: _file_signature(os.path.join(directory, f)) for f in pending})
+    return {'output': output_filename, 'sources': sources}
+
+
+def _merge_category(directory, category, all_files, new_files, deduplication_columns, state, chunksize,
+                    write_images):
+    """
+    카테고리 하나를 병합합니다 (프로세스 풀 작업 단위).
+    state가 있으면 증분 병합을 시도하고, 할 수 없으면 전체 병합합니다.
+    chunksize가 있으면 전체 병합을 스트리밍 방식으로 수행합니다.
+
+    Returns:
+        (category, state) 튜플.
+    """
+    result = None
+    if state is not None:
+        result = _merge_incremental(directory, category, new_files, deduplication_columns, state, write_images)
+    if result is None:
+        if chunksize:
+            result = _merge_streaming(directory, category, all_files, deduplication_columns, chunksize, write_images)
+        else:
+            result = _merge_full(directory, category, all_files, deduplication_columns, write_images)
+    return category, result
+
+
+def merge_and_deduplicate_csv_files(directory='./data', deduplication_columns=None, incremental=False,
+                                    workers=1, chunksize=None, write_images=True):
     """
     지정된 디렉토리 내의 CSV 파일들을 특정 규칙에 따라 통합하고, 지정된 컬럼 기준으로 중복을 제거하여 저장합니다.
 
     Args:
         directory (str, optional): CSV 파일들이 위치한 디렉토리 경로. 기본값은 './data'입니다.
         deduplication_columns (list, optional): 중복 제거를 위한 컬럼 이름 리스트. 기본값은 None입니다.
+        incremental (bool, optional): True이면 manifest에 기록된 이후 새로 추가되거나 바뀐 원본 파일만 읽어
+            기존 병합 결과에 추가합니다. 이전 상태가 없거나 중복 제거 컬럼이 바뀌었으면 전체 병합합니다.
+        workers (int, optional): backend/frontend/total 카테고리를 동시에 처리할 프로세스 수. 기본값은 1 (순차 처리).
+        chunksize (int, optional): 지정하면 원본 파일을 chunksize 행씩 읽는 스트리밍 병합을 사용합니다.
+            최대 메모리 사용량이 입력 전체가 아닌 고유 행 수(중복 제거 키와 범주 코드)에 비례합니다.
+        write_images (bool, optional): False이면 워드 클라우드 이미지를 그리지 않습니다 (카테고리당 1초 이상).
+            이미지가 없으면 대시보드가 처음 로드할 때 백그라운드에서 그려 저장합니다. 기본값은 True입니다.
     """
 
     if deduplication_columns is None or len(deduplication_columns) != 2:
         print("중복 제거를 위해서는 두 개의 컬럼 이름이 필요합니다.")
         return
 
-    all_files = os.listdir(directory)
-    backend_files = [f for f in all_files if f.endswith('_backend.csv')]
-    frontend_files = [f for f in all_files if f.endswith('_frontend.csv')]
-    total_files = [f for f in all_files if f.endswith('_total.csv')]
-
-    def process_and_save(files, output_filename):
-        if files:
-            dfs = [pd.read_csv(os.path.join(directory, f)) for f in files]
-            merged_df = pd.concat(dfs, ignore_index=True)
-            # 중복 제거
-            merged_df.drop_duplicates(subset=deduplication_columns, keep='first', inplace=True)
-            merged_df.to_csv(os.path.join(directory, output_filename), index=False)
-            print(f"{output_filename} 파일이 성공적으로 저장되었습니다 (중복 제거됨).")
-        else:
-            print(f"{output_filename} 에 해당하는 파일이 없습니다.")
+    manifest = load_manifest(directory) if incremental else None
+    if manifest is not None and manifest.get('deduplication_columns') != list(deduplication_columns):
+        print("중복 제거 컬럼이 이전 병합과 달라 전체 병합을 수행합니다.")
+        manifest = None
+
+    all_files = list_source_files(directory)
+    new_source_files = list_source_files(directory, include_outputs=False)
+
+    jobs = [
+        (
+            directory, category, all_files[category], new_source_files[category], deduplication_columns,
+            manifest['categories'].get(category) if manifest is not None else None, chunksize, write_images
+        )
+        for category in CATEGORY_FILES
+    ]
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+            results = list(executor.map(_merge_category, *zip(*jobs)))
+    else:
+        results = [_merge_category(*job) for job in jobs]
+
+    categories_state = {category: state for category, state in results if state is not None}
+
+    save_manifest(directory, {
+        'version': MANIFEST_VERSION,
+        'deduplication_columns': list(deduplication_columns),
+        'categories': categories_state,
+    })
 
-    process_and_save(backend_files, 'merged_data_backend.csv')
-    process_and_save(frontend_files, 'merged_data_frontend.csv')
-    process_and_save(total_files, 'merged_data_total.csv')
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="수집한 CSV 파일을 카테고리별로 병합하고 중복을 제거합니다.")
+    parser.add_argument("--directory", default="./data", help="CSV 파일들이 위치한 디렉토리 (기본값: ./data)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="이전 병합 이후 새로 추가되거나 바뀐 원본 파일만 병합합니다.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="카테고리(backend/frontend/total)를 동시에 처리할 프로세스 수 (기본값: 1)")
+    parser.add_argument("--chunksize", type=int, default=None,
+                        help="원본 CSV를 이 행 수만큼씩 읽는 스트리밍 병합을 사용합니다 (기본값: 파일 전체를 한 번에 읽음)")
+    parser.add_argument("--no-wordcloud", action="store_true",
+                        help="워드 클라우드 이미지를 그리지 않습니다 (대시보드가 처음 로드할 때 백그라운드에서 그림)")
+    args = parser.parse_args()
+
     # 중복 제거를 원하는 컬럼 이름을 리스트 형태로 전달하세요.
     deduplication_columns = ["company", "skill"]
-    merge_and_deduplicate_csv_files(deduplication_columns=deduplication_columns)
\ No newline at end of file
+    merge_and_deduplicate_csv_files(
+        directory=args.directory,
+        deduplication_columns=deduplication_columns,
+        incremental=args.incremental,
+        workers=args.workers,
+        chunksize=args.chunksize,
+        write_images=not args.no_wordcloud
+    )
@@ -0,0 +1,300 @@
+"""
+기술 스택 빈도 집계, 스킬 동시 등장 행렬, 병합 시점에 미리 계산해 두는 스킬 순위표(leaderboard).
+
+csv_merge.py가 merged_data_{category}.csv 옆에 같은 이름의 .skills.json 파일을 만들고,
+대시보드는 필터가 없을 때 count_skills를 다시 계산하는 대신 이 파일을 읽습니다.
+
+파일 형식 (JSON):
+    - skills: [[스킬, 빈도, 동시 등장 합계], ...] (빈도 내림차순, 전체 스킬)
+    - n_rows: 집계한 행 수
+    - 원본 CSV 정보: source_size, source_mtime_ns, source_sha256 (신선도 확인용), format_version
+"""
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from src.processing.columnar import file_sha256, tokenize_skill_strings
+
+FORMAT_VERSION = 2  # 2: 빈도가 같은 스킬을 이름순으로 정렬
+LEADERBOARD_COLUMNS = ["skill", "count", "cooccurrence"]
+
+# count에서 제외될 스킬 목록 (너무 일반적인 단어, 기술 스택이 아닌 것, 정규화 후 쓰레기값 등)
+EXCLUDED_SKILLS = frozenset(["AI", "UI", "UIUX", "NATIVE", "BOOT", "API", "WEB", "SW", "PC", "CICD"])
+
+
+def _skill_string_counts(df):
+    """skill 컬럼의 고유 문자열별 행 수를 반환합니다 (문자열이 아닌 값과 결측값 제외)."""
+    if df is None or "skill" not in df.columns:
+        return pd.Series(dtype="int64")
+    # 동일한 skill 문자열은 한 번만 처리 (NaN은 value_counts에서 제외됨)
+    row_counts = df["skill"].value_counts(sort=False)
+    row_counts = row_counts[row_counts > 0]  # 범주형 컬럼은 등장하지 않는 범주도 0으로 포함
+    is_str = np.fromiter((isinstance(v, str) for v in row_counts.index), dtype=bool, count=len(row_counts))
+    return row_counts[is_str]
+
+
+def count_skills(df):
+    """
+    주어진 데이터프레임의 'skill' 컬럼에서 기술 스택 빈도를 계산합니다.
+    특정 제외 목록(EXCLUDED_SKILLS)에 있는 스킬은 계산에서 제외합니다.
+
+    행 단위 반복 대신 벡터 연산으로 계산합니다.
+    1. 동일한 skill 문자열을 먼저 value_counts로 묶어 고유 문자열만 다룹니다.
+    2. 고유 문자열을 한 번에 이어 붙여 분리하고, 각 토큰에 원래 행 수를 가중치로 부여합니다.
+    3. factorize + bincount로 원본 토큰 빈도를 집계한 뒤, 고유 토큰에만 공백 제거/대문자 변환을 적용합니다.
+
+    Returns:
+        스킬 이름(대문자)을 인덱스로, 빈도를 값으로 하는 Series (빈도 내림차순, 같은 빈도는 이름순).
+    """
+    raw_counts = _raw_token_counts(df)
+    if raw_counts.empty:
+        return pd.Series(dtype="int64")
+
+    # 고유 토큰에만 공백 제거 및 대문자 변환 적용 후 재집계
+    normalized = raw_counts.index.str.strip().str.upper()
+    skill_counts = raw_counts.groupby(normalized, sort=False).sum()
+
+    # 제외 목록에 없는 스킬만 결과에 포함 (벡터 마스크)
+    skill_counts = skill_counts[~skill_counts.index.isin(EXCLUDED_SKILLS)]
+    return _sort_counts(skill_counts)
+
+
+def count_display_skills(df):
+    """
+    'skill' 컬럼의 스킬 빈도를 원본 표기(앞뒤 공백만 제거, 대소문자 유지)로 계산합니다 (사이드바 대표 스킬 목록용).
+    count_skills와 달리 대소문자만 다른 표기를 합치지 않고 제외 목록도 적용하지 않습니다. 빈 토큰은 제외합니다.
+
+    Returns:
+        스킬 이름(원본 표기)을 인덱스로 하는 Series (빈도 내림차순, 같은 빈도는 이름순).
+    """
+    raw_counts = _raw_token_counts(df)
+    if raw_counts.empty:
+        return pd.Series(dtype="int64")
+
+    skill_counts = raw_counts.groupby(raw_counts.index.str.strip(), sort=False).sum()
+    return _sort_counts(skill_counts[skill_counts.index != ""])
+
+
+def _raw_token_counts(df):
+    """쉼표로 나눈 원본 토큰(공백, 대소문자 그대로)별 행 수를 반환합니다."""
+    row_counts = _skill_string_counts(df)
+    if row_counts.empty:
+        return pd.Series(dtype="int64")
+
+    # 쉼표로 분리된 토큰을 한 번에 펼치고, 토큰마다 해당 문자열의 행 수를 가중치로 사용
+    skill_strings = row_counts.index.tolist()
+    tokens_per_string = np.fromiter((s.count(",") + 1 for s in skill_strings), dtype=np.int64, count=len(skill_strings))
+    tokens = np.array(",".join(skill_strings).split(","), dtype=object)
+    weights = np.repeat(row_counts.to_numpy(dtype=np.int64), tokens_per_string)
+
+    codes, raw_tokens = pd.factorize(tokens)
+    return pd.Series(np.bincount(codes, weights=weights).astype(np.int64), index=raw_tokens)
+
+
+def _sort_counts(skill_counts):
+    """
+    빈도 내림차순, 빈도가 같으면 이름순으로 정렬합니다.
+    입력이 CSV인지 범주형 컬럼인지에 따라 토큰 등장 순서가 달라도 같은 순위가 나오도록 합니다.
+    """
+    skill_counts = skill_counts.sort_index(kind="stable").sort_values(ascending=False, kind="stable")
+    return skill_counts.rename(None).rename_axis(None)
+
+
+def _string_skill_pairs(row_counts):
+    """
+    고유 skill 문자열별 정규화 스킬 코드 쌍을 만듭니다 (문자열 안의 중복, 빈 값, 제외 목록 스킬 제외).
+
+    Returns:
+        (string_ids, codes, token_vocab, valid_tokens) 튜플. string_ids는 오름차순으로 정렬되어 있습니다.
+    """
+    token_vocab, offsets, codes = tokenize_skill_strings(row_counts.index.tolist())
+    string_ids = np.repeat(np.arange(len(row_counts)), np.diff(offsets))
+
+    valid_tokens = (token_vocab != "") & ~pd.Index(token_vocab).isin(EXCLUDED_SKILLS)
+    keep = valid_tokens[codes]
+    pair_keys = np.unique(string_ids[keep] * len(token_vocab) + codes[keep])
+    string_ids, codes = np.divmod(pair_keys, len(token_vocab))
+    return string_ids, codes, token_vocab, valid_tokens
+
+
+def count_cooccurrences(df):
+    """
+    스킬별 동시 등장 합계를 계산합니다.
+    각 공고에서 해당 스킬과 함께 나온 다른 스킬 수(중복, 빈 값, 제외 목록 스킬 제외)를 모든 공고에 걸쳐 더한 값입니다.
+
+    Returns:
+        스킬 이름(대문자)을 인덱스로 하는 Series.
+    """
+    row_counts = _skill_string_counts(df)
+    if row_counts.empty:
+        return pd.Series(dtype="int64")
+
+    string_ids, codes, token_vocab, valid_tokens = _string_skill_pairs(row_counts)
+
+    # 문자열 하나에 k개의 스킬이 있으면 각 스킬은 (k - 1)개의 스킬과 함께 등장 (행 수만큼 가중)
+    skills_per_string = np.bincount(string_ids, minlength=len(row_counts))
+    weights = (skills_per_string[string_ids] - 1) * row_counts.to_numpy(dtype=np.int64)[string_ids]
+    totals = np.bincount(codes, weights=weights, minlength=len(token_vocab)).astype(np.int64)
+    return pd.Series(totals[valid_tokens], index=token_vocab[valid_tokens])
+
+
+class SkillCooccurrence:
+    """
+    스킬 x 스킬 동시 등장 희소 행렬 (CSR 형식).
+
+    - vocab[i]: 스킬 i의 이름 (대문자)
+    - 스킬 i와 함께 등장한 스킬은 indices[indptr[i]:indptr[i+1]], 함께 등장한 공고 수는 같은 구간의 counts
+      (각 행 구간은 공고 수 내림차순으로 정렬되어 있어 상위 k개 조회는 구간 앞부분을 자르기만 하면 됩니다)
+    - postings[i]: 스킬 i가 등장한 공고 수
+
+    데이터셋이 로드될 때 한 번 만들고, 밀집 행렬은 만들지 않습니다.
+    """
+
+    def __init__(self, vocab, indptr, indices, counts, postings):
+        self.vocab = vocab
+        self.indptr = indptr
+        self.indices = indices
+        self.counts = counts
+        self.postings = postings
+        self._codes = {skill: code for code, skill in enumerate(vocab)}
+
+    @classmethod
+    def from_frame(cls, df):
+        """데이터프레임의 skill 컬럼으로 동시 등장 행렬을 만듭니다 (고유 skill 문자열 단위로 계산)."""
+        row_counts = _skill_string_counts(df)
+        if row_counts.empty:
+            return cls(np.empty(0, dtype=object), np.zeros(1, dtype=np.int64),
+                       np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+
+        string_ids, codes, token_vocab, valid_tokens = _string_skill_pairs(row_counts)
+        string_weights = row_counts.to_numpy(dtype=np.int64)
+
+        # 유효한 스킬만 0..V-1로 다시 번호 매김
+        vocab = token_vocab[valid_tokens]
+        remap = np.cumsum(valid_tokens) - 1
+        codes = remap[codes]
+        n_skills = len(vocab)
+        postings = np.bincount(codes, weights=string_weights[string_ids], minlength=n_skills).astype(np.int64)
+
+        # 같은 문자열 안의 모든 (왼쪽, 오른쪽) 스킬 쌍을 벡터 연산으로 펼침
+        group_sizes = np.bincount(string_ids, minlength=len(row_counts))
+        entry_sizes = group_sizes[string_ids]
+        group_starts = np.cumsum(group_sizes) - group_sizes
+        left = np.repeat(np.arange(len(codes)), entry_sizes)
+        within = np.arange(len(left)) - np.repeat(np.cumsum(entry_sizes) - entry_sizes, entry_sizes)
+        right = np.repeat(group_starts[string_ids], entry_sizes) + within
+        not_self = left != right
+        left, right = left[not_self], right[not_self]
+        if len(left) == 0:
+            # 모든 공고에 스킬이 하나뿐인 경우
+            return cls(vocab, np.zeros(n_skills + 1, dtype=np.int64),
+                       np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int64), postings)
+
+        # (왼쪽, 오른쪽) 스킬 쌍별 공고 수 합산: 쌍 키로 정렬한 뒤 같은 키 구간을 더함
+        key_dtype = np.int32 if n_skills * n_skills < np.iinfo(np.int32).max else np.int64
+        pair_keys = codes[left].astype(key_dtype) * n_skills + codes[right].astype(key_dtype)
+        pair_weights = string_weights[string_ids[left]]
+        order = np.argsort(pair_keys)
+        pair_keys = pair_keys[order]
+        starts = np.flatnonzero(np.r_[True, pair_keys[1:] != pair_keys[:-1]])
+        pair_counts = np.add.reduceat(pair_weights[order], starts)
+        rows, cols = np.divmod(pair_keys[starts], n_skills)
+
+        # 행(왼쪽 스킬) 오름차순, 같은 행 안에서는 공고 수 내림차순(같으면 스킬 코드 순)으로 정렬하여 CSR 구성
+        max_count = int(pair_counts.max())
+        order = np.argsort(rows.astype(np.int64) * (max_count + 1) + (max_count - pair_counts), kind="stable")
+        indptr = np.zeros(n_skills + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n_skills), out=indptr[1:])
+        return cls(vocab, indptr, cols[order].astype(np.int32), pair_counts[order], postings)
+
+    def __len__(self):
+        return len(self.vocab)
+
+    def related_skills(self, skill, top_k=5):
+        """
+        주어진 스킬과 가장 자주 함께 등장한 스킬 top_k개를 반환합니다 (대소문자 구분 없음).
+
+        Returns:
+            [(스킬, 함께 등장한 공고 수), ...] 리스트. 모르는 스킬이면 빈 리스트.
+        """
+        code = self._codes.get(str(skill).strip().upper())
+        if code is None:
+            return []
+        start = self.indptr[code]
+        end = min(self.indptr[code + 1], start + top_k)
+        return list(zip(self.vocab[self.indices[start:end]].tolist(), self.counts[start:end].tolist()))
+
+
+def compute_skill_leaderboard(df):
+    """
+    전체 스킬 순위표를 계산합니다.
+
+    Returns:
+        skill, count, cooccurrence 컬럼을 가진 데이터프레임 (count_skills와 같은 순서).
+    """
+    skill_counts = count_skills(df)
+    cooccurrence = count_cooccurrences(df).reindex(skill_counts.index, fill_value=0)
+    return pd.DataFrame({
+        "skill": skill_counts.index,
+        "count": skill_counts.to_numpy(),
+        "cooccurrence": cooccurrence.to_numpy(dtype=np.int64),
+    })
+
+
+def leaderboard_path_for(csv_path):
+    """CSV 경로에 대응하는 스킬 순위표 파일 경로를 반환합니다."""
+    return os.path.splitext(csv_path)[0] + ".skills.json"
+
+
+def write_leaderboard(df, csv_path):
+    """
+    병합 데이터프레임의 스킬 순위표를 저장합니다.
+    csv_path의 CSV를 먼저 저장한 뒤 호출해야 신선도 정보가 올바르게 기록됩니다.
+
+    Returns:
+        str: 저장된 순위표 파일 경로.
+    """
+    leaderboard = compute_skill_leaderboard(df)
+    stat = os.stat(csv_path)
+    payload = {
+        "format_version": FORMAT_VERSION,
+        "n_rows": len(df),
+        "source_size": stat.st_size,
+        "source_mtime_ns": stat.st_mtime_ns,
+        "source_sha256": file_sha256(csv_path),
+        "skills": leaderboard.values.tolist(),
+    }
+
+    output_path = leaderboard_path_for(csv_path)
+    temp_path = output_path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False)
+    os.replace(temp_path, output_path)
+    return output_path
+
+
+def load_leaderboard_if_fresh(csv_path):
+    """
+    스킬 순위표가 있고 원본 CSV와 일치하면 데이터프레임으로 반환하고, 아니면 None을 반환합니다.
+    수정 시각만 다르면 (git checkout, 파일 복사 등) 내용 해시를 비교합니다.
+    """
+    try:
+        with open(leaderboard_path_for(csv_path), "r", encoding="utf-8") as f:
+            payload = json.load(f)
+        if payload.get("format_version") != FORMAT_VERSION:
+            return None
+        if os.path.exists(csv_path):
+            stat = os.stat(csv_path)
+            if payload["source_size"] != stat.st_size:
+                return None
+            if payload["source_mtime_ns"] != stat.st_mtime_ns and payload["source_sha256"] != file_sha256(csv_path):
+                return None
+        leaderboard = pd.DataFrame(payload["skills"], columns=LEADERBOARD_COLUMNS)
+        return leaderboard.astype({"count": "int64", "cooccurrence": "int64"})
+    except FileNotFoundError:
+        return None
+    except (OSError, KeyError, ValueError) as e:
+        print(f"스킬 순위표를 읽지 못해 다시 계산합니다 ({csv_path}): {e}")
+        return None
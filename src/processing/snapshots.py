@@ -0,0 +1,273 @@
+"""
+스킬/직무 수요의 날짜별 스냅샷 저장소 (추가 전용).
+
+병합 결과(merged_data_{category}.csv)는 병합할 때마다 덮어쓰므로, csv_merge.py가 병합할 때마다
+스킬별/직무별 공고 수를 CSV 옆의 스냅샷 파일에 추가해 둡니다. 대시보드는 원본 공고를 다시 읽지 않고
+이 파일만으로 "스킬 X의 최근 N회 추이", "두 날짜 사이 가장 많이 변한 스킬"을 조회합니다.
+
+저장 형식 (세 파일 모두 끝에 추가만 합니다):
+    {name}.snapshots.vocab  UTF-8 텍스트, 한 줄에 "종류<TAB>이름" 하나 (줄 번호가 항목 코드)
+    {name}.snapshots.bin    uint32 (항목 코드, 공고 수) 쌍의 연속 배열
+    {name}.snapshots.jsonl  스냅샷 한 줄: date, taken_at, rows, vocab_size, offset, length
+                            (offset/length는 .bin의 쌍 단위 위치)
+
+- 어휘와 개수를 먼저 쓰고 메타데이터 줄을 마지막에 쓰므로, 기록 도중 중단되어도
+  메타데이터에 없는 꼬리 데이터는 무시됩니다.
+- 같은 날짜의 스냅샷이 여러 개이면 마지막 것을 사용합니다.
+- 공고 수가 MIN_SNAPSHOT_COUNT 미만인 항목(대부분 스크래핑 잡음)은 저장하지 않습니다.
+"""
+import json
+import os
+import time
+from datetime import date as date_type
+
+import numpy as np
+import pandas as pd
+
+from src.dashboard.position_normalizer import PositionNormalizer
+from src.processing.skill_stats import count_skills
+
+KINDS = ("skill", "position")
+MIN_SNAPSHOT_COUNT = 2
+
+
+def snapshot_paths_for(csv_path):
+    """CSV 경로에 대응하는 (메타데이터, 어휘, 개수) 스냅샷 파일 경로를 반환합니다."""
+    base = os.path.splitext(csv_path)[0] + ".snapshots"
+    return base + ".jsonl", base + ".vocab", base + ".bin"
+
+
+def _clean_name(name):
+    """어휘 파일의 줄/구분자와 겹치지 않도록 개행과 탭을 공백으로 바꿉니다."""
+    return " ".join(str(name).split())
+
+
+def snapshot_counts(df):
+    """
+    병합 데이터프레임의 스냅샷 항목별 공고 수를 계산합니다.
+
+    Returns:
+        {"skill": Series, "position": Series} (이름 -> 공고 수). 스킬은 count_skills와 같은 기준,
+        직무는 정규화된 직무명(position_group) 기준입니다.
+    """
+    positions = PositionNormalizer().normalize_series(df["position"]).value_counts()
+    return {
+        "skill": count_skills(df),
+        "position": positions[positions.index.astype(str) != "nan"],
+    }
+
+
+def _read_vocab(vocab_path):
+    """어휘 파일을 읽어 (종류, 이름) 목록을 반환합니다 (목록 위치가 항목 코드)."""
+    if not os.path.exists(vocab_path):
+        return []
+    with open(vocab_path, "r", encoding="utf-8") as f:
+        lines = f.read().split("\n")
+    if lines and lines[-1] == "":
+        lines.pop()
+    return [tuple(line.split("\t", 1)) if "\t" in line else ("", line) for line in lines]
+
+
+def _append_lines(path, text):
+    """
+    텍스트 파일 끝에 줄들을 추가합니다.
+    이전 기록이 중단되어 파일이 개행으로 끝나지 않으면, 새 줄이 잘린 줄에 붙지 않도록 개행을 먼저 씁니다.
+    """
+    with open(path, "a+b") as f:
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                text = "\n" + text
+        f.write(text.encode("utf-8"))
+
+
+def append_snapshot(csv_path, df, snapshot_date=None):
+    """
+    병합 데이터프레임의 스킬/직무별 공고 수를 csv_path의 스냅샷 파일에 추가합니다.
+
+    Args:
+        csv_path: 병합 결과 CSV 경로 (스냅샷 파일 위치 결정).
+        df: 병합 데이터프레임.
+        snapshot_date: 스냅샷 날짜 (datetime.date 또는 'YYYY-MM-DD'). 기본값은 오늘.
+
+    Returns:
+        dict: 추가한 메타데이터 줄.
+    """
+    meta_path, vocab_path, counts_path = snapshot_paths_for(csv_path)
+    snapshot_date = str(snapshot_date or date_type.today().isoformat())
+
+    vocab = _read_vocab(vocab_path)
+    codes = {entry: code for code, entry in enumerate(vocab)}
+
+    new_entries = []
+    pairs = []
+    for kind, counts in snapshot_counts(df).items():
+        counts = counts[counts >= MIN_SNAPSHOT_COUNT]
+        for name, count in zip(counts.index, counts.to_numpy()):
+            entry = (kind, _clean_name(name))
+            code = codes.get(entry)
+            if code is None:
+                code = codes[entry] = len(codes)
+                new_entries.append(entry)
+            pairs.append((code, int(count)))
+
+    if new_entries:
+        _append_lines(vocab_path, "".join(f"{kind}\t{name}\n" for kind, name in new_entries))
+
+    # 중단된 기록의 꼬리가 있어도 파일 끝에서 시작 (메타데이터가 가리키지 않는 데이터는 무시됨)
+    offset = os.path.getsize(counts_path) // 8 if os.path.exists(counts_path) else 0
+    with open(counts_path, "ab") as f:
+        if os.path.getsize(counts_path) % 8:
+            f.truncate(offset * 8)
+        np.asarray(pairs, dtype=np.uint32).reshape(-1, 2).tofile(f)
+
+    meta = {
+        "date": snapshot_date,
+        "taken_at": time.time(),
+        "rows": len(df),
+        "vocab_size": len(codes),
+        "offset": offset,
+        "length": len(pairs),
+    }
+    _append_lines(meta_path, json.dumps(meta) + "\n")
+    return meta
+
+
+class SnapshotHistory:
+    """
+    스냅샷 저장소를 읽어 만든 (스냅샷 x 항목) 공고 수 행렬.
+
+    종류(스킬/직무)별로 int32 밀집 행렬을 한 번 만들어 두므로,
+    항목 하나의 추이는 열 하나, 두 날짜 비교는 행 두 개만 읽습니다 (원본 공고는 읽지 않음).
+    """
+
+    def __init__(self, dates, rows, names, counts):
+        self.dates = np.asarray(dates, dtype=object)   # 'YYYY-MM-DD', 오름차순
+        self.rows = np.asarray(rows, dtype=np.int64)    # 스냅샷별 전체 공고 수
+        self.names = names                              # 종류 -> 항목 이름 배열
+        self.counts = counts                            # 종류 -> (스냅샷 수, 항목 수) int32
+        self._positions = {
+            kind: {name: i for i, name in enumerate(kind_names)} for kind, kind_names in names.items()
+        }
+
+    @classmethod
+    def load(cls, csv_path):
+        """
+        csv_path의 스냅샷 파일을 읽습니다. 파일이 없으면 빈 기록을 반환합니다.
+        개수 파일(.bin)이 없거나 잘려서 메타데이터가 가리키는 구간이 없는 스냅샷은 건너뜁니다.
+        """
+        meta_path, vocab_path, counts_path = snapshot_paths_for(csv_path)
+        vocab = _read_vocab(vocab_path)
+        # 개수 파일이 없으면 메타데이터가 가리킬 데이터가 없으므로 빈 기록
+        pairs = np.fromfile(counts_path, dtype=np.uint32) if os.path.exists(counts_path) else np.empty(0, dtype=np.uint32)
+        pairs = pairs[: len(pairs) // 2 * 2].reshape(-1, 2)
+
+        latest = {}
+        if os.path.exists(meta_path):
+            with open(meta_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        meta = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # 기록 도중 중단된 마지막 줄
+                    if meta["offset"] + meta["length"] > len(pairs) or meta["vocab_size"] > len(vocab):
+                        continue  # 개수/어휘 파일이 잘려 가리키는 데이터가 없는 스냅샷
+                    latest[meta["date"]] = meta
+
+        metas = [latest[d] for d in sorted(latest)]
+
+        # 스냅샷별 (코드, 공고 수) 구간을 이어 붙이고 행 번호를 함께 기록
+        spans = [pairs[m["offset"]: m["offset"] + m["length"]] for m in metas]
+        snapshot_rows = np.repeat(np.arange(len(metas)), [len(span) for span in spans])
+        entries = np.concatenate(spans) if spans else np.empty((0, 2), dtype=np.uint32)
+
+        # 어휘 코드 -> (종류 번호, 종류 안의 열 번호)
+        kind_ids = np.array([KINDS.index(kind) if kind in KINDS else -1 for kind, _ in vocab], dtype=np.int64)
+        vocab_names = np.array([name for _, name in vocab], dtype=object)
+        local_columns = np.zeros(len(vocab), dtype=np.int64)
+        entry_kinds = kind_ids[entries[:, 0]] if len(vocab) else np.zeros(len(entries), dtype=np.int64)
+
+        names, counts = {}, {}
+        for kind_id, kind in enumerate(KINDS):
+            in_vocab = kind_ids == kind_id
+            local_columns[in_vocab] = np.arange(in_vocab.sum())
+            in_kind = entry_kinds == kind_id
+            matrix = np.zeros((len(metas), int(in_vocab.sum())), dtype=np.int32)
+            matrix[snapshot_rows[in_kind], local_columns[entries[in_kind, 0]]] = entries[in_kind, 1]
+            names[kind] = vocab_names[in_vocab]
+            counts[kind] = matrix
+
+        return cls([m["date"] for m in metas], [m["rows"] for m in metas], names, counts)
+
+    def __len__(self):
+        return len(self.dates)
+
+    def _column(self, kind, name):
+        key = _clean_name(name)
+        if kind == "skill":
+            key = key.upper()
+        return self._positions[kind].get(key)
+
+    def _snapshot_at(self, snapshot_date):
+        """snapshot_date 당일 또는 그 이전의 마지막 스냅샷 번호 (없으면 첫 스냅샷)."""
+        if snapshot_date is None:
+            return len(self.dates) - 1
+        i = np.searchsorted(self.dates, str(snapshot_date), side="right") - 1
+        return max(int(i), 0)
+
+    def history(self, name, kind="skill", last_n=None):
+        """
+        항목 하나의 스냅샷별 공고 수와 비율.
+
+        Returns:
+            date, count, share 컬럼의 데이터프레임 (최근 last_n개 스냅샷, 날짜 오름차순).
+            share는 해당 스냅샷 전체 공고 수 대비 비율입니다. 처음 보는 항목이면 공고 수 0.
+        """
+        start = max(len(self.dates) - last_n, 0) if last_n else 0
+        column = self._column(kind, name)
+        counts = (
+            self.counts[kind][start:, column] if column is not None
+            else np.zeros(len(self.dates) - start, dtype=np.int32)
+        )
+        return pd.DataFrame({
+            "date": self.dates[start:],
+            "count": counts,
+            "share": counts / np.maximum(self.rows[start:], 1),
+        })
+
+    def top_movers(self, start_date=None, end_date=None, kind="skill", top_k=10, by="share"):
+        """
+        두 날짜 사이에 가장 많이 늘어나거나 줄어든 항목.
+
+        Args:
+            start_date, end_date: 비교할 날짜. 각 날짜 당일 또는 그 이전의 마지막 스냅샷을 사용합니다.
+                기본값은 첫 스냅샷과 마지막 스냅샷.
+            by: 'share' (전체 공고 대비 비율 변화, 데이터 규모 변화에 영향받지 않음) 또는 'count'.
+
+        Returns:
+            name, start_count, end_count, count_change, start_share, end_share, share_change 컬럼의
+            데이터프레임 (변화량 절댓값 기준 내림차순 top_k개).
+        """
+        if not len(self.dates):
+            return pd.DataFrame(columns=[
+                "name", "start_count", "end_count", "count_change", "start_share", "end_share", "share_change"
+            ])
+        i = 0 if start_date is None else self._snapshot_at(start_date)
+        j = self._snapshot_at(end_date)
+        start_counts = self.counts[kind][i].astype(np.int64)
+        end_counts = self.counts[kind][j].astype(np.int64)
+        start_share = start_counts / max(self.rows[i], 1)
+        end_share = end_counts / max(self.rows[j], 1)
+
+        change = end_share - start_share if by == "share" else end_counts - start_counts
+        order = np.argsort(-np.abs(change), kind="stable")[:top_k]
+        order = order[change[order] != 0]
+        return pd.DataFrame({
+            "name": self.names[kind][order],
+            "start_count": start_counts[order],
+            "end_count": end_counts[order],
+            "count_change": (end_counts - start_counts)[order],
+            "start_share": start_share[order],
+            "end_share": end_share[order],
+            "share_change": (end_share - start_share)[order],
+        })
@@ -0,0 +1,161 @@
+"""
+스킬 빈도로 만든 워드 클라우드 이미지 (디스크 캐시).
+
+대시보드 상단 이미지는 카테고리별 스킬 공고 수로 만들고, 병합 CSV 옆에 저장해 두었다가 그대로 전송합니다.
+파일 이름에 이미지에 들어가는 스킬 빈도(상위 MAX_WORDS개)와 그리기 설정의 해시를 넣으므로,
+다시 병합하여 빈도가 바뀌면 새 파일을 만들고 빈도가 같으면 기존 파일을 재사용합니다.
+
+    {name}.wordcloud-{해시}.jpg  (JPEG, 이전 해시의 파일은 새로 저장할 때 삭제)
+
+st.image는 JPEG/PNG/GIF가 아니거나 본문 최대 너비(1460px)보다 큰 이미지를 재실행마다 다시 인코딩하므로,
+그 크기 이하의 JPEG로 저장하여 캐시된 바이트를 그대로 전송하도록 합니다.
+
+wordcloud 패키지는 선택 사항입니다 (pip install wordcloud). 없으면 이미지를 만들지 않고,
+대시보드는 정적 이미지(data/wordcloud_TECH_STACK.png)를 대신 사용합니다.
+"""
+import glob
+import hashlib
+import io
+import json
+import os
+
+try:
+    from wordcloud import WordCloud
+except ImportError:
+    WordCloud = None
+
+# 워드 클라우드 설정 (visualization_wordcloud.ipynb와 같은 스타일)
+WIDTH = 1460                # st.image가 크기를 줄이지 않는 최대 너비
+HEIGHT = 310
+MAX_WORDS = 200
+BACKGROUND_COLOR = "black"
+COLORMAP = "viridis"
+TITLE = "TECH STACK"        # 가운데에 겹쳐 쓰는 제목
+IMAGE_FORMAT = "JPEG"       # st.image가 다시 인코딩하지 않는 형식
+IMAGE_QUALITY = 80
+STYLE_VERSION = 1           # 그리기 설정을 바꾸면 올려서 기존 캐시를 무효화
+FONT_PATH_ENV = "WORDCLOUD_FONT_PATH"  # 한글 스킬명을 표시하려면 한글 글꼴 경로 지정
+
+
+def wordcloud_available():
+    """wordcloud 패키지가 설치되어 있는지 확인합니다."""
+    return WordCloud is not None
+
+
+def _frequencies(skill_counts):
+    """
+    이미지에 들어가는 (스킬, 공고 수) 상위 MAX_WORDS개 딕셔너리.
+    공고 수가 같으면 이름순으로 잘라, 같은 빈도에서 항상 같은 해시가 나오도록 합니다.
+    """
+    frequencies = {
+        str(name): int(count) for name, count in zip(skill_counts.index, skill_counts.to_numpy())
+        if count > 0 and str(name).strip()
+    }
+    top = sorted(frequencies.items(), key=lambda item: (-item[1], item[0]))[:MAX_WORDS]
+    return dict(top)
+
+
+def wordcloud_digest(skill_counts, title=TITLE):
+    """스킬 빈도와 그리기 설정의 해시 (캐시 파일 이름에 사용)."""
+    payload = json.dumps(
+        [STYLE_VERSION, WIDTH, HEIGHT, title, os.getenv(FONT_PATH_ENV, ""), list(_frequencies(skill_counts).items())],
+        ensure_ascii=False,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def wordcloud_path_for(csv_path, digest):
+    """CSV 경로와 해시에 대응하는 워드 클라우드 이미지 경로를 반환합니다."""
+    return f"{os.path.splitext(csv_path)[0]}.wordcloud-{digest}.jpg"
+
+
+def load_wordcloud_if_fresh(csv_path, skill_counts, title=TITLE, digest=None):
+    """
+    현재 스킬 빈도로 만든 이미지가 캐시에 있으면 바이트를, 없으면 None을 반환합니다.
+    digest(wordcloud_digest 결과)를 주면 해시를 다시 계산하지 않습니다.
+    """
+    digest = digest or wordcloud_digest(skill_counts, title)
+    try:
+        with open(wordcloud_path_for(csv_path, digest), "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def render_wordcloud(skill_counts, title=TITLE):
+    """스킬 빈도로 워드 클라우드를 그려 JPEG 바이트를 반환합니다 (같은 빈도면 같은 배치)."""
+    from PIL import ImageDraw, ImageFont
+
+    font_path = os.getenv(FONT_PATH_ENV) or None
+    cloud = WordCloud(
+        width=WIDTH,
+        height=HEIGHT,
+        background_color=BACKGROUND_COLOR,
+        colormap=COLORMAP,
+        max_words=MAX_WORDS,
+        font_path=font_path,
+        random_state=0,
+    ).generate_from_frequencies(_frequencies(skill_counts))
+    image = cloud.to_image()
+
+    # 가운데 제목 (흰색, 굵게 보이도록 검은 외곽선)
+    if title:
+        draw = ImageDraw.Draw(image)
+        font = ImageFont.truetype(font_path or cloud.font_path, size=HEIGHT // 3)
+        draw.text(
+            (WIDTH / 2, HEIGHT / 2), title, font=font, fill="white", anchor="mm",
+            stroke_width=HEIGHT // 60, stroke_fill="black",
+        )
+
+    return _encode(image)
+
+
+def _encode(image):
+    buffer = io.BytesIO()
+    image.convert("RGB").save(buffer, format=IMAGE_FORMAT, quality=IMAGE_QUALITY, optimize=True, progressive=True)
+    return buffer.getvalue()
+
+
+def fit_display_image(image_bytes):
+    """
+    이미지 바이트를 워드 클라우드와 같은 형식/최대 너비로 변환합니다 (정적 대체 이미지용).
+    투명한 부분은 배경색으로 채웁니다.
+    """
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(image_bytes))
+    if image.width > WIDTH:
+        image = image.resize((WIDTH, round(image.height * WIDTH / image.width)), Image.LANCZOS)
+    if image.mode in ("RGBA", "LA", "P"):
+        background = Image.new("RGB", image.size, BACKGROUND_COLOR)
+        image = image.convert("RGBA")
+        background.paste(image, mask=image.getchannel("A"))
+        image = background
+    return _encode(image)
+
+
+def write_wordcloud(csv_path, skill_counts, title=TITLE, digest=None):
+    """
+    스킬 빈도로 워드 클라우드를 만들어 csv_path 옆에 저장하고, 이전 빈도의 이미지는 삭제합니다.
+    digest(wordcloud_digest 결과)를 주면 해시를 다시 계산하지 않습니다.
+
+    Returns:
+        str: 저장된 이미지 경로. 이미 있으면 다시 그리지 않습니다. wordcloud 패키지가 없으면 None.
+    """
+    if not wordcloud_available():
+        return None
+
+    output_path = wordcloud_path_for(csv_path, digest or wordcloud_digest(skill_counts, title))
+    if not os.path.exists(output_path):
+        temp_path = output_path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(render_wordcloud(skill_counts, title))
+        os.replace(temp_path, output_path)
+
+    for stale_path in glob.glob(glob.escape(os.path.splitext(csv_path)[0]) + ".wordcloud-*.jpg"):
+        if stale_path != output_path:
+            try:
+                os.remove(stale_path)
+            except OSError:
+                pass
+    return output_path
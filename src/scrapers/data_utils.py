@@ -1,8 +1,10 @@
 # 라이브러리 임포트
 import pandas as pd
+import json
 import logging
 import os
 import re
+from functools import lru_cache
 from typing import List, Dict, Any # 타입 힌트를 위해 임포트
 
 
@@ -29,11 +31,33 @@ DEFAULT_HEADERS = {
 logging.info("기본 헤더 설정 완료 (상수)")
 
 
+# skill 데이터 정리용 정규식 (모듈 로드 시 한 번만 컴파일)
+# 알파벳, '#', '+', 공백이 아닌 모든 문자(한글, 숫자, 온점 등)와 개행 문자, LINE SEPARATOR(U+2028)를 제거합니다.
+# 개행 문자와 U+2028도 공백 문자(\s)이지만 단어 구분자로 쓰지 않고 삭제합니다 (기존 동작 유지).
+SKILL_CLEAN_PATTERN = re.compile(r"[^a-zA-Z#+\s]|[\n\u2028]")
+
+# filter_skill_data 결과를 기억해 둘 최대 원본 문자열 수
+SKILL_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=SKILL_CACHE_SIZE)
+def _clean_skill_string(skill: str) -> str:
+    """filter_skill_data의 실제 정리 단계 (원본 문자열별로 결과를 기억)."""
+    # 1. 삭제할 문자를 한 번의 치환으로 제거
+    #    (숫자는 이 단계에서 모두 제거되므로 별도의 숫자 제거 단계가 필요 없음)
+    filtered_skill = SKILL_CLEAN_PATTERN.sub('', skill)
+
+    # 2. 단어 분리, 중복 제거(처음 나온 순서 유지) 및 ', '로 연결
+    return ', '.join(dict.fromkeys(filtered_skill.split()))
+
+
 # skill 데이터 필터링 함수 정의
 def filter_skill_data(skill: str | None) -> str:
     """
     skill 데이터에서 조건부로 특수문자를 제거하고, 단어 목록 형태로 정리합니다.
 
+    같은 스킬 문자열은 여러 공고와 플랫폼에 반복해서 나오므로 결과를 LRU 캐시에 기억해 둡니다.
+
     Args:
         skill (str | None): 원본 스킬 문자열.
 
@@ -43,41 +67,24 @@ def filter_skill_data(skill: str | None) -> str:
     """
     if not skill:
         return ""
+    return _clean_skill_string(skill)
 
-    # 0. 한글 제거
-    no_hangul = re.compile('[ㄱ-ㅣ가-힣]+')
-    filtered_skill = no_hangul.sub('', skill)
-
-    # 1. 개행 문자 제거
-    filtered_skill = filtered_skill.replace('\n', '')
-
-    # 2. LINE SEPARATOR 제거 (U+2028)
-    filtered_skill = filtered_skill.replace('\u2028', '')
-
-    # 3. 알파벳, '#', '+', 공백이 아닌 모든 문자 제거 (온점 포함)
-    filtered_skill = re.sub(r"[^a-zA-Z#+\s]", "", filtered_skill)
-
-    # 4. 알파벳 오른쪽 옆에 공백 없이 붙어 있는 숫자를 제외한 모든 숫자 제거
-    def remove_standalone_numbers(text):
-        def replace(match):
-            return ""
-        # 숫자 앞뒤로 알파벳이 없는 경우 제거
-        return re.sub(r"(?<![a-zA-Z])\d+(?![a-zA-Z])", replace, text)
-
-    filtered_skill = remove_standalone_numbers(filtered_skill)
 
-    # 5. 단어 분리, 공백 제거, 중복 제거 및 ', '로 연결
-    words = filtered_skill.split()  # 공백을 기준으로 단어 분리
-    unique_words = []
-    seen = set()
-    for word in words:
-        if word not in seen:
-            unique_words.append(word)
-            seen.add(word)
+def filter_skill_series(skills: pd.Series) -> pd.Series:
+    """
+    스킬 문자열 Series 전체를 filter_skill_data와 같은 방식으로 정리합니다.
+    고유 문자열만 한 번씩 정리한 뒤 전체 행에 펼칩니다.
 
-    filtered_skill = ', '.join(unique_words)
+    Args:
+        skills (pd.Series): 원본 스킬 문자열 Series.
 
-    return filtered_skill
+    Returns:
+        pd.Series: 정리된 스킬 문자열 Series (같은 인덱스). 결측값과 빈 문자열은 빈 문자열이 됩니다.
+    """
+    codes, uniques = pd.factorize(skills)
+    cleaned = pd.Index([filter_skill_data(value) for value in uniques] + [""], dtype=object)
+    # 결측값 코드 -1은 마지막 항목("")을 가리킴
+    return pd.Series(cleaned.to_numpy()[codes], index=skills.index, name=skills.name)
 
 
 # 데이터프레임을 CSV 파일로 저장하는 함수
@@ -124,18 +131,184 @@ def save_data_to_csv(data: List[Dict[str, Any]] | pd.DataFrame, filename: str, f
     else:
         logging.info(f"'{folder}' 폴더가 이미 존재합니다.")
 
+    # 임시 파일에 모두 쓴 뒤 교체하여, 저장 중 중단되어도 잘린 CSV가 남지 않도록 함
+    temp_path = filepath + '.tmp'
     try:
         # encoding='utf-8-sig' : Excel에서 한글 깨짐 방지 (BOM 포함 UTF-8)
-        df.to_csv(filepath, index=index, encoding=encoding)
+        df.to_csv(temp_path, index=index, encoding=encoding)
+        os.replace(temp_path, filepath)
         logging.info(f"DataFrame이 '{filepath}'으로 성공적으로 저장되었습니다.")
         print(f"\n파일 저장 완료: {filepath}")
         return filepath
     except Exception as e:
         logging.error(f"DataFrame을 CSV로 저장하는 중 오류 발생: {e}", exc_info=True)
         print(f"\n파일 저장 실패: {e}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
         return None
 
 
+# 스크래핑 중 레코드를 나누어 저장하는 CSV 작성기
+class StreamingCSVWriter:
+    """
+    스크래핑 결과를 배치 단위로 CSV에 이어 쓰는 작성기.
+
+    - 레코드는 '{파일}.part' 임시 파일에 flush_every 건마다 기록되고, close() 시 최종 파일로 원자적으로 교체됩니다.
+      따라서 스크래핑이 중간에 멈춰도 최종 CSV 파일이 잘린 상태로 남지 않습니다.
+    - flush할 때마다 '{파일}.part.json' 체크포인트에 기록된 바이트 수, 행 수, 사용자 상태(state)를 저장합니다.
+    - resume=True로 다시 만들면 마지막 체크포인트 이후에 쓰다 만 부분을 잘라내고 이어서 씁니다.
+      resume_state로 마지막 flush 시점의 상태(예: 페이지 번호)를 확인하여 그 다음부터 스크래핑하면 됩니다.
+
+    사용 예:
+        with StreamingCSVWriter('data_jumpit_total.csv') as writer:
+            page_no = (writer.resume_state or {}).get('page_no', 0) + 1
+            while ...:
+                writer.append(page_records, state={'page_no': page_no})
+                page_no += 1
+    """
+
+    def __init__(self, filename: str, folder: str = 'data', encoding: str = 'utf-8-sig',
+                 flush_every: int = 100, resume: bool = True, columns: List[str] | None = None):
+        """
+        Args:
+            filename (str): 최종 CSV 파일 이름 (예: 'data_jumpit_total.csv').
+            folder (str): CSV 파일을 저장할 폴더 이름. 기본값은 'data'.
+            encoding (str): CSV 파일 인코딩. 기본값은 'utf-8-sig'.
+            flush_every (int): 버퍼에 쌓인 레코드가 이 수 이상이면 파일에 기록합니다.
+            resume (bool): 중단된 임시 파일과 체크포인트가 있으면 이어서 씁니다.
+                False이면 기존 임시 파일을 버리고 새로 시작합니다.
+            columns (List[str] | None): CSV 컬럼 순서. 없으면 첫 배치의 컬럼을 사용합니다.
+        """
+        os.makedirs(folder, exist_ok=True)
+        self.filepath = os.path.join(folder, filename)
+        self.temp_path = self.filepath + '.part'
+        self.checkpoint_path = self.temp_path + '.json'
+        self.encoding = encoding
+        self.flush_every = flush_every
+        self.columns = list(columns) if columns else None
+        self.rows_written = 0
+        self.resume_state = None
+        self._buffer = []
+        self._pending_state = None
+        self._closed = False
+
+        if resume and self._restore_checkpoint():
+            logging.info(f"'{self.temp_path}'에서 이어서 씁니다 ({self.rows_written}행 기록됨, 상태: {self.resume_state}).")
+        else:
+            for path in (self.temp_path, self.checkpoint_path):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def _restore_checkpoint(self) -> bool:
+        """체크포인트를 읽고 임시 파일을 마지막 flush 지점으로 잘라냅니다. 이어 쓸 수 없으면 False."""
+        if not (os.path.exists(self.temp_path) and os.path.exists(self.checkpoint_path)):
+            return False
+        try:
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                checkpoint = json.load(f)
+            if os.path.getsize(self.temp_path) < checkpoint['bytes']:
+                return False
+            # 마지막 체크포인트 이후에 쓰다 만 내용 제거
+            with open(self.temp_path, 'r+b') as f:
+                f.truncate(checkpoint['bytes'])
+        except (OSError, ValueError, KeyError) as e:
+            logging.warning(f"체크포인트를 읽을 수 없어 처음부터 다시 씁니다: {e}")
+            return False
+
+        self.columns = checkpoint.get('columns') or self.columns
+        self.rows_written = checkpoint['rows']
+        self.resume_state = self._pending_state = checkpoint.get('state')
+        return True
+
+    def append(self, records: List[Dict[str, Any]] | pd.DataFrame, state: Any = None):
+        """
+        레코드 배치를 추가합니다. 버퍼가 flush_every 이상이면 파일에 기록합니다.
+
+        Args:
+            records: Dict의 리스트 또는 DataFrame.
+            state: 이 배치까지 처리했음을 나타내는 JSON 직렬화 가능한 값 (예: {'page_no': 3}).
+                flush 시 체크포인트에 저장되어 resume_state로 돌려받습니다.
+        """
+        if self._closed:
+            raise ValueError("이미 닫힌 StreamingCSVWriter입니다.")
+        if isinstance(records, pd.DataFrame):
+            records = records.to_dict('records')
+        self._buffer.extend(records)
+        if state is not None:
+            self._pending_state = state
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """버퍼의 레코드를 임시 파일에 기록하고 체크포인트를 갱신합니다."""
+        if not self._buffer:
+            return
+        df = pd.DataFrame(self._buffer)
+        if self.columns is None:
+            self.columns = df.columns.tolist()
+        df = df.reindex(columns=self.columns)
+
+        write_header = not os.path.exists(self.temp_path) or os.path.getsize(self.temp_path) == 0
+        with open(self.temp_path, 'a', encoding=self.encoding, newline='') as f:
+            df.to_csv(f, header=write_header, index=False)
+            f.flush()
+            os.fsync(f.fileno())
+
+        self.rows_written += len(df)
+        self._buffer = []
+        self.resume_state = self._pending_state
+
+        checkpoint = {
+            'bytes': os.path.getsize(self.temp_path),
+            'rows': self.rows_written,
+            'columns': self.columns,
+            'state': self.resume_state,
+        }
+        temp_checkpoint = self.checkpoint_path + '.tmp'
+        with open(temp_checkpoint, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint, f, ensure_ascii=False)
+        os.replace(temp_checkpoint, self.checkpoint_path)
+        logging.info(f"'{self.temp_path}'에 {len(df)}행 기록 (누적 {self.rows_written}행).")
+
+    def close(self) -> str | None:
+        """
+        남은 레코드를 기록하고 임시 파일을 최종 CSV 파일로 교체합니다.
+
+        Returns:
+            str | None: 저장된 파일 경로. 기록된 데이터가 없으면 None.
+        """
+        if self._closed:
+            return self.filepath if os.path.exists(self.filepath) else None
+        self.flush()
+        self._closed = True
+
+        if self.rows_written == 0:
+            logging.warning("저장할 데이터가 없습니다. CSV 파일을 생성하지 않습니다.")
+            for path in (self.temp_path, self.checkpoint_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            return None
+
+        os.replace(self.temp_path, self.filepath)
+        os.remove(self.checkpoint_path)
+        logging.info(f"'{self.filepath}'에 {self.rows_written}행을 저장했습니다.")
+        print(f"\n파일 저장 완료: {self.filepath}")
+        return self.filepath
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            # 오류로 중단된 경우: 버퍼의 완성된 레코드까지 기록하고 임시 파일은 이어 쓰기용으로 남김
+            self.flush()
+            self._closed = True
+            logging.error(f"스크래핑이 중단되었습니다. 다음 실행에서 '{self.temp_path}'부터 이어서 쓸 수 있습니다.")
+        return False
+
+
 # CSV 파일을 읽어와 DataFrame으로 반환하는 함수
 def load_data_from_csv(filepath: str, encoding: str = 'utf-8-sig') -> pd.DataFrame | None:
     """
@@ -0,0 +1,141 @@
+"""
+csv_merge 병합 방식(전체 / 증분 / 스트리밍)이 같은 입력에서 같은 결과를 만드는지 확인합니다.
+"""
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.processing import csv_merge
+from src.processing.columnar import COLUMNS, ColumnarBuilder, read_columnar
+from src.processing.csv_merge import StreamingKeySet, dedup_key_hashes, merge_and_deduplicate_csv_files
+from src.processing.skill_stats import load_leaderboard_if_fresh
+from src.processing.snapshots import SnapshotHistory
+
+DEDUP_COLUMNS = ["company", "skill"]
+
+# 파일 사이, 파일 안의 중복 키와 결측값, 따옴표/쉼표가 들어간 값을 포함
+FIRST_POSTINGS = pd.DataFrame({
+    "company": ["토스", "당근", "토스", "카카오", "네이버", None],
+    "position": ["백엔드 개발자", "Frontend Engineer", "백엔드 개발자 (신입)", 'Server "Core"', "검색, 추천", "데이터 엔지니어"],
+    "skill": ["Java, Spring", "React, TypeScript", "Java, Spring", "Go, Kubernetes", None, "Python, Spark"],
+})
+SECOND_POSTINGS = pd.DataFrame({
+    "company": ["당근", "라인", "라인", "카카오", "우아한형제들"],
+    "position": ["프론트엔드", "iOS 개발자", "iOS 개발자", "Server", "Android, Kotlin"],
+    "skill": ["React, TypeScript", "Swift", "Swift", "Go, Kubernetes, gRPC", "Kotlin"],
+})
+
+
+@pytest.fixture(autouse=True)
+def no_wordcloud(monkeypatch):
+    """병합은 모두 write_images=False로 실행하므로 워드 클라우드 이미지를 그리면 실패."""
+    def fail(*args, **kwargs):
+        raise AssertionError("write_images=False인데 워드 클라우드를 그렸습니다.")
+    monkeypatch.setattr(csv_merge, "write_wordcloud", fail)
+
+
+def write_source(directory, name, df):
+    df.to_csv(directory / name, index=False)
+
+
+def merged_bytes(directory):
+    return (directory / "merged_data_total.csv").read_bytes()
+
+
+def test_incremental_merge_matches_full_merge(tmp_path, capsys):
+    incremental_dir = tmp_path / "incremental"
+    full_dir = tmp_path / "full"
+    incremental_dir.mkdir()
+    full_dir.mkdir()
+
+    # 첫 번째 파일만 있을 때 병합한 뒤 두 번째 파일을 추가하고 증분 병합
+    write_source(incremental_dir, "data_a_total.csv", FIRST_POSTINGS)
+    merge_and_deduplicate_csv_files(str(incremental_dir), DEDUP_COLUMNS, incremental=True, write_images=False)
+    write_source(incremental_dir, "data_b_total.csv", SECOND_POSTINGS)
+    merge_and_deduplicate_csv_files(str(incremental_dir), DEDUP_COLUMNS, incremental=True, write_images=False)
+    assert "증분 병합" in capsys.readouterr().out
+
+    # 같은 두 파일을 한 번에 전체 병합
+    for name in ("data_a_total.csv", "data_b_total.csv"):
+        shutil.copy(incremental_dir / name, full_dir / name)
+    merge_and_deduplicate_csv_files(str(full_dir), DEDUP_COLUMNS, write_images=False)
+
+    assert merged_bytes(incremental_dir) == merged_bytes(full_dir)
+    expected = pd.concat([FIRST_POSTINGS, SECOND_POSTINGS], ignore_index=True).drop_duplicates(subset=DEDUP_COLUMNS)
+    assert len(pd.read_csv(incremental_dir / "merged_data_total.csv")) == len(expected)
+
+    # 증분 병합에서 다시 저장한 컬럼형 캐시도 전체 병합 결과와 같아야 함
+    incremental_frame = read_columnar(str(incremental_dir / "merged_data_total.csv")).frame
+    full_frame = read_columnar(str(full_dir / "merged_data_total.csv")).frame
+    pd.testing.assert_frame_equal(incremental_frame.astype(object), full_frame.astype(object))
+
+
+def test_incremental_merge_without_new_files_keeps_output(tmp_path):
+    write_source(tmp_path, "data_a_total.csv", FIRST_POSTINGS)
+    merge_and_deduplicate_csv_files(str(tmp_path), DEDUP_COLUMNS, incremental=True, write_images=False)
+    before = merged_bytes(tmp_path)
+
+    merge_and_deduplicate_csv_files(str(tmp_path), DEDUP_COLUMNS, incremental=True, write_images=False)
+
+    assert merged_bytes(tmp_path) == before
+
+
+def test_streaming_merge_matches_full_merge(tmp_path):
+    streaming_dir = tmp_path / "streaming"
+    full_dir = tmp_path / "full"
+    for directory in (streaming_dir, full_dir):
+        directory.mkdir()
+        write_source(directory, "data_a_total.csv", FIRST_POSTINGS)
+        write_source(directory, "data_b_total.csv", SECOND_POSTINGS)
+
+    merge_and_deduplicate_csv_files(str(streaming_dir), DEDUP_COLUMNS, chunksize=2, write_images=False)
+    merge_and_deduplicate_csv_files(str(full_dir), DEDUP_COLUMNS, write_images=False)
+
+    assert merged_bytes(streaming_dir) == merged_bytes(full_dir)
+
+    # 청크에서 모은 범주 코드로 만든 컬럼형 캐시, 스킬 순위표, 스냅샷도 전체 병합과 같아야 함
+    streaming_csv = str(streaming_dir / "merged_data_total.csv")
+    full_csv = str(full_dir / "merged_data_total.csv")
+    pd.testing.assert_frame_equal(read_columnar(streaming_csv).frame, read_columnar(full_csv).frame)
+    pd.testing.assert_frame_equal(load_leaderboard_if_fresh(streaming_csv), load_leaderboard_if_fresh(full_csv))
+    streaming_history = SnapshotHistory.load(streaming_csv)
+    full_history = SnapshotHistory.load(full_csv)
+    for kind in ("skill", "position"):
+        assert dict(zip(streaming_history.names[kind], streaming_history.counts[kind][-1])) == \
+            dict(zip(full_history.names[kind], full_history.counts[kind][-1]))
+
+
+def test_columnar_builder_matches_categorical_frame():
+    chunks = [FIRST_POSTINGS.iloc[:4], FIRST_POSTINGS.iloc[4:], SECOND_POSTINGS.drop(columns="position")]
+    builder = ColumnarBuilder()
+    for chunk in chunks:
+        builder.add(chunk)
+
+    expected = pd.concat(chunks, ignore_index=True).reindex(columns=list(COLUMNS))
+    frame = builder.to_frame()
+    assert builder.n_rows == len(expected)
+    for column in COLUMNS:
+        # 범주는 pd.Categorical과 같이 정렬되고, 값은 이어 붙인 청크와 같아야 함
+        values = expected[column].astype(object)
+        assert frame[column].cat.categories.tolist() == sorted(values.dropna().unique())
+        assert frame[column].astype(object).where(frame[column].notna(), None).tolist() == \
+            values.where(values.notna(), None).tolist()
+
+
+def test_streaming_key_set_matches_drop_duplicates():
+    # 최근 배열을 본 배열에 합치는 경우(고유 키 65536개 초과)까지 포함하는 크기
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "company": rng.integers(0, 2000, 300_000).astype(str),
+        "skill": rng.integers(0, 400, 300_000).astype(str),
+    })
+    keys = dedup_key_hashes(df, DEDUP_COLUMNS)
+
+    seen = StreamingKeySet()
+    is_new = np.concatenate([seen.add_new(chunk) for chunk in np.array_split(keys, 37)])
+
+    expected = ~df.duplicated(subset=DEDUP_COLUMNS, keep="first").to_numpy()
+    np.testing.assert_array_equal(is_new, expected)
+    np.testing.assert_array_equal(seen.to_array(), np.unique(keys))
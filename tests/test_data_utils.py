@@ -0,0 +1,116 @@
+"""
+StreamingCSVWriter가 중단 후 이어 쓸 때 헤더/BOM을 한 번만 쓰고 행을 잃거나 중복하지 않는지 확인합니다.
+"""
+import codecs
+import json
+
+import pandas as pd
+import pytest
+
+from src.scrapers.data_utils import StreamingCSVWriter
+
+FILENAME = "data_test_total.csv"
+PAGE_SIZE = 3
+PAGES = 8
+
+
+def page_records(page_no):
+    return [
+        {"company": f"회사{page_no}-{i}", "position": f"개발자, \"{i}\"", "skill": "Java, Spring"}
+        for i in range(PAGE_SIZE)
+    ]
+
+
+def all_records(pages=PAGES):
+    return [record for page_no in range(1, pages + 1) for record in page_records(page_no)]
+
+
+def scrape(writer, last_page=PAGES, fail_after=None):
+    """resume_state 다음 페이지부터 스크래핑합니다. fail_after 페이지를 추가한 뒤 예외를 발생시킵니다."""
+    page_no = (writer.resume_state or {}).get("page_no", 0) + 1
+    while page_no <= last_page:
+        writer.append(page_records(page_no), state={"page_no": page_no})
+        if page_no == fail_after:
+            raise RuntimeError("스크래핑 중단")
+        page_no += 1
+
+
+def assert_complete_csv(path, expected_records):
+    raw = path.read_bytes()
+    assert raw.startswith(codecs.BOM_UTF8)
+    assert raw.count(codecs.BOM_UTF8) == 1
+
+    text = raw.decode("utf-8-sig")
+    assert text.count("company,position,skill") == 1
+
+    df = pd.read_csv(path, encoding="utf-8-sig")
+    assert df.to_dict("records") == expected_records
+
+
+def test_resume_after_exception_and_torn_write(tmp_path):
+    with pytest.raises(RuntimeError):
+        with StreamingCSVWriter(FILENAME, folder=str(tmp_path), flush_every=5) as writer:
+            scrape(writer, fail_after=4)
+
+    part_path = tmp_path / (FILENAME + ".part")
+    assert not (tmp_path / FILENAME).exists()
+    # 마지막 체크포인트 이후 쓰다 만 내용 (BOM과 잘린 행)
+    with open(part_path, "ab") as f:
+        f.write(codecs.BOM_UTF8 + "회사,잘린".encode("utf-8"))
+
+    with StreamingCSVWriter(FILENAME, folder=str(tmp_path), flush_every=5) as writer:
+        # 예외로 중단될 때 버퍼까지 기록했으므로 4페이지 다음부터 이어 씀
+        assert writer.resume_state == {"page_no": 4}
+        assert writer.rows_written == 4 * PAGE_SIZE
+        scrape(writer)
+
+    assert_complete_csv(tmp_path / FILENAME, all_records())
+    assert not part_path.exists()
+    assert not (tmp_path / (FILENAME + ".part.json")).exists()
+
+
+def test_resume_after_kill_rescrapes_unflushed_pages(tmp_path):
+    # flush되지 않은 버퍼는 프로세스가 종료되면 사라짐 (close/__exit__ 없이 버림)
+    writer = StreamingCSVWriter(FILENAME, folder=str(tmp_path), flush_every=7)
+    scrape(writer, last_page=5)
+    flushed_pages = writer.resume_state["page_no"]
+    assert writer.rows_written == flushed_pages * PAGE_SIZE
+    assert flushed_pages < 5
+    del writer
+
+    with StreamingCSVWriter(FILENAME, folder=str(tmp_path), flush_every=7) as writer:
+        assert writer.resume_state == {"page_no": flushed_pages}
+        scrape(writer)
+
+    assert_complete_csv(tmp_path / FILENAME, all_records())
+
+
+def test_checkpoint_beyond_file_restarts(tmp_path):
+    with pytest.raises(RuntimeError):
+        with StreamingCSVWriter(FILENAME, folder=str(tmp_path), flush_every=1) as writer:
+            scrape(writer, fail_after=3)
+
+    # 체크포인트가 가리키는 위치까지 데이터가 기록되지 않은 경우 (파일이 더 짧음)
+    checkpoint_path = tmp_path / (FILENAME + ".part.json")
+    checkpoint = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+    checkpoint["bytes"] += 100
+    checkpoint_path.write_text(json.dumps(checkpoint), encoding="utf-8")
+
+    with StreamingCSVWriter(FILENAME, folder=str(tmp_path), flush_every=1) as writer:
+        assert writer.resume_state is None
+        assert writer.rows_written == 0
+        scrape(writer)
+
+    assert_complete_csv(tmp_path / FILENAME, all_records())
+
+
+def test_no_resume_discards_partial_file(tmp_path):
+    with pytest.raises(RuntimeError):
+        with StreamingCSVWriter(FILENAME, folder=str(tmp_path), flush_every=1) as writer:
+            scrape(writer, fail_after=2)
+
+    with StreamingCSVWriter(FILENAME, folder=str(tmp_path), resume=False) as writer:
+        assert writer.resume_state is None
+        scrape(writer, last_page=3)
+
+    assert_complete_csv(tmp_path / FILENAME, all_records(pages=3))
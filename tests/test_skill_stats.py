@@ -0,0 +1,27 @@
+"""
+count_skills가 입력 형식(CSV에서 읽은 문자열 컬럼, 컬럼형 캐시의 범주형 컬럼)과 관계없이 같은 순위를 내는지 확인합니다.
+"""
+import pandas as pd
+
+from src.processing.skill_stats import compute_skill_leaderboard, count_skills
+
+# 빈도가 같은 스킬이 여러 개 (JAVA/GO 2회, REACT/KOTLIN/SWIFT 1회), 대소문자/공백만 다른 표기 포함
+POSTINGS = pd.DataFrame({
+    "skill": ["Swift, Go", "Kotlin", "go , Java", "React, java", None],
+})
+
+
+def test_tied_counts_are_ordered_by_name():
+    counts = count_skills(POSTINGS)
+
+    assert counts.index.tolist() == ["GO", "JAVA", "KOTLIN", "REACT", "SWIFT"]
+    assert counts.tolist() == [2, 2, 1, 1, 1]
+
+
+def test_categorical_column_gives_same_order():
+    # 범주 순서가 등장 순서와 다른 범주형 컬럼 (컬럼형 캐시에서 읽은 데이터와 같은 형식)
+    categories = sorted(POSTINGS["skill"].dropna().unique(), reverse=True)
+    categorical = POSTINGS.astype({"skill": pd.CategoricalDtype(categories)})
+
+    pd.testing.assert_series_equal(count_skills(categorical), count_skills(POSTINGS))
+    pd.testing.assert_frame_equal(compute_skill_leaderboard(categorical), compute_skill_leaderboard(POSTINGS))
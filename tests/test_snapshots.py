@@ -0,0 +1,118 @@
+"""
+스냅샷 저장소가 기록 도중 중단된 파일을 복구하고, 같은 날짜의 마지막 스냅샷과 비율 변화를 올바르게 계산하는지 확인합니다.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.processing.snapshots import SnapshotHistory, append_snapshot, snapshot_paths_for
+
+# 첫날: JAVA/SPRING 3건, PYTHON 1건 (MIN_SNAPSHOT_COUNT 미만이라 저장하지 않음)
+FIRST_DAY = pd.DataFrame({
+    "company": ["토스", "당근", "카카오", "네이버"],
+    "position": ["백엔드 개발자"] * 4,
+    "skill": ["Java, Spring", "Java, Spring", "Java, Spring", "Python"],
+})
+# 둘째 날: JAVA 2건, PYTHON/DJANGO 2건
+SECOND_DAY = pd.DataFrame({
+    "company": ["토스", "당근", "라인", "네이버"],
+    "position": ["백엔드 개발자"] * 4,
+    "skill": ["Java", "Java", "Python, Django", "Python, Django"],
+})
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    return str(tmp_path / "merged_data_total.csv")
+
+
+def skill_counts_at(history, i):
+    """i번째 스냅샷의 스킬별 공고 수 (0건 제외)."""
+    return {name: int(count) for name, count in zip(history.names["skill"], history.counts["skill"][i]) if count}
+
+
+def test_history_and_top_movers(csv_path):
+    append_snapshot(csv_path, FIRST_DAY, snapshot_date="2025-01-01")
+    append_snapshot(csv_path, SECOND_DAY, snapshot_date="2025-01-02")
+
+    history = SnapshotHistory.load(csv_path)
+    assert history.dates.tolist() == ["2025-01-01", "2025-01-02"]
+    assert skill_counts_at(history, 0) == {"JAVA": 3, "SPRING": 3}
+    assert skill_counts_at(history, 1) == {"JAVA": 2, "PYTHON": 2, "DJANGO": 2}
+
+    java = history.history("java")
+    assert java["count"].tolist() == [3, 2]
+    assert java["share"].tolist() == [0.75, 0.5]
+
+    movers = history.top_movers(kind="skill", by="share")
+    assert movers["name"].iloc[0] == "SPRING"
+    assert set(movers["name"].iloc[1:3]) == {"PYTHON", "DJANGO"}
+    assert movers["name"].iloc[3] == "JAVA"
+    changes = dict(zip(movers["name"], movers["share_change"]))
+    assert changes == {"SPRING": -0.75, "PYTHON": 0.5, "DJANGO": 0.5, "JAVA": -0.25}
+    assert dict(zip(movers["name"], movers["count_change"]))["JAVA"] == -1
+
+
+def test_same_date_uses_last_snapshot(csv_path):
+    append_snapshot(csv_path, FIRST_DAY, snapshot_date="2025-01-01")
+    append_snapshot(csv_path, SECOND_DAY, snapshot_date="2025-01-01")
+
+    history = SnapshotHistory.load(csv_path)
+    assert history.dates.tolist() == ["2025-01-01"]
+    assert skill_counts_at(history, 0) == {"JAVA": 2, "PYTHON": 2, "DJANGO": 2}
+
+
+def test_torn_writes_are_ignored_and_repaired(csv_path):
+    meta_path, vocab_path, counts_path = snapshot_paths_for(csv_path)
+    append_snapshot(csv_path, FIRST_DAY, snapshot_date="2025-01-01")
+
+    # 다음 기록이 중단된 상태: 개수 파일에 쌍 일부와 잘린 값, 어휘 파일에 개행 없는 줄, 메타데이터에 잘린 줄
+    with open(counts_path, "ab") as f:
+        np.array([[0, 7]], dtype=np.uint32).tofile(f)
+        f.write(b"\x01\x02\x03")
+    with open(vocab_path, "a", encoding="utf-8") as f:
+        f.write("skill\tKOT")
+    with open(meta_path, "a", encoding="utf-8") as f:
+        f.write('{"date": "2025-01-02", "offs')
+
+    history = SnapshotHistory.load(csv_path)
+    assert history.dates.tolist() == ["2025-01-01"]
+    assert skill_counts_at(history, 0) == {"JAVA": 3, "SPRING": 3}
+
+    append_snapshot(csv_path, SECOND_DAY, snapshot_date="2025-01-02")
+    history = SnapshotHistory.load(csv_path)
+    assert history.dates.tolist() == ["2025-01-01", "2025-01-02"]
+    assert skill_counts_at(history, 0) == {"JAVA": 3, "SPRING": 3}
+    assert skill_counts_at(history, 1) == {"JAVA": 2, "PYTHON": 2, "DJANGO": 2}
+
+
+def test_truncated_counts_file_skips_snapshot(csv_path):
+    _, _, counts_path = snapshot_paths_for(csv_path)
+    append_snapshot(csv_path, FIRST_DAY, snapshot_date="2025-01-01")
+    size = os.path.getsize(counts_path)
+    append_snapshot(csv_path, SECOND_DAY, snapshot_date="2025-01-02")
+
+    # 둘째 스냅샷의 개수 데이터가 잘린 경우 (메타데이터는 남아 있음)
+    with open(counts_path, "r+b") as f:
+        f.truncate(size + 8)
+
+    history = SnapshotHistory.load(csv_path)
+    assert history.dates.tolist() == ["2025-01-01"]
+    assert skill_counts_at(history, 0) == {"JAVA": 3, "SPRING": 3}
+
+
+def test_missing_counts_file_is_empty(csv_path):
+    _, _, counts_path = snapshot_paths_for(csv_path)
+    append_snapshot(csv_path, FIRST_DAY, snapshot_date="2025-01-01")
+    os.remove(counts_path)
+
+    history = SnapshotHistory.load(csv_path)
+    assert len(history) == 0
+    assert history.top_movers().empty
+    assert history.history("java")["count"].tolist() == []
+
+
+def test_no_files_is_empty(csv_path):
+    assert len(SnapshotHistory.load(csv_path)) == 0